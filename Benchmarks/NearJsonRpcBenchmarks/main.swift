@@ -0,0 +1,192 @@
+
+import Foundation
+import NearJsonRpcTypes
+#if canImport(Darwin)
+    import Darwin
+#elseif canImport(Glibc)
+    import Glibc
+#endif
+
+// MARK: - Measurement
+
+/// Timings of one fixture, in nanoseconds per iteration
+struct BenchmarkResult {
+    let fixture: String
+    let bytes: Int
+    let decode: [UInt64]
+    let encode: [UInt64]
+    /// Net heap growth while one decoded value is alive, where the platform reports it
+    let heapBytes: Int?
+}
+
+/// Bytes currently allocated from the malloc heap
+func heapBytesInUse() -> Int? {
+    #if canImport(Darwin)
+        var statistics = malloc_statistics_t()
+        malloc_zone_statistics(nil, &statistics)
+        return Int(statistics.size_in_use)
+    #elseif canImport(Glibc)
+        return Int(mallinfo2().uordblks)
+    #else
+        return nil
+    #endif
+}
+
+/// Peak resident set size of the process in bytes
+func peakResidentBytes() -> Int {
+    var usage = rusage()
+    getrusage(RUSAGE_SELF, &usage)
+    #if canImport(Darwin)
+        return Int(usage.ru_maxrss)
+    #else
+        return Int(usage.ru_maxrss) * 1024
+    #endif
+}
+
+func benchmark<T: Codable>(_: T.Type, fixture: String, data: Data, iterations: Int, warmup: Int) throws -> BenchmarkResult {
+    let decoder = JSONDecoder()
+    decoder.keyDecodingStrategy = .convertFromSnakeCase
+    let encoder = JSONEncoder()
+    encoder.keyEncodingStrategy = .convertToSnakeCase
+
+    for _ in 0 ..< warmup {
+        _ = try encoder.encode(decoder.decode(T.self, from: data))
+    }
+    let heapBefore = heapBytesInUse()
+    var value = try decoder.decode(T.self, from: data)
+    let heapAfter = heapBytesInUse()
+
+    var decode: [UInt64] = []
+    var encode: [UInt64] = []
+    decode.reserveCapacity(iterations)
+    encode.reserveCapacity(iterations)
+    for _ in 0 ..< iterations {
+        let start = DispatchTime.now().uptimeNanoseconds
+        value = try decoder.decode(T.self, from: data)
+        let decoded = DispatchTime.now().uptimeNanoseconds
+        let encoded = try encoder.encode(value)
+        let end = DispatchTime.now().uptimeNanoseconds
+        precondition(!encoded.isEmpty)
+        decode.append(decoded - start)
+        encode.append(end - decoded)
+    }
+    withExtendedLifetime(value) {}
+
+    var heapBytes: Int?
+    if let before = heapBefore, let after = heapAfter {
+        heapBytes = after - before
+    }
+    return BenchmarkResult(fixture: fixture, bytes: data.count, decode: decode, encode: encode, heapBytes: heapBytes)
+}
+
+/// The `fraction` percentile of `samples`
+func percentile(_ samples: [UInt64], _ fraction: Double) -> UInt64 {
+    let sorted = samples.sorted()
+    let rank = Int((Double(sorted.count) * fraction).rounded(.up)) - 1
+    return sorted[min(max(rank, 0), sorted.count - 1)]
+}
+
+func milliseconds(_ nanoseconds: UInt64) -> String {
+    String(format: "%.3f", Double(nanoseconds) / 1_000_000)
+}
+
+func column(_ text: String, _ width: Int) -> String {
+    text.count >= width ? text + " " : text.padding(toLength: width, withPad: " ", startingAt: 0)
+}
+
+func report(_ result: BenchmarkResult) {
+    let totalDecode = result.decode.reduce(0, +)
+    let throughput = totalDecode > 0 ? Double(result.bytes * result.decode.count) / Double(totalDecode) * 1000 : 0
+    let columns = [
+        column(result.fixture, 48),
+        column(String(result.bytes / 1024), 10),
+        column(milliseconds(percentile(result.decode, 0.5)), 12),
+        column(milliseconds(percentile(result.decode, 0.99)), 12),
+        column(String(format: "%.1f", throughput), 10),
+        column(milliseconds(percentile(result.encode, 0.5)), 12),
+        column(milliseconds(percentile(result.encode, 0.99)), 12),
+        result.heapBytes.map { String($0 / 1024) } ?? "-",
+    ]
+    print(columns.joined())
+}
+
+// MARK: - Benchmarked types
+
+typealias Benchmark = (String, Data, Int, Int) throws -> BenchmarkResult
+
+/// Result types of the RPC methods and how to benchmark a fixture of each
+let benchmarks: [(type: String, run: Benchmark)] = [
+    ("GenesisConfig", { try benchmark(GenesisConfig.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcBlockResponse", { try benchmark(RpcBlockResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcChunkResponse", { try benchmark(RpcChunkResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcClientConfigResponse", { try benchmark(RpcClientConfigResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcCongestionLevelResponse", { try benchmark(RpcCongestionLevelResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcGasPriceResponse", { try benchmark(RpcGasPriceResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcLightClientBlockProofResponse", { try benchmark(RpcLightClientBlockProofResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcLightClientExecutionProofResponse", { try benchmark(RpcLightClientExecutionProofResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcLightClientNextBlockResponse", { try benchmark(RpcLightClientNextBlockResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcNetworkInfoResponse", { try benchmark(RpcNetworkInfoResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcProtocolConfigResponse", { try benchmark(RpcProtocolConfigResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcQueryResponse", { try benchmark(RpcQueryResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcReceiptResponse", { try benchmark(RpcReceiptResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcSplitStorageInfoResponse", { try benchmark(RpcSplitStorageInfoResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcStateChangesInBlockByTypeResponse", { try benchmark(RpcStateChangesInBlockByTypeResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcStateChangesInBlockResponse", { try benchmark(RpcStateChangesInBlockResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcStatusResponse", { try benchmark(RpcStatusResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcTransactionResponse", { try benchmark(RpcTransactionResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("RpcValidatorResponse", { try benchmark(RpcValidatorResponse.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+    ("ViewStateResult", { try benchmark(ViewStateResult.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }),
+]
+
+// MARK: - Main
+
+var iterations = 100
+var warmup = 5
+var filter: String?
+var arguments = CommandLine.arguments.dropFirst().makeIterator()
+while let argument = arguments.next() {
+    switch argument {
+    case "--iterations":
+        iterations = arguments.next().flatMap { Int($0) } ?? iterations
+    case "--warmup":
+        warmup = arguments.next().flatMap { Int($0) } ?? warmup
+    case "--filter":
+        filter = arguments.next()
+    default:
+        print("usage: NearJsonRpcBenchmarks [--iterations N] [--warmup N] [--filter TEXT]")
+        exit(2)
+    }
+}
+iterations = max(iterations, 1)
+
+let fixtureURLs = (Bundle.module.urls(forResourcesWithExtension: "json", subdirectory: "Fixtures") ?? [])
+    .sorted { $0.lastPathComponent < $1.lastPathComponent }
+
+print("Decoding and encoding each fixture \(iterations) times (\(warmup) warm-up), times in ms")
+let header = [
+    column("Fixture", 48),
+    column("KB", 10),
+    column("decode p50", 12),
+    column("decode p99", 12),
+    column("MB/s", 10),
+    column("encode p50", 12),
+    column("encode p99", 12),
+    "heap KB",
+]
+print(header.joined())
+var failures = 0
+for (type, run) in benchmarks {
+    for url in fixtureURLs {
+        let fixture = url.deletingPathExtension().lastPathComponent
+        guard fixture == type || fixture.hasPrefix(type + "_") else { continue }
+        if let filter, !fixture.contains(filter) { continue }
+        do {
+            try report(run(fixture, Data(contentsOf: url), iterations, warmup))
+        } catch {
+            print(column(fixture, 48) + "failed: \(error)")
+            failures += 1
+        }
+    }
+}
+print("Peak RSS: \(peakResidentBytes() / 1024 / 1024) MB")
+exit(failures == 0 ? 0 : 1)
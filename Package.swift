@@ -31,6 +31,7 @@ let package = Package(
         .testTarget(
             name: "NearJsonRpcTypesTests",
             dependencies: ["NearJsonRpcTypes"],
+            exclude: ["DecodeTimingBaseline.json"],
             resources: [
                 .copy("Mock"),
             ],
@@ -42,5 +43,13 @@ let package = Package(
                 .copy("Mock"),
             ],
         ),
+        .executableTarget(
+            name: "NearJsonRpcBenchmarks",
+            dependencies: ["NearJsonRpcTypes"],
+            path: "Benchmarks/NearJsonRpcBenchmarks",
+            resources: [
+                .copy("Fixtures"),
+            ],
+        ),
     ],
 )
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Benchmark the code generation pipeline itself.
+
+Runs `python3 -m codegen` K times against openapi.json, each run in a fresh
+process with --profile (see profiling.py), and reports the median wall time of
+every phase and of the run, and the median time of the slowest schemas per
+category, so generator optimizations can be checked against the numbers before
+and after.
+
+Usage (from the Scripts directory):
+    python3 -m benchmark_codegen                    # 5 runs of `codegen all`
+    python3 -m benchmark_codegen --runs 9 --cold    # without the caches in .cache/
+    python3 -m benchmark_codegen --memory           # also median peak memory per phase
+    python3 -m benchmark_codegen -- --jobs 4 types  # arguments after -- go to codegen
+
+With --spec-scale, the same runs are repeated against synthetic, scaled
+variants of the spec (see spec_scaler.py), and a last table compares every
+phase's growth with the growth in schemas, so superlinear phases stand out:
+
+    python3 -m benchmark_codegen --runs 3 --spec-scale 2x --spec-scale 10x --spec-scale 50x
+
+Runs happen in a scratch copy of the Scripts directory, so the generated files
+in the repository are left alone; --in-place runs against the repository
+instead. The first run fills the caches the others reuse unless --cold clears
+them before every run. Without --memory allocations aren't traced, so the wall
+times match a normal run's.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from openapi_spec import CACHE_DIR, OPENAPI_PATH, load_openapi
+from profiling import CATEGORIES, TOP_SCHEMAS, format_bytes, slowest
+from spec_scaler import SCALE_PRESETS, default_output_path, write_scaled_spec
+
+DEFAULT_RUNS = 5
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_once(scripts_dir: str, codegen_args: List[str], memory: bool, cold: bool) -> Dict[str, Any]:
+    """Run codegen once in `scripts_dir` and return its profile with the process wall time"""
+    if cold:
+        shutil.rmtree(os.path.join(scripts_dir, CACHE_DIR), ignore_errors=True)
+    fd, profile_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        command = [sys.executable, "-m", "codegen", "--profile-output", profile_path]
+        if not memory:
+            command.append("--no-tracemalloc")
+        started = time.perf_counter()
+        completed = subprocess.run(command + codegen_args, cwd=scripts_dir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        seconds = time.perf_counter() - started
+        if completed.returncode != 0:
+            print(completed.stdout)
+            raise SystemExit(f"❌ codegen exited with {completed.returncode}")
+        with open(profile_path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    finally:
+        os.remove(profile_path)
+    profile["seconds"] = seconds
+    return profile
+
+
+def copy_scripts(destination: str) -> str:
+    """Copy the Scripts directory to `destination` without its caches, so the first run fills them"""
+    # ignore_patterns matches basenames, which CACHE_DIR ("./.cache") itself never is
+    shutil.copytree(SCRIPTS_DIR, destination, ignore=shutil.ignore_patterns(os.path.basename(CACHE_DIR), "__pycache__"))
+    assert not os.path.exists(os.path.join(destination, CACHE_DIR)), f"{destination} was copied with its caches"
+    return destination
+
+
+def medians(profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of every phase time, peak and schema time over the runs"""
+    phase_names: List[str] = []
+    for profile in profiles:
+        phase_names.extend(p["name"] for p in profile["phases"] if p["name"] not in phase_names)
+
+    def phase_values(name: str, key: str) -> List[float]:
+        return [p[key] for profile in profiles for p in profile["phases"] if p["name"] == name and p[key] is not None]
+
+    phases = {}
+    for name in phase_names:
+        seconds = phase_values(name, "seconds")
+        peaks = phase_values(name, "peak_bytes")
+        phases[name] = {
+            "median": statistics.median(seconds),
+            "min": min(seconds),
+            "max": max(seconds),
+            "peak_bytes": statistics.median(peaks) if peaks else None,
+        }
+    schemas = {}
+    for category in CATEGORIES:
+        names = {name for profile in profiles for name in profile["schemas"].get(category, {})}
+        schemas[category] = {
+            name: statistics.median(profile["schemas"].get(category, {}).get(name, 0.0) for profile in profiles)
+            for name in names
+        }
+    runs = [profile["seconds"] for profile in profiles]
+    return {"phases": phases, "schemas": schemas, "run": {"median": statistics.median(runs), "min": min(runs), "max": max(runs)}}
+
+
+def format_report(result: Dict[str, Any], runs: int, top: int = TOP_SCHEMAS) -> str:
+    lines = [f"⏱️  Median of {runs} runs (min – max):"]
+    for name, phase in result["phases"].items():
+        line = f"   {name:<12} {phase['median']:8.2f}s  ({phase['min']:.2f} – {phase['max']:.2f})"
+        if phase["peak_bytes"] is not None:
+            line += f"   peak {format_bytes(phase['peak_bytes'])}"
+        lines.append(line)
+    run = result["run"]
+    lines.append(f"   {'process':<12} {run['median']:8.2f}s  ({run['min']:.2f} – {run['max']:.2f})")
+    for category, times in result["schemas"].items():
+        if not times:
+            continue
+        lines.append(f"   Slowest schemas ({category}, median {sum(times.values()):.2f}s in total):")
+        for schema_name, seconds in slowest(times, top):
+            lines.append(f"      {seconds * 1000:9.1f} ms  {schema_name}")
+    return "\n".join(lines)
+
+
+def format_scaling(results: Dict[str, Dict[str, Any]], schema_counts: Dict[str, int]) -> str:
+    """Median phase times per spec, with each phase's growth over the first spec
+    divided by the growth in schemas: about 1 is linear, growing values are superlinear"""
+    labels = list(results)
+    base = labels[0]
+    width = 20
+    lines = [
+        "📈 Scaling: median seconds (time growth ÷ schema growth over the first spec)",
+        f"   {'phase':<12}" + "".join(f"{f'{label} ({schema_counts[label]})':>{width}}" for label in labels),
+    ]
+    rows = list(results[base]["phases"]) + ["process"]
+    for row in rows:
+        cells = []
+        for label in labels:
+            result = results[label]
+            entry = result["run"] if row == "process" else result["phases"].get(row)
+            base_entry = results[base]["run"] if row == "process" else results[base]["phases"].get(row)
+            if entry is None:
+                cells.append(f"{'-':>{width}}")
+                continue
+            cell = f"{entry['median']:.2f}s"
+            if label != base and base_entry and base_entry["median"] > 0:
+                growth = entry["median"] / base_entry["median"] / (schema_counts[label] / schema_counts[base])
+                cell += f" ({growth:.2f})"
+            cells.append(f"{cell:>{width}}")
+        lines.append(f"   {row:<12}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmark_codegen",
+        description="Run the code generation pipeline repeatedly and report median timings",
+    )
+    parser.add_argument("--runs", "-k", type=int, default=DEFAULT_RUNS, metavar="K", help=f"number of runs (default: {DEFAULT_RUNS})")
+    parser.add_argument("--cold", action="store_true", help=f"clear {CACHE_DIR} before every run")
+    parser.add_argument("--memory", action="store_true", help="trace allocations for peak memory per phase (slows the runs down)")
+    parser.add_argument("--in-place", action="store_true", help="run against the repository instead of a scratch copy")
+    parser.add_argument("--output", metavar="FILE", help="also write the medians to FILE as JSON")
+    parser.add_argument(
+        "--spec-scale",
+        action="append",
+        choices=SCALE_PRESETS,
+        default=[],
+        help="also benchmark a scaled variant of the spec (see spec_scaler.py), repeatable",
+    )
+    parser.add_argument("codegen_args", nargs=argparse.REMAINDER, help="arguments for codegen after -- (default: all)")
+    args = parser.parse_args(argv)
+    if args.codegen_args[:1] == ["--"]:
+        args.codegen_args = args.codegen_args[1:]
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    return args
+
+
+def benchmark(scripts_dir: str, codegen_args: List[str], args: argparse.Namespace) -> Dict[str, Any]:
+    """Medians of `args.runs` runs of codegen with `codegen_args`"""
+    print(f"🏁 Running `codegen {' '.join(codegen_args)}` {args.runs} times in {scripts_dir}")
+    profiles = []
+    for index in range(args.runs):
+        profile = run_once(scripts_dir, codegen_args, args.memory, args.cold)
+        print(f"   run {index + 1}: {profile['seconds']:.2f}s")
+        profiles.append(profile)
+    result = medians(profiles)
+    print()
+    print(format_report(result, args.runs))
+    print()
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    codegen_args = args.codegen_args or ["all"]
+    scratch = None
+    scripts_dir = SCRIPTS_DIR
+    if not args.in_place:
+        # Generators write to ../Sources, ../Tests and ../Benchmarks relative to Scripts
+        scratch = tempfile.mkdtemp(prefix="codegen-benchmark-")
+        scripts_dir = copy_scripts(os.path.join(scratch, "Scripts"))
+    results: Dict[str, Dict[str, Any]] = {}
+    schema_counts: Dict[str, int] = {}
+    try:
+        results["1x"] = benchmark(scripts_dir, codegen_args, args)
+        schema_counts["1x"] = len(load_openapi(os.path.join(scripts_dir, OPENAPI_PATH))["components"]["schemas"])
+        for name in args.spec_scale:
+            spec_path = default_output_path(name)
+            scaled = write_scaled_spec(SCALE_PRESETS[name], os.path.join(scripts_dir, spec_path), os.path.join(scripts_dir, OPENAPI_PATH))
+            schema_counts[name] = len(scaled["components"]["schemas"])
+            results[name] = benchmark(scripts_dir, ["--openapi", spec_path] + codegen_args, args)
+    finally:
+        if scratch is not None:
+            shutil.rmtree(scratch, ignore_errors=True)
+    if len(results) > 1:
+        print(format_scaling(results, schema_counts))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results if len(results) > 1 else results["1x"], f, indent=2, sort_keys=True)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Single-process driver for the code generation pipeline.
+
+Loads openapi.json once and runs the types, mocks, tests and benchmarks phases
+against the same in-memory `Spec`, so the document is parsed a single time per run.
+
+Usage (from the Scripts directory):
+    python3 -m codegen all              # types, mocks, tests and benchmarks
+    python3 -m codegen types            # Types.swift and Methods.swift only
+    python3 -m codegen mocks            # mock JSON files only
+    python3 -m codegen tests            # Swift test files only
+    python3 -m codegen benchmarks       # Swift benchmark executable only
+    python3 -m codegen fixtures huge    # large benchmark fixtures (not part of `all`)
+
+The parsed spec is cached in .cache/ (see openapi_spec.py); pass --no-cache to
+bypass it. With --incremental, the types phase also keeps a manifest of the
+Swift emitted per schema in .cache/ (see fragment_cache.py) and only
+regenerates schemas whose content or dependencies changed since the last run.
+With --jobs N, schema emission in the types phase and sampling in the mocks
+phase are spread over N worker processes; the output is identical to a serial
+run. With --shards domain (or --shards N), component types are split from
+Types.swift into Types+<Shard>.swift files by RPC method family (or into N
+stable hash buckets). Mocks are generated from --seed (default 0), so the same
+seed always gives byte-identical mocks. --mock-format picks how they are
+written (see mock_bundle.py): indented JSON files (the default), minified JSON
+files, or a single minified ndjson or binary bundle per test target that the
+generated tests read their fixtures from. The fixtures command writes samples
+of a size class (see size_classes.py) for the decode benchmarks. --profile
+reports the wall time and peak memory of each phase and the slowest schemas
+(see profiling.py); benchmark_codegen.py runs the pipeline repeatedly and
+reports the medians.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+import generate_benchmarks
+import generate_mock
+import generate_tests
+import generate_types
+from fragment_cache import FragmentCache
+from mock_bundle import MOCK_FORMATS, PRETTY_FORMAT
+from openapi_spec import CACHE_DIR, OPENAPI_PATH, load_spec
+import outputs
+from profiling import profiler
+from size_classes import HUGE, SIZE_CLASSES, SMALL, SizeClass
+from type_shards import DOMAIN_MODE, ShardMode, parse_shard_mode
+
+PHASES = ("types", "mocks", "tests", "benchmarks")
+
+
+def run(
+    phases: List[str],
+    openapi_path: str = OPENAPI_PATH,
+    use_cache: bool = True,
+    incremental: bool = False,
+    jobs: int = 1,
+    shard_mode: Optional[ShardMode] = None,
+    seed: int = generate_mock.DEFAULT_SEED,
+    mock_format: str = PRETTY_FORMAT,
+    size_class: SizeClass = SMALL,
+) -> None:
+    """Run the given phases in pipeline order against a single parsed spec"""
+    print(f"Loading OpenAPI specification from {openapi_path}...")
+    profiler.reset()
+    with profiler.phase("spec"):
+        spec = load_spec(openapi_path, use_cache=use_cache)
+    print(f"Found {len(spec.schemas)} schemas and {len(spec.paths)} paths")
+    print()
+
+    outputs.stats.reset()
+    mock_files: Optional[List[str]] = None
+    if "types" in phases:
+        print("📝 Generating Swift types and methods...")
+        with profiler.phase("types"):
+            fragments = FragmentCache.load() if use_cache and incremental else None
+            generate_types.main(spec, fragments, jobs=jobs, shard_mode=shard_mode)
+        print()
+    if "mocks" in phases:
+        print("📝 Generating mock JSON data...")
+        with profiler.phase("mocks"):
+            mock_files = generate_mock.main(spec, use_cache=use_cache, seed=seed, jobs=jobs, mock_format=mock_format)
+        print()
+    if "tests" in phases:
+        print("📝 Generating test files...")
+        with profiler.phase("tests"):
+            # Without the mocks phase, the tests follow whatever layout is on disk
+            generate_tests.main(spec, mock_files, mock_format if "mocks" in phases else None)
+        print()
+    if "benchmarks" in phases:
+        print("📝 Generating benchmarks...")
+        with profiler.phase("benchmarks"):
+            generate_benchmarks.main(spec, mock_files)
+        print()
+    if "fixtures" in phases:
+        print(f"📝 Generating {size_class.name} benchmark fixtures...")
+        with profiler.phase("fixtures"):
+            generate_mock.generate_fixtures(size_class, spec=spec, use_cache=use_cache, seed=seed)
+        print()
+    outputs.save_manifest()
+    print(outputs.stats.summary())
+    if profiler.enabled:
+        print(profiler.summary())
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def shard_mode(value: str) -> ShardMode:
+    try:
+        return parse_shard_mode(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m codegen",
+        description="Generate Swift types, mocks and tests from the NEAR OpenAPI specification",
+    )
+    parser.add_argument("--openapi", default=OPENAPI_PATH, help=f"path to the OpenAPI document (default: {OPENAPI_PATH})")
+    parser.add_argument("--no-cache", action="store_true", help=f"ignore and don't update the parsed spec cache in {CACHE_DIR}")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only regenerate the Swift types whose schemas or dependencies changed since the last incremental run",
+    )
+    parser.add_argument("--jobs", "-j", type=positive_int, default=1, metavar="N", help="number of worker processes (default: 1)")
+    parser.add_argument(
+        "--shards",
+        type=shard_mode,
+        metavar="MODE",
+        help=f"split component types into Types+<Shard>.swift files: '{DOMAIN_MODE}' groups them by RPC method family, N spreads them over N files",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=generate_mock.DEFAULT_SEED,
+        help=f"seed for the values in generated mocks (default: {generate_mock.DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--mock-format",
+        choices=MOCK_FORMATS,
+        default=PRETTY_FORMAT,
+        help=f"how mocks are written: one (indented or minified) JSON file each, or one indexed bundle per test target (default: {PRETTY_FORMAT})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report wall time and peak memory per phase and the slowest schemas (see profiling.py)",
+    )
+    parser.add_argument("--profile-dir", metavar="DIR", help="with --profile, also dump cProfile stats of each phase to DIR/<phase>.prof")
+    parser.add_argument("--profile-output", metavar="FILE", help="with --profile, also write the profile to FILE as JSON")
+    parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="with --profile, don't trace allocations (no peak memory, but undistorted wall times)",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.add_parser("all", help="run the types, mocks, tests and benchmarks phases")
+    subparsers.add_parser("types", help="generate Types.swift and Methods.swift")
+    subparsers.add_parser("mocks", help="generate mock JSON files")
+    subparsers.add_parser("tests", help="generate Swift test files")
+    subparsers.add_parser("benchmarks", help="generate the Swift decode/encode benchmark executable")
+    fixtures = subparsers.add_parser("fixtures", help="generate large fixtures for the decode benchmarks")
+    fixtures.add_argument("size_class", nargs="?", choices=SIZE_CLASSES, default=HUGE.name, help=f"size class of the fixtures (default: {HUGE.name})")
+    args = parser.parse_args(argv)
+    if args.command is None:
+        args.command = "all"
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    phases = list(PHASES) if args.command == "all" else [args.command]
+    size_class = SIZE_CLASSES[args.size_class] if args.command == "fixtures" else SMALL
+    if args.profile or args.profile_dir or args.profile_output:
+        profiler.enable(memory=not args.no_tracemalloc, dump_dir=args.profile_dir)
+    run(
+        phases,
+        args.openapi,
+        use_cache=not args.no_cache,
+        incremental=args.incremental,
+        jobs=args.jobs,
+        shard_mode=args.shards,
+        seed=args.seed,
+        mock_format=args.mock_format,
+        size_class=size_class,
+    )
+    if args.profile_output:
+        profiler.save(args.profile_output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""Where the decode timing harness and its baseline live.
+
+generate_tests.py writes the harness, which records median decode times when
+TIMING_OUTPUT_ENV is set; perf_gate.py compares such a run with TIMING_BASELINE.
+"""
+
+TIMING_TEST_OUTPUT = "../Tests/NearJsonRpcTypesTests/DecodeTimingTests.swift"
+# Checked-in decode timings the timing harness is compared against
+TIMING_BASELINE = "../Tests/NearJsonRpcTypesTests/DecodeTimingBaseline.json"
+# Environment variables of the timing harness
+TIMING_OUTPUT_ENV = "NEAR_TIMING_OUTPUT"
+TIMING_ITERATIONS_ENV = "NEAR_TIMING_ITERATIONS"
+TIMING_DEFAULT_ITERATIONS = 200
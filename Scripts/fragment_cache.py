@@ -0,0 +1,240 @@
+"""Per-schema fragment cache for incremental regeneration of Types.swift.
+
+The manifest in CACHE_DIR records, for every component schema, the hash of its
+own content, the hashes of every schema it transitively references, and the
+Swift fragment emitted for it. On the next run a schema whose hashes all match
+is not regenerated; its cached fragment is spliced in instead. Fragments
+emitted speculatively by worker processes (`--jobs`) are accepted through the
+same path as candidates.
+
+Emitting a schema also reads and writes a few run-wide registries (type names
+already taken, inline structs already generated). Those registries are wrapped
+in `TrackedSet`/`TrackedDict` while a schema is emitted so the fragment can
+record what it observed and what it added. A cached fragment is only reused if
+every registry entry it read still has the same value, and reusing it replays
+its writes, so an incremental run produces exactly the output of a full one.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openapi_spec import CACHE_DIR, generator_version
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "types-manifest.json")
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Modules whose code shapes the emitted fragments; editing any of them discards the manifest
+_MANIFEST_SOURCES = ("generate_types.py", "spec_ir.py", "ref_graph.py", "fragment_cache.py")
+
+
+class Recorder:
+    """Registry reads and writes made while a single schema is being emitted"""
+
+    __slots__ = ("active", "reads", "writes")
+
+    def __init__(self):
+        self.active = False
+        self.reads: Dict[Tuple[str, str], Any] = {}
+        self.writes: List[List[Any]] = []
+
+    def start(self) -> None:
+        self.active = True
+        self.reads = {}
+        self.writes = []
+
+    def stop(self) -> Tuple[List[List[Any]], List[List[Any]]]:
+        self.active = False
+        reads = [[registry, key, value] for (registry, key), value in self.reads.items()]
+        return reads, self.writes
+
+    def read(self, registry: str, key: str, value: Any) -> None:
+        # Only the first observation matters: later reads of the same key see
+        # either that value or one this schema wrote itself
+        if self.active:
+            self.reads.setdefault((registry, key), value)
+
+    def write(self, registry: str, key: str, value: Any) -> None:
+        if self.active:
+            self.reads.setdefault((registry, key), _UNSET)
+            self.writes.append([registry, key, value])
+
+
+# Marks a key written before it was read; never compared on reuse
+_UNSET = object()
+
+
+class TrackedSet(set):
+    """Set of strings whose membership tests and additions are recorded"""
+
+    __slots__ = ("name", "recorder")
+
+    def __init__(self, name: str, recorder: Recorder, items=()):
+        super().__init__(items)
+        self.name = name
+        self.recorder = recorder
+
+    def __contains__(self, key) -> bool:
+        present = set.__contains__(self, key)
+        self.recorder.read(self.name, key, present)
+        return present
+
+    def add(self, key) -> None:
+        set.add(self, key)
+        self.recorder.write(self.name, key, True)
+
+    def peek(self, key: str) -> Any:
+        return set.__contains__(self, key)
+
+    def replay(self, key: str, value: Any) -> None:
+        set.add(self, key)
+
+
+class TrackedDict(dict):
+    """String-keyed dict whose lookups and assignments are recorded"""
+
+    __slots__ = ("name", "recorder")
+
+    def __init__(self, name: str, recorder: Recorder):
+        super().__init__()
+        self.name = name
+        self.recorder = recorder
+
+    def __contains__(self, key) -> bool:
+        self.recorder.read(self.name, key, dict.get(self, key))
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key):
+        self.recorder.read(self.name, key, dict.get(self, key))
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        self.recorder.read(self.name, key, dict.get(self, key))
+        return dict.get(self, key, default)
+
+    def __setitem__(self, key, value) -> None:
+        dict.__setitem__(self, key, value)
+        self.recorder.write(self.name, key, value)
+
+    def peek(self, key: str) -> Any:
+        return dict.get(self, key)
+
+    def replay(self, key: str, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+
+
+class FragmentCache:
+    """Manifest of emitted Swift fragments keyed by component schema name.
+
+    With `path=None` the cache lives in memory only and is never saved.
+    """
+
+    __slots__ = ("path", "version", "previous", "candidates", "fragments", "recorder", "registries", "reused", "merged", "emitted")
+
+    def __init__(self, path: Optional[str] = MANIFEST_PATH):
+        self.path = path
+        self.version = manifest_version()
+        self.previous: Dict[str, Any] = {}
+        self.candidates: Dict[str, Any] = {}
+        self.fragments: Dict[str, Any] = {}
+        self.recorder = Recorder()
+        self.registries: Dict[str, Any] = {}
+        self.reused = 0
+        self.merged = 0
+        self.emitted = 0
+
+    @classmethod
+    def load(cls, path: str = MANIFEST_PATH) -> "FragmentCache":
+        """Read the manifest at `path`, starting empty if it is missing, unreadable or stale"""
+        cache = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return cache
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable types manifest {path}: {e}")
+            return cache
+        if manifest.get("version") == cache.version:
+            cache.previous = manifest.get("fragments", {})
+        return cache
+
+    def track_set(self, name: str, items=()) -> TrackedSet:
+        registry = TrackedSet(name, self.recorder, items)
+        self.registries[name] = registry
+        return registry
+
+    def track_dict(self, name: str) -> TrackedDict:
+        registry = TrackedDict(name, self.recorder)
+        self.registries[name] = registry
+        return registry
+
+    def is_cached(self, name: str, schema_hash: str, dependencies: Dict[str, str]) -> bool:
+        """Whether the manifest has a fragment for this exact schema content and dependencies"""
+        return self._matches(self.previous.get(name), schema_hash, dependencies)
+
+    def add_candidates(self, fragments: Dict[str, Any]) -> None:
+        """Offer fragments emitted elsewhere; each is still validated when its schema is emitted"""
+        self.candidates.update(fragments)
+
+    def emit(self, name: str, schema_hash: str, dependencies: Dict[str, str], generate: Callable[[], str]) -> str:
+        """Return the fragment for schema `name`, reusing a cached or candidate one when still valid"""
+        entry = self.candidates.get(name)
+        if self._matches(entry, schema_hash, dependencies) and self._still_valid(entry):
+            self.merged += 1
+            return self._replay(name, entry)
+        entry = self.previous.get(name)
+        if self._matches(entry, schema_hash, dependencies) and self._still_valid(entry):
+            self.reused += 1
+            return self._replay(name, entry)
+
+        self.recorder.start()
+        try:
+            code = generate()
+        finally:
+            reads, writes = self.recorder.stop()
+        self.fragments[name] = {
+            "hash": schema_hash,
+            "dependencies": dependencies,
+            "code": code,
+            "reads": [read for read in reads if read[2] is not _UNSET],
+            "writes": writes,
+        }
+        self.emitted += 1
+        return code
+
+    @staticmethod
+    def _matches(entry: Optional[Dict[str, Any]], schema_hash: str, dependencies: Dict[str, str]) -> bool:
+        return entry is not None and entry["hash"] == schema_hash and entry["dependencies"] == dependencies
+
+    def _replay(self, name: str, entry: Dict[str, Any]) -> str:
+        for registry, key, value in entry["writes"]:
+            self.registries[registry].replay(key, value)
+        self.fragments[name] = entry
+        return entry["code"]
+
+    def _still_valid(self, entry: Dict[str, Any]) -> bool:
+        for registry, key, value in entry["reads"]:
+            if self.registries[registry].peek(key) != value:
+                return False
+        return True
+
+    def save(self) -> None:
+        """Write the fragments of this run back, dropping schemas no longer in the spec"""
+        if self.path is None:
+            return
+        if self.reused == len(self.fragments) == len(self.previous):
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            # json.dumps uses the C encoder; json.dump would encode chunk by chunk in Python
+            f.write(json.dumps({"version": self.version, "fragments": self.fragments}))
+        os.replace(tmp_path, self.path)
+
+
+def manifest_version() -> str:
+    """Short hash of MANIFEST_VERSION and the sources that shape the fragments"""
+    return generator_version(_MANIFEST_SOURCES, MANIFEST_VERSION)
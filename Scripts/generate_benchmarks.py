@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Generate the Swift decode/encode benchmark executable.
+
+For every result type of the RPC methods (and every schema with size-class
+fixtures), the benchmark decodes and re-encodes each of the type's fixtures N
+times and reports per-fixture p50/p99 latency, decode throughput and the heap
+a decoded value holds on to. Fixtures are the
+type's mocks (copied from the mock directory, in whatever format they were
+written) and any size-class fixtures from `python3 -m codegen fixtures`; the
+benchmark discovers them at run time, so new fixtures only need a rebuild.
+
+Run with: swift run -c release NearJsonRpcBenchmarks [--iterations N] [--warmup N] [--filter TEXT]
+"""
+
+import os
+import re
+from typing import Dict, List, Optional
+
+from generate_mock import FIXTURES_DIR
+from generate_tests import MOCK_DIR_TYPES, detect_mock_format, is_decode_timed, list_mock_files, result_types, type_mocks
+from mock_bundle import BUNDLE_FILENAMES, mock_name, read_bundle
+from openapi_spec import Spec, load_spec
+import outputs
+from outputs import remove_file, write_file
+from size_classes import BENCHMARK_SCHEMAS, SIZE_CLASSES
+from spec_ir import SpecIR
+
+BENCHMARK_OUTPUT = "../Benchmarks/NearJsonRpcBenchmarks/main.swift"
+
+# Size-class fixtures are generated on demand and never removed here
+_SIZE_CLASS_FIXTURE = re.compile(rf"_({'|'.join(SIZE_CLASSES)})\.json$")
+
+
+def benchmark_types(ir: SpecIR) -> List[str]:
+    """Swift names of the component result types of the RPC methods and of the
+    schemas with size-class fixtures, sorted"""
+    names = set(result_types(ir))
+    names.update(
+        ir.schemas[name].swift_name for name in BENCHMARK_SCHEMAS
+        if name in ir.schemas and is_decode_timed(ir.schemas[name])
+    )
+    return sorted(names)
+
+
+def read_mocks(filenames: List[str]) -> Dict[str, bytes]:
+    """Exact bytes of the given mocks, from the mock files or the mock bundle"""
+    bundle_filename = BUNDLE_FILENAMES.get(detect_mock_format())
+    if bundle_filename:
+        bundle = read_bundle(os.path.join(MOCK_DIR_TYPES, bundle_filename))
+        return {f: bundle[mock_name(f)] for f in filenames if mock_name(f) in bundle}
+    mocks = {}
+    for filename in filenames:
+        path = os.path.join(MOCK_DIR_TYPES, filename)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                mocks[filename] = f.read()
+    return mocks
+
+
+def copy_fixtures(type_names: List[str], mock_files: List[str]) -> int:
+    """Copy the benchmarked types' mocks into the fixtures directory and remove
+    earlier copies that are no longer produced. Returns the number of fixtures"""
+    filenames = [f for type_name in type_names for f in type_mocks(type_name, mock_files)]
+    mocks = read_mocks(filenames)
+    for filename, content in mocks.items():
+        write_file(os.path.join(FIXTURES_DIR, filename), content)
+    if os.path.isdir(FIXTURES_DIR):
+        for filename in os.listdir(FIXTURES_DIR):
+            if filename.endswith(".json") and filename not in mocks and not _SIZE_CLASS_FIXTURE.search(filename):
+                remove_file(os.path.join(FIXTURES_DIR, filename))
+    return len(mocks)
+
+
+def generate_benchmarks(type_names: List[str]) -> str:
+    """Generate main.swift of the benchmark executable"""
+    code = '''
+import Foundation
+import NearJsonRpcTypes
+#if canImport(Darwin)
+    import Darwin
+#elseif canImport(Glibc)
+    import Glibc
+#endif
+
+// MARK: - Measurement
+
+/// Timings of one fixture, in nanoseconds per iteration
+struct BenchmarkResult {
+    let fixture: String
+    let bytes: Int
+    let decode: [UInt64]
+    let encode: [UInt64]
+    /// Net heap growth while one decoded value is alive, where the platform reports it
+    let heapBytes: Int?
+}
+
+/// Bytes currently allocated from the malloc heap
+func heapBytesInUse() -> Int? {
+    #if canImport(Darwin)
+        var statistics = malloc_statistics_t()
+        malloc_zone_statistics(nil, &statistics)
+        return Int(statistics.size_in_use)
+    #elseif canImport(Glibc)
+        return Int(mallinfo2().uordblks)
+    #else
+        return nil
+    #endif
+}
+
+/// Peak resident set size of the process in bytes
+func peakResidentBytes() -> Int {
+    var usage = rusage()
+    getrusage(RUSAGE_SELF, &usage)
+    #if canImport(Darwin)
+        return Int(usage.ru_maxrss)
+    #else
+        return Int(usage.ru_maxrss) * 1024
+    #endif
+}
+
+func benchmark<T: Codable>(_: T.Type, fixture: String, data: Data, iterations: Int, warmup: Int) throws -> BenchmarkResult {
+    let decoder = JSONDecoder()
+    decoder.keyDecodingStrategy = .convertFromSnakeCase
+    let encoder = JSONEncoder()
+    encoder.keyEncodingStrategy = .convertToSnakeCase
+
+    for _ in 0 ..< warmup {
+        _ = try encoder.encode(decoder.decode(T.self, from: data))
+    }
+    let heapBefore = heapBytesInUse()
+    var value = try decoder.decode(T.self, from: data)
+    let heapAfter = heapBytesInUse()
+
+    var decode: [UInt64] = []
+    var encode: [UInt64] = []
+    decode.reserveCapacity(iterations)
+    encode.reserveCapacity(iterations)
+    for _ in 0 ..< iterations {
+        let start = DispatchTime.now().uptimeNanoseconds
+        value = try decoder.decode(T.self, from: data)
+        let decoded = DispatchTime.now().uptimeNanoseconds
+        let encoded = try encoder.encode(value)
+        let end = DispatchTime.now().uptimeNanoseconds
+        precondition(!encoded.isEmpty)
+        decode.append(decoded - start)
+        encode.append(end - decoded)
+    }
+    withExtendedLifetime(value) {}
+
+    var heapBytes: Int?
+    if let before = heapBefore, let after = heapAfter {
+        heapBytes = after - before
+    }
+    return BenchmarkResult(fixture: fixture, bytes: data.count, decode: decode, encode: encode, heapBytes: heapBytes)
+}
+
+/// The `fraction` percentile of `samples`
+func percentile(_ samples: [UInt64], _ fraction: Double) -> UInt64 {
+    let sorted = samples.sorted()
+    let rank = Int((Double(sorted.count) * fraction).rounded(.up)) - 1
+    return sorted[min(max(rank, 0), sorted.count - 1)]
+}
+
+func milliseconds(_ nanoseconds: UInt64) -> String {
+    String(format: "%.3f", Double(nanoseconds) / 1_000_000)
+}
+
+func column(_ text: String, _ width: Int) -> String {
+    text.count >= width ? text + " " : text.padding(toLength: width, withPad: " ", startingAt: 0)
+}
+
+func report(_ result: BenchmarkResult) {
+    let totalDecode = result.decode.reduce(0, +)
+    let throughput = totalDecode > 0 ? Double(result.bytes * result.decode.count) / Double(totalDecode) * 1000 : 0
+    let columns = [
+        column(result.fixture, 48),
+        column(String(result.bytes / 1024), 10),
+        column(milliseconds(percentile(result.decode, 0.5)), 12),
+        column(milliseconds(percentile(result.decode, 0.99)), 12),
+        column(String(format: "%.1f", throughput), 10),
+        column(milliseconds(percentile(result.encode, 0.5)), 12),
+        column(milliseconds(percentile(result.encode, 0.99)), 12),
+        result.heapBytes.map { String($0 / 1024) } ?? "-",
+    ]
+    print(columns.joined())
+}
+
+// MARK: - Benchmarked types
+
+typealias Benchmark = (String, Data, Int, Int) throws -> BenchmarkResult
+
+/// Result types of the RPC methods and how to benchmark a fixture of each
+let benchmarks: [(type: String, run: Benchmark)] = [
+'''
+    for type_name in type_names:
+        code += f'''    ("{type_name}", {{ try benchmark({type_name}.self, fixture: $0, data: $1, iterations: $2, warmup: $3) }}),
+'''
+    code += ''']
+
+// MARK: - Main
+
+var iterations = 100
+var warmup = 5
+var filter: String?
+var arguments = CommandLine.arguments.dropFirst().makeIterator()
+while let argument = arguments.next() {
+    switch argument {
+    case "--iterations":
+        iterations = arguments.next().flatMap { Int($0) } ?? iterations
+    case "--warmup":
+        warmup = arguments.next().flatMap { Int($0) } ?? warmup
+    case "--filter":
+        filter = arguments.next()
+    default:
+        print("usage: NearJsonRpcBenchmarks [--iterations N] [--warmup N] [--filter TEXT]")
+        exit(2)
+    }
+}
+iterations = max(iterations, 1)
+
+let fixtureURLs = (Bundle.module.urls(forResourcesWithExtension: "json", subdirectory: "Fixtures") ?? [])
+    .sorted { $0.lastPathComponent < $1.lastPathComponent }
+
+print("Decoding and encoding each fixture \\(iterations) times (\\(warmup) warm-up), times in ms")
+let header = [
+    column("Fixture", 48),
+    column("KB", 10),
+    column("decode p50", 12),
+    column("decode p99", 12),
+    column("MB/s", 10),
+    column("encode p50", 12),
+    column("encode p99", 12),
+    "heap KB",
+]
+print(header.joined())
+var failures = 0
+for (type, run) in benchmarks {
+    for url in fixtureURLs {
+        let fixture = url.deletingPathExtension().lastPathComponent
+        guard fixture == type || fixture.hasPrefix(type + "_") else { continue }
+        if let filter, !fixture.contains(filter) { continue }
+        do {
+            try report(run(fixture, Data(contentsOf: url), iterations, warmup))
+        } catch {
+            print(column(fixture, 48) + "failed: \\(error)")
+            failures += 1
+        }
+    }
+}
+print("Peak RSS: \\(peakResidentBytes() / 1024 / 1024) MB")
+exit(failures == 0 ? 0 : 1)
+'''
+    return code
+
+
+def main(spec: Optional[Spec] = None, mock_files: Optional[List[str]] = None):
+    if spec is None:
+        print("🔄 Loading OpenAPI specification...")
+        spec = load_spec()
+    ir = spec.ir
+
+    type_names = benchmark_types(ir)
+    print(f"📋 Benchmarking {len(type_names)} result types")
+
+    fixture_count = copy_fixtures(type_names, list_mock_files(mock_files))
+    print(f"   ✅ {fixture_count} mock fixtures in {FIXTURES_DIR}")
+
+    write_file(BENCHMARK_OUTPUT, generate_benchmarks(type_names))
+    print(f"   ✅ {BENCHMARK_OUTPUT}")
+    print()
+    print("📋 Run: swift run -c release NearJsonRpcBenchmarks")
+
+
+if __name__ == "__main__":
+    main()
+    outputs.save_manifest()
+    print(outputs.stats.summary())
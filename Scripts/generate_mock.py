@@ -1,437 +1,645 @@
+import argparse
+import base64
+import hashlib
 import json
 import os
 import random
-from typing import Any, Dict, List, Optional, Set, Tuple
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import jsonschema
+from referencing import Registry
+from referencing.jsonschema import DRAFT202012
+
+from mock_bundle import BUNDLE_FILENAMES, MOCK_FORMATS, PRETTY_FORMAT, encode_bundle, is_minified
+from openapi_spec import CACHE_DIR, Spec, load_spec
+import outputs
+from outputs import remove_file, write_file
+from profiling import SAMPLE, VALIDATE, call_with_schema_times, profiler
+from ref_graph import RefGraph
+from sample_cache import SUBTREE_SEEDS, SampleCache
+from size_classes import BENCHMARK_SCHEMAS, SIZE_CLASSES, SMALL, SizeClass
+from spec_ir import Property, SchemaNode, SpecIR
+from validator_compiler import CompiledValidators, load_compiled_validators
 
-OPENAPI_PATH = "./openapi.json"
 TARGET_DIRECTORIES = [
     ("Types tests", "../Tests/NearJsonRpcTypesTests/Mock"),
     ("Client tests", "../Tests/NearJsonRpcClientTests/Mock")
 ]
-MAX_ATTEMPTS = 5
-
-def to_swift_type_name(name: str) -> str:
-    """Convert schema name to Swift type name (PascalCase)"""
-    if not name:
-        return name
-    
-    # Handle names with underscores - preserve existing casing of each part
-    if "_" in name:
-        parts = name.split("_")
-        # Capitalize any lowercase parts (which are likely connecting words)
-        processed_parts = []
-        for part in parts:
-            if part.islower():
-                processed_parts.append(part.capitalize())
-            else:
-                processed_parts.append(part)
-        return "".join(processed_parts)
-    
-    # Handle camelCase to PascalCase
-    if name and name[0].islower():
-        return name[0].upper() + name[1:]
-    
-    # Already PascalCase or simple name
-    return name
 
-# --- Load OpenAPI ---
-def load_openapi() -> Dict[str, Any]:
-    if not os.path.exists(OPENAPI_PATH):
-        raise FileNotFoundError(f"{OPENAPI_PATH} not found")
-    with open(OPENAPI_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+# Values in the formats NEAR uses for string schemas the spec leaves unconstrained
+NEAR_STRING_SAMPLES = {
+    "AccountId": "alice.near",
+    "CryptoHash": "11111111111111111111111111111111",  # base58 of 32 zero bytes
+    "PublicKey": "ed25519:11111111111111111111111111111111",
+    "Signature": "ed25519:" + "1" * 64,
+    "NearToken": "1000000000000000000000000",  # yoctoNEAR as a decimal string
+}
+# Tried in order for a `pattern` the NEAR samples don't match
+PATTERN_CANDIDATES = ("0", "s", "key_a", "a-b_c.d", "S", "")
+# Seed mocks are generated with unless one is given, so output is stable by default
+DEFAULT_SEED = 0
+# Where size-class fixtures for the decode benchmarks are written
+FIXTURES_DIR = "../Benchmarks/NearJsonRpcBenchmarks/Fixtures"
+
+# URI the converted OpenAPI document is registered under for $ref resolution
+OPENAPI_URI = "urn:near-jsonrpc:openapi"
 
+# --- Load OpenAPI ---
+_spec: Optional[Spec] = None
 _openapi: Optional[Dict[str, Any]] = None
-_components_schemas: Dict[str, Any] = {}
-
-def ensure_loaded():
-    global _openapi, _components_schemas
-    if _openapi is None:
-        _openapi = load_openapi()
-        _components_schemas = _openapi.get("components", {}).get("schemas", {}) or {}
-
-
-def resolve_ref_schema(ref: str, components: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    if not ref.startswith("#/components/schemas/"):
-        return None
-    name = ref.split("/")[-1]
-    return components.get(name)
-
-def get_fallback_for_ref(ref_name: str, components: Dict[str, Any], depth: int = 0) -> Any:
-    """Generate appropriate fallback values for common schema references"""
-    # Common primitive-like references
-    if ref_name in ("AccountId", "PublicKey", "CryptoHash"):
-        return "s"  # These are typically string-like
-    elif ref_name == "ShardId":
-        return 0  # ShardId is typically an integer/uint64
-    elif ref_name in ("BlockHeight", "Balance", "Gas"):
-        return 0  # These are typically numeric
-    elif ref_name == "Nonce":
-        return 0
-    else:
-        # For complex objects, try to generate a minimal object if depth allows
-        if depth < 3:  # Prevent deep recursion
-            ref_schema = components.get(ref_name)
-            if ref_schema and ref_schema.get("type") == "object":
-                # Try to generate minimal required object
-                props = ref_schema.get("properties", {})
-                required = ref_schema.get("required", [])
-                minimal_obj = {}
-                for req_field in required[:5]:  # Limit to first 5 required fields
-                    field_schema = props.get(req_field, {})
-                    if field_schema.get("type") == "string":
-                        minimal_obj[req_field] = "s"
-                    elif field_schema.get("type") == "integer":
-                        minimal_obj[req_field] = 0
-                    elif field_schema.get("type") == "number":
-                        minimal_obj[req_field] = 0.0
-                    elif field_schema.get("type") == "boolean":
-                        minimal_obj[req_field] = True
-                    elif field_schema.get("type") == "array":
-                        minimal_obj[req_field] = []
-                    elif "$ref" in field_schema:
-                        inner_ref = field_schema["$ref"].split("/")[-1]
-                        minimal_obj[req_field] = get_fallback_for_ref(inner_ref, components, depth + 1)
-                    else:
-                        minimal_obj[req_field] = "s"
-                return minimal_obj
-        # Default fallback for complex objects
-        return {}
-
-def choose_enum(schema: Dict[str, Any]) -> Any:
-    enum = schema.get("enum", [])
+_ir: Optional[SpecIR] = None
+_graph: Optional[RefGraph] = None
+# Built on first validation, then shared by every validator
+_registry: Optional[Registry] = None
+_converted_schemas: Dict[str, Any] = {}
+_validators: Dict[str, Any] = {}
+# Component schemas compiled to Python functions; see validator_compiler.py
+_compiled: Optional[CompiledValidators] = None
+_compiled_cache_dir: Optional[str] = CACHE_DIR
+# allows_null() results by id() of the schema node
+_allows_null: Dict[int, bool] = {}
+# Samples of referenced component schemas; see sample_cache.py
+_samples = SampleCache()
+# minimal_sample() of each component by (node id, allow_null), computed on first use
+_minimal_samples: Dict[Any, Any] = {}
+# Marks a minimal sample that depends on one not known yet
+_UNKNOWN = object()
+# Key in _minimal_samples once they are computed
+_COMPUTED = object()
+# _is_leaf() results by id() of the schema node, and per-union lookups derived from the IR
+_leaves: Dict[int, bool] = {}
+_viable_variants: Dict[Tuple[int, bool], Tuple[SchemaNode, ...]] = {}
+_variant_required_keys: Dict[int, List[Tuple[SchemaNode, frozenset]]] = {}
+# Seed every sample's RNG is derived from; see derive_rng()
+_seed = DEFAULT_SEED
+# Sizes of the generated samples; see size_classes.py
+_size_class = SMALL
+# Array items of the size class's property_items, by id() of the array schema node
+_property_items: Dict[int, int] = {}
+# Serialize mocks without whitespace; see mock_bundle.py for the formats
+_compact = False
+# Keywords whose presence gives a schema subschemas to expand
+_COMPOSITE_KEYWORDS = ("$ref", "allOf", "oneOf", "anyOf", "properties", "patternProperties", "items")
+
+def ensure_loaded(spec: Optional[Spec] = None):
+    global _spec, _openapi, _ir, _graph, _registry, _compiled
+    if spec is None and _openapi is not None:
+        return
+    spec = spec or load_spec()
+    _spec = spec
+    _openapi = spec.document
+    _ir = spec.ir
+    _graph = spec.graph
+    _registry = None
+    _converted_schemas.clear()
+    _validators.clear()
+    _compiled = None
+    _allows_null.clear()
+    _leaves.clear()
+    _minimal_samples.clear()
+    _viable_variants.clear()
+    _variant_required_keys.clear()
+    _samples.clear()
+    prepare_components()
+    set_size_class(_size_class)
+
+def set_size_class(size: SizeClass) -> None:
+    """Generate samples of the given size class from now on"""
+    global _size_class
+    if size != _size_class:
+        _samples.clear()  # cached subtrees have the previous class's sizes
+    _size_class = size
+    _property_items.clear()
+    for (schema_name, prop_name), count in size.property_items.items():
+        prop = _ir.schemas[schema_name].properties.get(prop_name) if schema_name in _ir.schemas else None
+        if prop is not None:
+            _property_items[id(prop.schema.target)] = count
+
+
+def choose_enum(schema: SchemaNode, allow_null: bool, rng: random.Random) -> Any:
+    enum = schema.enum or []
+    if not allow_null or schema.type not in (None, "null"):
+        # null is only valid where the schema's type admits it
+        enum = [v for v in enum if v is not None] or enum
     if not enum:
         return None
     if len(enum) > 1:
         non_null = [v for v in enum if v is not None]
         if non_null:
-            if random.random() < 0.9:
-                return random.choice(non_null)
+            if rng.random() < 0.9:
+                return rng.choice(non_null)
             else:
-                return random.choice(enum)
-        return random.choice(enum)
+                return rng.choice(enum)
+        return rng.choice(enum)
     return enum[0]
 
-def merge_allof_schemas(allof_list: List[Dict[str, Any]], components: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Merge allOf schemas. Handles:
-      - single $ref → resolve and return it
-      - multiple schemas → merge object parts + primitive constraints
-    """
-    if len(allof_list) == 1:
-        first = allof_list[0]
-        if "$ref" in first:
-            resolved = resolve_ref_schema(first["$ref"], components)
-            if resolved is not None:
-                # Return resolved schema directly — avoids returning {} later
-                return resolved
-        # Otherwise fall through to general merging below
-
-    object_parts = []
-    primitive_parts = []
-
-    for subs in allof_list:
-        inline = {k: v for k, v in subs.items() if k != "$ref"}
-        if "$ref" in subs:
-            resolved = resolve_ref_schema(subs["$ref"], components)
-            if resolved:
-                # Treat resolved schema as inline
-                if resolved.get("type") == "object" or "properties" in resolved:
-                    object_parts.append(resolved)
-                else:
-                    primitive_parts.append(resolved)
-
-        if inline:
-            if inline.get("type") == "object" or "properties" in inline:
-                object_parts.append(inline)
-            else:
-                primitive_parts.append(inline)
-
-    if object_parts and not primitive_parts:
-        merged = {"type": "object", "properties": {}, "required": []}
-        for subschema in object_parts:
-            merged["properties"].update(subschema.get("properties", {}))
-            merged["required"] = list(dict.fromkeys(merged.get("required", []) + subschema.get("required", [])))
-            if "additionalProperties" in subschema:
-                merged["additionalProperties"] = subschema["additionalProperties"]
-        return merged
-
-    if primitive_parts and not object_parts:
-        # Just take the first one? Or combine? For now, pick first.
-        return dict(primitive_parts[0])
-
-    if object_parts and primitive_parts:
-        merged = {"type": "object", "properties": {}, "required": []}
-        for subschema in object_parts:
-            merged["properties"].update(subschema.get("properties", {}))
-            merged["required"] = list(dict.fromkeys(merged.get("required", []) + subschema.get("required", [])))
-        # Overlay primitive constraints (like type, format, etc.)
-        merged.update(primitive_parts[0])
-        return merged
-
-    # Fallback: if nothing could be merged, return empty schema — generate_sample will handle it
-    return {}
-
-def sample_for_primitive(schema: Dict[str, Any]) -> Any:
-    if "enum" in schema:
-        return choose_enum(schema)
-    if "default" in schema:
-        return schema["default"]
-    if "const" in schema:
-        return schema["const"]
-
-    typ = schema.get("type")
-    fmt = schema.get("format", "")
+def sample_for_pattern(pattern: str) -> str:
+    """A string matching `pattern`, from the known NEAR formats or simple candidates"""
+    regex = re.compile(pattern)
+    for candidate in (*NEAR_STRING_SAMPLES.values(), *PATTERN_CANDIDATES):
+        if regex.search(candidate):
+            return candidate
+    print(f"⚠️  No sample string matches pattern {pattern!r}")
+    return "s"
+
+def sample_for_primitive(schema: SchemaNode) -> Any:
+    """Sample of a schema without subschemas; callers pick enum values themselves"""
+    raw = schema.raw
+    if "default" in raw:
+        return raw["default"]
+    if "const" in raw:
+        return raw["const"]
+
+    typ = schema.type
+    fmt = schema.format
     if typ == "string" or (typ is None and fmt):
-        min_len = schema.get("minLength", 1)
-        length = max(1, min_len)
+        if schema.name in NEAR_STRING_SAMPLES:
+            return NEAR_STRING_SAMPLES[schema.name]
+        if "pattern" in raw:
+            return sample_for_pattern(raw["pattern"])
         if fmt in ("byte", "bytes"):
-            return "c3RyaW5n"
+            size = _size_class.bytes_length
+            return base64.b64encode((b"string" * (size // 6 + 1))[:size]).decode("ascii")
         if fmt in ("date-time", "date"):
             return "1970-01-01T00:00:00Z"
-        return "s" * max(1, length)
+        length = max(_size_class.string_length, raw.get("minLength", 1))
+        if "maxLength" in raw:
+            length = min(length, raw["maxLength"])
+        return "s" * length
     if typ == "integer":
-        if "minimum" in schema:
-            return int(schema["minimum"])
-        if "maximum" in schema:
-            return int(schema["maximum"])
+        if "minimum" in raw:
+            return int(raw["minimum"])
+        if "maximum" in raw:
+            return int(raw["maximum"])
         return 0
     if typ == "number":
-        if "minimum" in schema:
-            return float(schema["minimum"])
-        if "maximum" in schema:
-            return float(schema["maximum"])
+        if "minimum" in raw:
+            return float(raw["minimum"])
+        if "maximum" in raw:
+            return float(raw["maximum"])
         return 0.0
     if typ == "boolean":
         return True
     return None
 
-def generate_sample(schema: Dict[str, Any],
-                    components: Dict[str, Any],
-                    depth: int = 0,
-                    seen_refs: Optional[Set[str]] = None) -> Any:
-    if depth > 100:  # Increased depth limit to handle complex nested schemas
+def _property_schema(properties: Dict[str, Property], name: str) -> Optional[SchemaNode]:
+    """Schema of property `name`, or None when missing or empty"""
+    prop = properties.get(name)
+    if prop is None or not prop.schema.raw:
         return None
-    seen_refs = seen_refs or set()
+    return prop.schema
+
+def allows_null(schema: SchemaNode) -> bool:
+    """Whether null is valid for `schema` under the converted (nullable → anyOf) semantics"""
+    key = id(schema)
+    cached = _allows_null.get(key)
+    if cached is None:
+        _allows_null[key] = False  # a schema reached again through its own refs is taken as non-null
+        cached = _allows_null[key] = _compute_allows_null(schema)
+    return cached
+
+def _compute_allows_null(schema: SchemaNode) -> bool:
+    raw = schema.raw
+    if "$ref" in raw:
+        if schema.ref is None or not allows_null(schema.ref):
+            return False
+    if schema.nullable and "type" in raw:
+        return True
+    if schema.type is not None and schema.type != "null":
+        return False
+    if schema.enum is not None and None not in schema.enum:
+        return False
+    if schema.union is not None:
+        matching = sum(1 for variant in schema.union.variants if allows_null(variant))
+        if matching == 0 or (schema.union.keyword == "oneOf" and matching > 1):
+            return False
+    return all(allows_null(part) for part in schema.all_of)
+
+def _type_compatible(parent: Optional[str], variant: SchemaNode) -> bool:
+    """Whether a value of `variant` can also satisfy the parent schema's `type`"""
+    typ = variant.target.type
+    return parent is None or typ is None or typ == parent or (parent == "number" and typ == "integer")
+
+def viable_variants(schema: SchemaNode, allow_null: bool = True) -> Tuple[SchemaNode, ...]:
+    """Union variants a sample can be built from without violating the enclosing schema"""
+    key = (id(schema), allow_null)
+    viable = _viable_variants.get(key)
+    if viable is None:
+        variants = schema.union.variants if schema.union else ()
+        viable = _viable_variants[key] = tuple(
+            v for v in variants
+            if _type_compatible(schema.type, v) and (allow_null or not v.target.is_null)
+        ) or variants
+    return viable
+
+def exclude_sibling_variants(sample: Dict[str, Any], choice: SchemaNode, schema: SchemaNode) -> None:
+    """Drop optional keys that would make `sample` match a oneOf variant other than `choice`"""
+    keep = None
+    for variant, required in _required_keys_of_variants(schema):
+        if variant is choice or not required or not required <= sample.keys():
+            continue
+        if keep is None:
+            keep = set(choice.target.required).union(schema.required)
+        for key in variant.target.required:
+            if key not in keep:
+                del sample[key]
+                break
+
+def _required_keys_of_variants(schema: SchemaNode) -> List[Tuple[SchemaNode, frozenset]]:
+    key = id(schema)
+    variants = _variant_required_keys.get(key)
+    if variants is None:
+        variants = _variant_required_keys[key] = [
+            (variant, frozenset(variant.target.required)) for variant in schema.union.variants
+        ]
+    return variants
+
+# --- Minimal samples ---
+
+def prepare_components() -> None:
+    """Compute the null admissibility of every component, dependencies first.
+
+    Walking the SCCs of the ref graph in dependency order means a `$ref` is
+    always looked up rather than followed, however long the chain of
+    references is.
+    """
+    for members in _graph.sccs:
+        for member in members:
+            allows_null(_graph.nodes[member])
+
+def compute_minimal_samples() -> None:
+    """Compute the minimal sample of every component, dependencies first.
 
+    Members of a recursive SCC are retried until none of them gains a minimal
+    sample; one that never does has no finite instance.
+    """
+    _minimal_samples.clear()
+    for members in _graph.sccs:
+        nodes = [_graph.nodes[member] for member in members]
+        pending = [(node, allow_null) for node in nodes for allow_null in (False, True)]
+        while pending:
+            remaining = []
+            for node, allow_null in pending:
+                sample = _minimal(node, allow_null)
+                if sample is _UNKNOWN:
+                    remaining.append((node, allow_null))
+                else:
+                    _minimal_samples[(node.id, allow_null)] = sample
+            if len(remaining) == len(pending):
+                break
+            pending = remaining
+    _minimal_samples[_COMPUTED] = True
+
+def minimal_sample(schema: SchemaNode, allow_null: bool = True) -> Any:
+    """Smallest sample of `schema`: required properties only, fewest items, first viable variant.
+
+    Deterministic, and finite even for recursive schemas. Returns None for a
+    schema without a finite instance.
+    """
+    if _COMPUTED not in _minimal_samples:
+        compute_minimal_samples()
+    sample = _minimal_of(schema, allow_null)
+    return None if sample is _UNKNOWN else sample
+
+def _minimal_of(schema: SchemaNode, allow_null: bool) -> Any:
+    """`_minimal`, looking components up instead of recomputing them"""
+    if schema.id is not None:
+        return _minimal_samples.get((schema.id, allow_null), _UNKNOWN)
+    return _minimal(schema, allow_null)
+
+def _minimal(schema: SchemaNode, allow_null: bool) -> Any:
+    """Minimal sample of `schema`, or _UNKNOWN while a component it needs has none yet"""
+    raw = schema.raw
+    if "$ref" in raw:
+        if schema.ref is None:
+            return None
+        return _minimal_of(schema.ref, allow_null)
+    if allow_null and allows_null(schema):
+        return None
+    if "default" in raw:
+        return raw["default"]
+    if "enum" in raw:
+        enum = schema.enum or []
+        values = [v for v in enum if v is not None] if not allow_null or schema.type not in (None, "null") else enum
+        return (values or enum or [None])[0]
+
+    if "allOf" in raw:
+        sample = _minimal_of(schema.merged, allow_null)
+        if isinstance(sample, dict):
+            sample = dict(sample)
+            if not _add_minimal_required(sample, schema.required, schema.properties):
+                return _UNKNOWN
+        return sample
+
+    if schema.union is not None:
+        for choice in viable_variants(schema, allow_null):
+            sample = _minimal_of(choice, allow_null)
+            if sample is _UNKNOWN:
+                continue
+            if isinstance(sample, dict):
+                sample = dict(sample)
+                if not (_add_minimal_required(sample, schema.required, schema.properties, choice.properties)
+                        and _add_minimal_required(sample, choice.required, choice.properties, schema.properties)):
+                    continue
+                if schema.union.keyword == "oneOf":
+                    exclude_sibling_variants(sample, choice, schema)
+            return sample
+        return _UNKNOWN
+
+    if schema.type == "object" or "properties" in raw or "patternProperties" in raw or schema.additional_properties is not None:
+        out: Dict[str, Any] = {}
+        return out if _add_minimal_required(out, schema.required, schema.properties) else _UNKNOWN
+
+    if schema.type == "array" or "items" in raw:
+        items = list(schema.tuple_items)
+        min_items = raw.get("minItems") or 0
+        if schema.items is not None and len(items) < min_items:
+            items.extend([schema.items] * (min_items - len(items)))
+        sample = [_minimal_of(item, allows_null(item)) for item in items]
+        return _UNKNOWN if any(value is _UNKNOWN for value in sample) else sample
+
+    return sample_for_primitive(schema)
+
+def _add_minimal_required(sample: Dict[str, Any], required: Tuple[str, ...], *property_maps: Dict[str, Property]) -> bool:
+    """Add minimal values for the `required` keys `sample` lacks. Returns False if one has none yet"""
+    for name in required:
+        if name in sample:
+            continue
+        prop_schema = next((s for s in (_property_schema(props, name) for props in property_maps) if s is not None), None)
+        value = _minimal_of(prop_schema, allows_null(prop_schema)) if prop_schema is not None else None
+        if value is _UNKNOWN:
+            return False
+        sample[name] = value
+    return True
+
+# --- Random samples ---
+
+class _Generation:
+    """State shared by the frames of one sample: its RNG and the recursion budget"""
+
+    __slots__ = ("rng", "budget")
+
+    def __init__(self, rng: random.Random, budget: Optional[List[int]] = None):
+        self.rng = rng
+        self.budget = budget if budget is not None else [_size_class.recursion_budget] * len(_graph.sccs)
+
+def derive_rng(*key: Any) -> random.Random:
+    """RNG seeded from the run's seed and `key` alone.
+
+    Uses a stable digest rather than hash(), so the stream is the same in
+    every process and doesn't depend on what was generated before.
+    """
+    digest = hashlib.blake2b(repr((_seed,) + key).encode("utf-8"), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+def generate_sample(schema: Optional[SchemaNode], allow_null: bool = True, rng: Optional[random.Random] = None) -> Any:
+    """Generate a sample instance of `schema` that satisfies its constraints.
+
+    With `allow_null=False` the sample is never null, for places where the
+    enclosing schema rejects null. Random choices come from `rng`, by default
+    one derived from the schema's name. Generation runs on an explicit stack of `_expand`
+    frames rather than Python recursion, so nesting depth is only bounded by
+    memory; see `_expand` for how recursive schemas terminate.
+    """
     if schema is None:
         return None
+    state = _Generation(rng or derive_rng(schema.name))
+    return _run(_expand(schema, allow_null, state), state)
+
+def complete_variant_sample(sample: Dict[str, Any], choice: SchemaNode, schema: SchemaNode,
+                            rng: Optional[random.Random] = None) -> None:
+    """Add what `schema` requires around its union variant `choice` to the variant's object sample"""
+    state = _Generation(rng or derive_rng(schema.name, choice.name))
+    _run(_complete_variant(sample, choice, schema), state)
+
+def _run(frame: Generator, state: _Generation) -> Any:
+    """Drive `frame` and the frames it requests to completion.
+
+    A frame yields `(schema, allow_null)` to request a sample of a subschema,
+    or `(schema, allow_null, state)` to have it generated with other state,
+    and is resumed with that sample; its return value is the frame's sample.
+    Requested frames inherit the state of the frame requesting them.
+    """
+    stack = [(frame, state)]
+    value = None
+    while stack:
+        frame, state = stack[-1]
+        try:
+            request = frame.send(value)
+        except StopIteration as done:
+            stack.pop()
+            value = done.value
+            continue
+        schema, allow_null = request[0], request[1]
+        if len(request) == 3:
+            state = request[2]
+        if _is_leaf(schema):
+            # Most requested schemas are primitives; they don't need a frame of their own
+            value = _sample_leaf(schema, allow_null, state.rng)
+        else:
+            stack.append((_expand(schema, allow_null, state), state))
+            value = None
+    return value
+
+def _is_leaf(schema: SchemaNode) -> bool:
+    """Whether `schema` has no subschemas, so `_expand` would never yield for it"""
+    key = id(schema)
+    leaf = _leaves.get(key)
+    if leaf is None:
+        raw = schema.raw
+        leaf = _leaves[key] = (
+            "default" in raw or "enum" in raw
+            or (schema.type not in ("object", "array") and schema.additional_properties is None
+                and not any(keyword in raw for keyword in _COMPOSITE_KEYWORDS))
+        )
+    return leaf
+
+def _sample_leaf(schema: SchemaNode, allow_null: bool, rng: random.Random) -> Any:
+    """What `_expand` returns for a leaf schema, without the generator frame"""
+    raw = schema.raw
+    if "default" in raw:
+        return raw["default"]
+    if "enum" in raw:
+        return choose_enum(schema, allow_null, rng)
+    if allow_null and schema.nullable and "type" in raw and rng.random() < _size_class.null_rate:
+        return None
+    return sample_for_primitive(schema)
 
-    if "$ref" in schema:
-        ref = schema["$ref"]
-        if ref in seen_refs:
-            # Instead of returning None for circular refs, return a basic fallback
-            ref_name = ref.split("/")[-1]
-            return get_fallback_for_ref(ref_name, components, depth + 5)  # Use high depth to get simple fallback
-        seen_refs.add(ref)
-        resolved = resolve_ref_schema(ref, components)
-        if resolved is None:
-            return None
-        return generate_sample(resolved, components, depth + 1, seen_refs)
+def _expand(schema: SchemaNode, allow_null: bool, state: _Generation) -> Generator:
+    """Frame generating a sample of `schema` (see `_run`).
 
-    if "default" in schema:
-        return schema["default"]
-    if "enum" in schema:
-        return choose_enum(schema)
-
-    # Handle nullable fields - but be more conservative about returning None
-    # for fields that have additional constraints
-    if schema.get("nullable", False):
-        # Only return None for nullable fields if they don't have other constraints
-        # or if we're in a context where null is truly acceptable
-        has_constraints = any(k in schema for k in ["minimum", "maximum", "minLength", "maxLength", "format", "pattern"])
-        if not has_constraints and random.random() < 0.1:
+    `state.budget` counts, per SCC of the ref graph, how many more times a recursive
+    schema of that SCC may be expanded on the path from the root. Once it is
+    used up, references into the SCC get the schema's minimal sample, which is
+    finite by construction, so cycles of any length terminate after at most
+    the size class's recursion_budget expansions each.
+    """
+    raw = schema.raw
+
+    if "$ref" in raw:
+        if schema.ref is None:
             return None
+        return (yield from _expand_component(schema.ref, allow_null, state))
 
-    if "allOf" in schema:
-        merged = merge_allof_schemas(schema["allOf"], components)
-        return generate_sample(merged, components, depth + 1, seen_refs)
+    if "default" in raw:
+        return raw["default"]
+    rng = state.rng
+    if "enum" in raw:
+        return choose_enum(schema, allow_null, rng)
 
-    if "oneOf" in schema or "anyOf" in schema:
-        choices = schema.get("oneOf") or schema.get("anyOf")
+    # nullable only admits null next to a `type`; that's how it is converted for validation
+    if allow_null and schema.nullable and "type" in raw and rng.random() < _size_class.null_rate:
+        return None
+
+    if "allOf" in raw:
+        merged = schema.merged
+        if merged.id is not None:
+            # A single-$ref allOf merges to the component itself
+            sample = yield from _expand_component(merged, allow_null, state)
+        else:
+            sample = yield merged, allow_null
+        # Properties next to allOf constrain the same object
+        if isinstance(sample, dict):
+            sample = dict(sample)  # may be a shared cached subtree
+            for name, prop in schema.properties.items():
+                sample[name] = yield prop.schema, allows_null(prop.schema)
+        return sample
+
+    if "oneOf" in raw or "anyOf" in raw:
+        # Only variants compatible with the parent's own type can produce a valid sample
+        choices = viable_variants(schema, allow_null)
         if not choices:
             return None
 
         # Pick a random choice from oneOf/anyOf
-        choice = random.choice(choices)
+        choice = rng.choice(choices)
 
         # Generate base sample from chosen subschema
-        sample = generate_sample(choice, components, depth + 1, seen_refs)
+        sample = yield choice, allow_null
 
         # If we got a dict result, we need to merge in the parent schema's properties and requirements
         if isinstance(sample, dict):
-            # Get parent-level properties and required fields
-            parent_props = schema.get("properties", {})
-            parent_required = schema.get("required", [])
-            choice_props = choice.get("properties", {}) if isinstance(choice, dict) else {}
-            choice_required = choice.get("required", []) if isinstance(choice, dict) else []
-
-            # Ensure all parent-level required properties are present
-            for prop_name in parent_required:
-                if prop_name not in sample:
-                    # Try to get the property schema from parent or choice
-                    prop_schema = parent_props.get(prop_name) or choice_props.get(prop_name, {})
-                    if prop_schema:
-                        prop_sample = generate_sample(prop_schema, components, depth + 1, seen_refs.copy())
-                        if prop_sample is not None:
-                            sample[prop_name] = prop_sample
-                        # If None, we'll leave it out and let validation catch it
-
-            # Also ensure choice-level required properties are present
-            for prop_name in choice_required:
-                if prop_name not in sample:
-                    prop_schema = choice_props.get(prop_name) or parent_props.get(prop_name, {})
-                    if prop_schema:
-                        prop_sample = generate_sample(prop_schema, components, depth + 1, seen_refs.copy())
-                        if prop_sample is not None:
-                            sample[prop_name] = prop_sample
-                        # If None, we'll leave it out and let validation catch it
+            sample = dict(sample)  # may be a shared cached subtree
+            yield from _complete_variant(sample, choice, schema)
 
         return sample
 
-    if schema.get("type") == "object" or "properties" in schema or "patternProperties" in schema or ("additionalProperties" in schema and isinstance(schema.get("additionalProperties"), dict)):
-        props = schema.get("properties", {}) or {}
-        required = schema.get("required", []) or []
+    if schema.type == "object" or "properties" in raw or "patternProperties" in raw or schema.additional_properties is not None:
         out: Dict[str, Any] = {}
 
-        # Handle explicit properties
-        for name, subs in props.items():
-            is_required = name in required
-            
-            # Check for nullable - need to resolve $ref to get the full schema
-            is_nullable = subs.get("nullable", False)
-            if not is_nullable and "$ref" in subs:
-                resolved_schema = resolve_ref_schema(subs["$ref"], components)
-                if resolved_schema:
-                    is_nullable = resolved_schema.get("nullable", False)
-            
-            # Also check if anyOf/oneOf contains null
-            if not is_nullable:
-                if "anyOf" in subs:
-                    for variant in subs["anyOf"]:
-                        if variant.get("nullable") or variant.get("enum") == [None]:
-                            is_nullable = True
-                            break
-                elif "oneOf" in subs:
-                    for variant in subs["oneOf"]:
-                        if variant.get("nullable") or variant.get("enum") == [None]:
-                            is_nullable = True
-                            break
-
-            # Create a new seen_refs copy for each property to avoid cross-property circular ref detection
-            property_seen_refs = seen_refs.copy()
-            val = generate_sample(subs, components, depth + 1, property_seen_refs)
-
-            # If we got None but field is required and NOT nullable → try regenerating
-            if val is None and is_required and not is_nullable:
-                # Try a few more times with different random seeds
-                for retry in range(3):
-                    val = generate_sample(subs, components, depth + 1, seen_refs.copy())
-                    if val is not None:
-                        break
-                
-                # If still None, keep it as None - the validation will catch it
-                # This helps us identify actual schema issues
-            elif val is None and not is_nullable:
-                # Even if not required, don't set arrays/objects to None unless explicitly nullable
-                typ = subs.get("type")
-                if typ == "array":
-                    val = []
-                elif typ == "object" or "properties" in subs:
-                    val = {}
-
-            out[name] = val
+        # Handle explicit properties; a present key may only be null where its schema allows it
+        for name, prop in schema.properties.items():
+            out[name] = yield prop.schema, allows_null(prop.schema)
 
         # Handle patternProperties
-        pp = schema.get("patternProperties", {}) or {}
-        for patt, pschema in pp.items():
+        for patt, pschema in schema.pattern_properties.items():
             # Try to generate a key that matches the pattern
             example_key = None
 
             # Common case: ^\d+$
             if patt == r"^\d+$":
-                example_key = str(random.randint(0, 999))
+                example_key = str(rng.randint(0, 999))
             # You can add more common patterns here as needed
             elif patt == r"^[a-zA-Z_][a-zA-Z0-9_]*$":  # simple identifier
-                example_key = random.choice(["key_a", "item_1", "field_x"])
+                example_key = rng.choice(["key_a", "item_1", "field_x"])
             else:
-                # Fallback: try to generate something plausible or use generic
-                # For now, just use a safe default — but warn via comment or log
-                example_key = f"generated_key_{hash(patt) % 1000}"
+                example_key = sample_for_pattern(patt)
 
             # Generate value for this pattern-matched property
-            val = generate_sample(pschema, components, depth + 1, seen_refs)
-            if val is None:
-                val = sample_for_primitive(pschema) or "s"
-
-            out[example_key] = val
+            out[example_key] = yield pschema, allows_null(pschema)
 
         # Handle additionalProperties
-        addp = schema.get("additionalProperties", None)
-        if isinstance(addp, dict):
-            # Only add if additionalProperties is allowed (not False)
-            if addp is not False:
-                out["additionalProp1"] = generate_sample(addp, components, depth + 1, seen_refs)
+        if schema.additional_properties is not None:
+            additional = schema.additional_properties
+            for i in range(1, _size_class.map_entries + 1):
+                out[f"additionalProp{i}"] = yield additional, allows_null(additional)
 
         return out
 
-    if schema.get("type") == "array" or "items" in schema:
-        items_schema = schema.get("items", {})
-        min_items = schema.get("minItems", None)
-        max_items = schema.get("maxItems", None)
+    if schema.type == "array" or "items" in raw:
+        min_items = raw.get("minItems", None)
+        max_items = raw.get("maxItems", None)
 
         # Handle tuple-style arrays (items: [schema1, schema2, ...])
-        if isinstance(items_schema, list):
+        if isinstance(raw.get("items"), list):
+            items_schemas = schema.tuple_items
             arr = []
-            for item_sch in items_schema:
-                val = generate_sample(item_sch, components, depth + 1, seen_refs)
-                # Enforce non-nullability per item schema unless explicitly nullable
-                if val is None and not item_sch.get("nullable", False):
-                    # Try a few more times
-                    for retry in range(3):
-                        val = generate_sample(item_sch, components, depth + 1, seen_refs.copy())
-                        if val is not None:
-                            break
-                    # If still None, we'll skip this item or add it anyway
-                    # depending on whether it's required (for tuple arrays, all items are typically required)
-                arr.append(val)
+            for item_sch in items_schemas:
+                arr.append((yield item_sch, allows_null(item_sch)))
             if min_items and len(arr) < min_items:
                 while len(arr) < min_items:
-                    last_sch = items_schema[-1]
-                    val = generate_sample(last_sch, components, depth + 1, seen_refs.copy())
-                    arr.append(val)
+                    last_sch = items_schemas[-1]
+                    arr.append((yield last_sch, allows_null(last_sch)))
             return arr
 
-        # Handle uniform arrays (items: { ... })
-        count = 1
+        # Handle uniform arrays (items: { ... }), with a length inside [minItems, maxItems]
+        items_schema = schema.items if schema.items is not None else SchemaNode(raw={})
+        count = _property_items.get(id(schema), _size_class.array_items)
         if isinstance(min_items, int):
-            count = max(1, min_items)
+            count = max(count, min_items)
         elif isinstance(max_items, int):
-            count = max(1, min(3, max_items))
-        else:
-            count = 1
+            count = max(count, 3)
+        if isinstance(max_items, int):
+            count = min(count, max_items)
 
+        item_allows_null = allows_null(items_schema)
         arr = []
         for _ in range(count):
-            val = generate_sample(items_schema, components, depth + 1, seen_refs.copy())
-            if val is None and not items_schema.get("nullable", False):
-                # Try a few more times
-                for retry in range(3):
-                    val = generate_sample(items_schema, components, depth + 1, seen_refs.copy())
-                    if val is not None:
-                        break
-                # If still None after retries, keep it as None
-            arr.append(val)
-
+            arr.append((yield items_schema, item_allows_null))
         return arr
 
-    prim = sample_for_primitive(schema)
-    if prim is not None:
-        return prim
-
-    return None
+    return sample_for_primitive(schema)
+
+def _expand_component(target: SchemaNode, allow_null: bool, state: _Generation) -> Generator:
+    """Frame for a reference to the component `target`, applying the subtree cache or recursion budget"""
+    if not _graph.is_recursive(target.id):
+        # Shared subtrees of non-recursive components come from the subtree cache. A
+        # subtree is generated with an RNG derived from its key, so it is the same
+        # whichever schema (or worker process) happens to generate it first
+        key = (target.name, allow_null, state.rng.randrange(SUBTREE_SEEDS))
+        found, sample = _samples.get(key)
+        if not found:
+            sample = yield target, allow_null, _Generation(derive_rng("subtree", *key), state.budget)
+            _samples.put(key, sample)
+        return sample
+    budget = state.budget
+    scc_id = _graph.scc_ids[target.id]
+    if budget[scc_id] == 0:
+        return minimal_sample(target, allow_null)
+    budget[scc_id] -= 1
+    try:
+        return (yield target, allow_null)
+    finally:
+        budget[scc_id] += 1
+
+def _complete_variant(sample: Dict[str, Any], choice: SchemaNode, schema: SchemaNode) -> Generator:
+    """Frame adding the properties `schema` and `choice` require to the variant sample in place"""
+    # Get parent-level properties and required fields
+    parent_props = schema.properties
+    choice_props = choice.properties
+
+    # Ensure all parent-level required properties are present
+    for prop_name in schema.required:
+        if prop_name not in sample:
+            # Try to get the property schema from parent or choice
+            prop_schema = _property_schema(parent_props, prop_name) or _property_schema(choice_props, prop_name)
+            if prop_schema:
+                sample[prop_name] = yield prop_schema, allows_null(prop_schema)
+
+    # Also ensure choice-level required properties are present
+    for prop_name in choice.required:
+        if prop_name not in sample:
+            prop_schema = _property_schema(choice_props, prop_name) or _property_schema(parent_props, prop_name)
+            if prop_schema:
+                sample[prop_name] = yield prop_schema, allows_null(prop_schema)
+
+    if schema.union.keyword == "oneOf":
+        exclude_sibling_variants(sample, choice, schema)
 
 def convert_openapi_nullable_to_jsonschema(schema):
     """
@@ -474,61 +682,86 @@ def convert_openapi_nullable_to_jsonschema(schema):
     
     return converted
 
+def build_validator_registry(document: Dict[str, Any]) -> Registry:
+    """Register `document` with every component schema converted to JSON Schema once.
+
+    The document itself is left untouched; only the components are copied.
+    """
+    schemas = document.get("components", {}).get("schemas", {})
+    _converted_schemas.clear()
+    for name, schema_def in schemas.items():
+        _converted_schemas[name] = convert_openapi_nullable_to_jsonschema(schema_def)
+    converted_doc = dict(document)
+    converted_doc["components"] = {**document.get("components", {}), "schemas": _converted_schemas}
+    return Registry().with_resource(OPENAPI_URI, DRAFT202012.create_resource(converted_doc))
+
+def validator_for_schema(schema_name: str) -> Any:
+    """Validator for the component `schema_name`, built once per run against the shared registry"""
+    global _registry
+    validator = _validators.get(schema_name)
+    if validator is None:
+        if _registry is None:
+            _registry = build_validator_registry(_openapi or {})
+        # Validate through a $ref so refs inside the schema resolve against the whole document
+        pointer = schema_name.replace("~", "~0").replace("/", "~1")
+        ValidatorClass = jsonschema.validators.validator_for(_converted_schemas[schema_name])
+        validator = ValidatorClass({"$ref": f"{OPENAPI_URI}#/components/schemas/{pointer}"}, registry=_registry)
+        _validators[schema_name] = validator
+    return validator
+
+def compiled_validators() -> CompiledValidators:
+    """Compiled validators for every component schema, loaded once per run"""
+    global _registry, _compiled
+    if _compiled is None:
+        if _registry is None:
+            _registry = build_validator_registry(_openapi or {})
+        _compiled = load_compiled_validators(_converted_schemas, validator_for_schema, _compiled_cache_dir)
+    return _compiled
+
+def prepare_sampling() -> None:
+    """Load the compiled validators and compute the minimal samples now.
+
+    Both are one-off costs that would otherwise be charged to the profile
+    time of whichever schema happens to need them first.
+    """
+    compiled_validators()
+    if _COMPUTED not in _minimal_samples:
+        compute_minimal_samples()
+
 def generate_sample_for_schema(schema_name: str) -> Optional[Any]:
     """
-    Generate a sample JSON for `schema_name` and validate it against the full schema using jsonschema.
-    Tries multiple attempts (because generation uses randomness). Returns first valid sample or None.
+    Generate a sample JSON for `schema_name` and check it against the full (compiled) schema.
+    Generation satisfies the schema's constraints, so the sample is valid on the first attempt;
+    an invalid one is reported and returned anyway.
     Note: Can return None (null in JSON) for schemas that only allow null values.
     """
-    schema = _components_schemas.get(schema_name)
-    if schema is None:
+    node = _ir.schemas.get(schema_name)
+    if node is None:
         print(f"⚠️  Schema '{schema_name}' not found")
         return None
     
     # Special case: if schema only allows null (enum: [null]), return None immediately
-    if schema.get("enum") == [None]:
+    if node.enum == [None]:
         return None
 
-    # Prepare a jsonschema resolver rooted at the whole OpenAPI doc so "#/components/..." refs resolve.
-    # But first convert nullable fields to be compatible with JSON Schema
-    converted_root_doc = _openapi.copy() if _openapi else {}
-    if "components" in converted_root_doc and "schemas" in converted_root_doc["components"]:
-        converted_root_doc["components"]["schemas"] = {
-            name: convert_openapi_nullable_to_jsonschema(schema_def)
-            for name, schema_def in converted_root_doc["components"]["schemas"].items()
-        }
-    
-    resolver = jsonschema.RefResolver.from_schema(converted_root_doc)
-    
-    # Also convert the current schema for validation
-    converted_schema = convert_openapi_nullable_to_jsonschema(schema)
-
-    last_error = None
-    last_sample = None
-
-    # choose appropriate validator class for the schema
-    ValidatorClass = jsonschema.validators.validator_for(converted_schema)
-    # instantiate validator with schema and resolver
-    for attempt in range(1, MAX_ATTEMPTS + 1):
-        sample = generate_sample(schema, _components_schemas)  # Generate from original schema
-        last_sample = sample
-        try:
-            validator = ValidatorClass(converted_schema, resolver=resolver)  # Validate against converted schema
-            validator.validate(sample)
-            # success - sample can be None for schemas that only allow null
-            return sample
-        except jsonschema.ValidationError as ve:
-            last_error = ve
-            # try again (randomness may produce a different valid sample)
-            continue
-        except Exception as e:
-            # unexpected error (schema not valid for chosen validator or other issues)
-            last_error = e
-            break
+    # Samples are valid by construction; the compiled validator only confirms it
+    sample = generate_sample(node, allow_null=False, rng=derive_rng(schema_name))
+    validators = compiled_validators()
+    with profiler.timed(VALIDATE, schema_name):
+        valid = validators.is_valid(schema_name, sample)
+    if valid:
+        return sample
 
-    # If we get here, attempts failed
-    print(f"❌ Failed to generate valid sample for '{schema_name}': {last_error}")
-    return last_sample  # Return last attempt even if invalid
+    try:
+        validator_for_schema(schema_name).validate(sample)
+        error = "compiled validator disagrees with jsonschema"
+    except jsonschema.ValidationError as ve:
+        error = ve
+    except Exception as e:
+        # unexpected error (schema not valid for chosen validator or other issues)
+        error = e
+    print(f"❌ Failed to generate valid sample for '{schema_name}': {error}")
+    return sample  # Return it even if invalid
 
 def is_request_or_response_schema(schema_name: str) -> bool:
     """Check if schema name is a request or response schema"""
@@ -550,12 +783,12 @@ def generate_response_variant(schema_name: str, variant_type: str) -> Optional[D
     Returns:
         Sample JSON with the specified variant, or None if failed
     """
-    schema = _components_schemas.get(schema_name)
+    schema = _ir.schemas.get(schema_name)
     if schema is None:
         return None
     
     # Check if this is a oneOf response schema
-    one_of = schema.get("oneOf", [])
+    one_of = schema.union.variants if schema.union and schema.union.keyword == "oneOf" else ()
     if not one_of:
         # Not a oneOf schema, generate normally
         return generate_sample_for_schema(schema_name)
@@ -563,7 +796,7 @@ def generate_response_variant(schema_name: str, variant_type: str) -> Optional[D
     # Find the variant we want (result or error)
     target_variant = None
     for variant in one_of:
-        if variant_type in variant.get("properties", {}):
+        if variant_type in variant.properties:
             target_variant = variant
             break
     
@@ -572,39 +805,23 @@ def generate_response_variant(schema_name: str, variant_type: str) -> Optional[D
     
     # Create a modified schema that forces the specific variant
     # We need to merge the base schema with the specific variant
-    forced_schema = {
-        "type": "object",
-        "properties": {},
-        "required": []
-    }
-    
-    # Copy base properties (id, jsonrpc, etc.)
-    if "properties" in schema:
-        forced_schema["properties"].update(schema["properties"])
-    
-    # Copy base required fields
-    if "required" in schema:
-        forced_schema["required"] = list(schema["required"])
+    # Copy base properties (id, jsonrpc, etc.), then the variant properties (result or error field)
+    properties = {name: prop.schema for name, prop in schema.properties.items()}
+    properties.update((name, prop.schema) for name, prop in target_variant.properties.items())
     
-    # Merge the variant properties (result or error field)
-    if "properties" in target_variant:
-        forced_schema["properties"].update(target_variant["properties"])
-    
-    # Merge the variant required fields
-    if "required" in target_variant:
-        forced_schema["required"].extend(target_variant["required"])
-    
-    # Remove duplicates from required list
-    forced_schema["required"] = list(set(forced_schema["required"]))
+    # Merge base and variant required fields, removing duplicates
+    required = list(set(schema.required + target_variant.required))
     
     # Generate sample from the forced schema
-    return generate_sample(forced_schema, _components_schemas, depth=0, seen_refs=set())
+    forced_schema = _ir.object_node(properties, required)
+    return generate_sample(forced_schema, rng=derive_rng(schema_name, variant_type))
 
-def should_generate_standalone_mock(schema_name: str, schema: Dict[str, Any]) -> bool:
+def should_generate_standalone_mock(schema_name: str, node: SchemaNode) -> bool:
     """
     Determine if we should generate a standalone mock for this schema.
     We want to generate mocks for complex types that would benefit from testing.
     """
+    schema = node.raw
     # Skip request/response types (handled separately)
     if is_request_or_response_schema(schema_name):
         return False
@@ -632,7 +849,7 @@ def should_generate_standalone_mock(schema_name: str, schema: Dict[str, Any]) ->
     
     return False
 
-def generate_all_oneof_variants(schema_name: str, schema: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+def generate_all_oneof_variants(schema_name: str, schema: SchemaNode) -> List[Tuple[str, Dict[str, Any]]]:
     """
     Generate a sample for EACH variant of a oneOf/anyOf schema.
     This is critical for achieving high code coverage on enum types.
@@ -643,30 +860,29 @@ def generate_all_oneof_variants(schema_name: str, schema: Dict[str, Any]) -> Lis
     variants_list = []
     
     # Check if this is a oneOf or anyOf schema
-    variant_key = None
-    if "oneOf" in schema:
-        variant_key = "oneOf"
-    elif "anyOf" in schema:
-        variant_key = "anyOf"
-    else:
+    if schema.union is None:
         return variants_list
     
-    variants = schema[variant_key]
+    variants = schema.union.variants
     
     # Try to generate a sample for each variant
     for i, variant in enumerate(variants):
         try:
             # Create a schema that forces this specific variant
-            forced_schema = dict(variant)
+            forced_schema = variant
             
             # If the parent schema has base properties, merge them
-            if "properties" in schema and "properties" in forced_schema:
-                base_props = schema["properties"].copy()
-                base_props.update(forced_schema["properties"])
-                forced_schema["properties"] = base_props
+            if "properties" in schema.raw and "properties" in variant.raw:
+                base_props = {name: prop.schema for name, prop in schema.properties.items()}
+                base_props.update((name, prop.schema) for name, prop in variant.properties.items())
+                forced_schema = _ir.with_properties(variant, base_props)
             
-            # Generate sample for this variant
-            sample = generate_sample(forced_schema, _components_schemas, depth=0, seen_refs=set())
+            # Generate sample for this variant, with what the parent requires around it
+            rng = derive_rng(schema_name, i)
+            sample = generate_sample(forced_schema, allow_null=False, rng=rng)
+            if isinstance(sample, dict):
+                sample = dict(sample)  # may be a shared cached subtree
+                complete_variant_sample(sample, variant, schema, rng)
             
             if sample is not None:
                 variant_name = f"{schema_name}_Variant{i}"
@@ -678,76 +894,169 @@ def generate_all_oneof_variants(schema_name: str, schema: Dict[str, Any]) -> Lis
     
     return variants_list
 
-def main():
-    """Generate sample JSON files for all request and response schemas"""
-    ensure_loaded()
+def serialize_mock(sample: Any) -> str:
+    """JSON text of a mock: indented, or minified for the compact formats"""
+    if _compact:
+        return json.dumps(sample, separators=(",", ":"))
+    return json.dumps(sample, indent=2)
+
+def write_mock(filename: str, content: Union[str, bytes]) -> None:
+    """Write a mock file to every target directory, skipping unchanged ones"""
+    for _, directory in TARGET_DIRECTORIES:
+        write_file(os.path.join(directory, filename), content)
+
+def remove_stale_mocks(keep: Set[str]) -> int:
+    """Remove mock JSON files and bundles not in `keep` from the target directories"""
+    removed = 0
+    for _, directory in TARGET_DIRECTORIES:
+        if not os.path.isdir(directory):
+            continue
+        for filename in os.listdir(directory):
+            is_mock = filename.endswith(".json") or filename in BUNDLE_FILENAMES.values()
+            if is_mock and filename not in keep:
+                remove_file(os.path.join(directory, filename))
+                removed += 1
+    return removed
+
+# --- Mock jobs ---
+
+# Sections of the run, in output order
+REQUEST_RESPONSE = "request_response"
+STANDALONE = "standalone"
+
+def mock_jobs() -> List[Tuple[str, str]]:
+    """(section, schema name) of every schema that produces mocks, in output order"""
+    jobs = [(REQUEST_RESPONSE, name) for name in sorted(_ir.schemas) if is_request_or_response_schema(name)]
+    jobs.extend(
+        (STANDALONE, name) for name in sorted(_ir.schemas)
+        if should_generate_standalone_mock(name, _ir.schemas[name])
+    )
+    return jobs
+
+def generate_mock_job(job: Tuple[str, str]) -> List[Tuple[str, Optional[str]]]:
+    """The (filename, JSON content) mocks of one schema; content is None where generation failed.
+
+    Self-contained and deterministic for a given seed, so jobs can run in any
+    process and order.
+    """
+    with profiler.timed(SAMPLE, job[1]):
+        return _generate_mock_job(job)
+
+def _generate_mock_job(job: Tuple[str, str]) -> List[Tuple[str, Optional[str]]]:
+    section, schema_name = job
+    schema = _ir.schemas[schema_name]
+    swift_name = schema.swift_name
+    results: List[Tuple[str, Optional[str]]] = []
+
+    if section == REQUEST_RESPONSE and is_response_schema(schema_name):
+        # Generate both success and error variants
+        for variant_type in ["result", "error"]:
+            suffix = "_Success" if variant_type == "result" else "_Error"
+            sample = generate_response_variant(schema_name, variant_type)
+            results.append((f"{swift_name}{suffix}.json", serialize_mock(sample) if sample else None))
+    elif section == STANDALONE and ("oneOf" in schema.raw or "anyOf" in schema.raw):
+        # Generate samples for ALL variants
+        for variant_name, variant_sample in generate_all_oneof_variants(schema_name, schema):
+            results.append((f"{variant_name}.json", serialize_mock(variant_sample)))
+    else:
+        # Regular request schema or standalone type (struct, enum, etc.)
+        sample = generate_sample_for_schema(schema_name)
+        # sample can be None for schemas that only allow null (e.g., enum: [null])
+        # Check if we successfully generated (not checking for truthiness)
+        ok = sample is not None or schema.enum == [None]
+        results.append((f"{swift_name}.json", serialize_mock(sample) if ok else None))
+    return results
+
+def _init_mock_worker(spec: Spec, seed: int, compact: bool, cache_dir: Optional[str], profile: bool) -> None:
+    global _compiled_cache_dir, _seed, _compact
+    _compiled_cache_dir = cache_dir
+    ensure_loaded(spec)
+    _seed = seed
+    _compact = compact
+    if profile:
+        profiler.enable(memory=False)
+    prepare_sampling()
+
+def generate_mock_jobs(jobs: List[Tuple[str, str]], workers: int, spec: Spec) -> Iterator[List[Tuple[str, Optional[str]]]]:
+    """Results of `jobs` in order, generated on `workers` processes when more than one"""
+    if workers <= 1:
+        yield from map(generate_mock_job, jobs)
+        return
+    # Several small jobs per task keep IPC overhead down; ~4 tasks per worker balances uneven jobs
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_mock_worker,
+                             initargs=(spec, _seed, _compact, _compiled_cache_dir, profiler.enabled)) as executor:
+        if not profiler.enabled:
+            yield from executor.map(generate_mock_job, jobs, chunksize=chunksize)
+            return
+        # Workers send their schema times back with every result
+        for results, schema_times in executor.map(partial(call_with_schema_times, generate_mock_job), jobs, chunksize=chunksize):
+            profiler.merge_schema_times(schema_times)
+            yield results
+
+def main(spec: Optional[Spec] = None, use_cache: bool = True, seed: int = DEFAULT_SEED, jobs: int = 1,
+         mock_format: str = PRETTY_FORMAT) -> List[str]:
+    """Generate sample JSON files for all request and response schemas.
+
+    Returns the names of the generated mock files so later phases running in
+    the same process don't have to list the mock directories again. The mocks
+    are written in `mock_format` (see mock_bundle.py); the bundled formats put
+    them in a single file per target directory, under the same names. Without
+    `use_cache` the validators are compiled in memory instead of loaded from CACHE_DIR.
+    Every mock file is generated with an RNG derived from `seed` and its name,
+    so the same seed gives byte-identical mocks in any order or process. With
+    `jobs` > 1 schemas are sampled on that many worker processes; results are
+    written in the serial order, so the output is identical.
+    """
+    global _compiled_cache_dir, _seed, _compact
+    _compiled_cache_dir = CACHE_DIR if use_cache else None
+    ensure_loaded(spec)
+    if seed != _seed:
+        _seed = seed
+        _samples.clear()  # cached subtrees were generated from the previous seed
+    _compact = is_minified(mock_format)
+    bundle_filename = BUNDLE_FILENAMES.get(mock_format)
+    written_files: List[str] = []
+    bundled: List[Tuple[str, str]] = []
+    json_bytes = 0
+
+    def emit(filename: str, content: str) -> None:
+        nonlocal json_bytes
+        if bundle_filename:
+            bundled.append((filename, content))
+        else:
+            write_mock(filename, content)
+        written_files.append(filename)
+        json_bytes += len(content.encode("utf-8"))
     
     # Create target directories if they don't exist
     for _, directory in TARGET_DIRECTORIES:
         os.makedirs(directory, exist_ok=True)
     
-    # Clean up old response files (without _Success or _Error suffix)
-    print("🧹 Cleaning up old response files...")
-    total_removed = 0
-    for label, directory in TARGET_DIRECTORIES:
-        if os.path.exists(directory):
-            for filename in os.listdir(directory):
-                if filename.startswith("JsonRpcResponseFor") and filename.endswith(".json"):
-                    if not (filename.endswith("_Success.json") or filename.endswith("_Error.json")):
-                        filepath = os.path.join(directory, filename)
-                        os.remove(filepath)
-                        print(f"   Removed old file: {filename}")
-                        total_removed += 1
-    print()
+    all_jobs = mock_jobs()
+    request_response_count = sum(1 for section, _ in all_jobs if section == REQUEST_RESPONSE)
     
-    # Filter schemas to only request and response types
-    request_response_schemas = {
-        name: schema for name, schema in _components_schemas.items()
-        if is_request_or_response_schema(name)
-    }
-    
-    print(f"📋 Found {len(request_response_schemas)} request/response schemas")
+    print(f"📋 Found {request_response_count} request/response schemas")
     print(f"📁 Output directories:")
     for label, directory in TARGET_DIRECTORIES:
         print(f"   {label}: {directory}")
+    if jobs > 1:
+        print(f"⚙️  Sampling on {jobs} worker processes")
     print()
     
     success_count = 0
     failed_count = 0
+    standalone_success = 0
+    standalone_failed = 0
+    variant_success = 0
     
-    for schema_name in sorted(request_response_schemas.keys()):
-        swift_name = to_swift_type_name(schema_name)
-        
-        if is_response_schema(schema_name):
-            # Generate both success and error variants
-            for variant_type in ["result", "error"]:
-                suffix = "_Success" if variant_type == "result" else "_Error"
-                filename = f"{swift_name}{suffix}.json"
-                
-                sample = generate_response_variant(schema_name, variant_type)
-                
-                if sample:
-                    for label, directory in TARGET_DIRECTORIES:
-                        filepath = os.path.join(directory, filename)
-                        with open(filepath, "w", encoding="utf-8") as f:
-                            json.dump(sample, f, indent=2)
-                    print(f"✅ {filename}")
-                    success_count += 1
-                else:
-                    print(f"❌ Failed: {filename}")
-                    failed_count += 1
-        else:
-            # Regular request schema
-            filename = f"{swift_name}.json"
-            sample = generate_sample_for_schema(schema_name)
-            
-            # sample can be None for schemas that only allow null (e.g., enum: [null])
-            # Check if we successfully generated (not checking for truthiness)
-            if sample is not None or _components_schemas.get(schema_name, {}).get("enum") == [None]:
-                for label, directory in TARGET_DIRECTORIES:
-                    filepath = os.path.join(directory, filename)
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        json.dump(sample, f, indent=2)
+    # Compile (and cache) the validators once here rather than in every worker
+    prepare_sampling()
+    results = zip(all_jobs, generate_mock_jobs(all_jobs, jobs, _spec))
+    for _, mocks in islice(results, request_response_count):
+        for filename, content in mocks:
+            if content is not None:
+                emit(filename, content)
                 print(f"✅ {filename}")
                 success_count += 1
             else:
@@ -760,52 +1069,21 @@ def main():
     # Now generate standalone type mocks for better coverage
     print()
     print("📋 Generating standalone type mocks...")
+    print(f"   Found {len(all_jobs) - request_response_count} standalone types to generate")
     
-    standalone_schemas = {
-        name: schema for name, schema in _components_schemas.items()
-        if should_generate_standalone_mock(name, schema)
-    }
-    
-    print(f"   Found {len(standalone_schemas)} standalone types to generate")
-    
-    standalone_success = 0
-    standalone_failed = 0
-    variant_success = 0
-    
-    for schema_name in sorted(standalone_schemas.keys()):
-        swift_name = to_swift_type_name(schema_name)
-        schema = standalone_schemas[schema_name]
-        
-        # Check if this is a oneOf/anyOf type
-        if "oneOf" in schema or "anyOf" in schema:
-            # Generate samples for ALL variants
-            variants = generate_all_oneof_variants(schema_name, schema)
-            
-            if variants:
-                for variant_name, variant_sample in variants:
-                    filename = f"{variant_name}.json"
-                    for label, directory in TARGET_DIRECTORIES:
-                        filepath = os.path.join(directory, filename)
-                        with open(filepath, "w", encoding="utf-8") as f:
-                            json.dump(variant_sample, f, indent=2)
-                    print(f"✅ {filename}")
-                    variant_success += 1
-            else:
-                print(f"⚠️  No variants generated for: {swift_name}")
-        else:
-            # Regular type (struct, enum, etc.)
-            filename = f"{swift_name}.json"
-            sample = generate_sample_for_schema(schema_name)
-            
-            # sample can be None for schemas that only allow null (e.g., enum: [null])
-            # Check if we successfully generated (not checking for truthiness)
-            if sample is not None or _components_schemas.get(schema_name, {}).get("enum") == [None]:
-                for label, directory in TARGET_DIRECTORIES:
-                    filepath = os.path.join(directory, filename)
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        json.dump(sample, f, indent=2)
+    for (_, schema_name), mocks in results:
+        schema = _ir.schemas[schema_name]
+        is_union = "oneOf" in schema.raw or "anyOf" in schema.raw
+        if is_union and not mocks:
+            print(f"⚠️  No variants generated for: {schema.swift_name}")
+        for filename, content in mocks:
+            if content is not None:
+                emit(filename, content)
                 print(f"✅ {filename}")
-                standalone_success += 1
+                if is_union:
+                    variant_success += 1
+                else:
+                    standalone_success += 1
             else:
                 print(f"❌ Failed: {filename}")
                 standalone_failed += 1
@@ -813,12 +1091,26 @@ def main():
     print()
     print(f"✨ Standalone type generation complete! Generated {standalone_success} regular + {variant_success} variant files")
     
+    if jobs <= 1:
+        print(_samples.summary())  # workers keep their own caches
+
+    if bundle_filename:
+        data = encode_bundle(bundled, mock_format)
+        write_mock(bundle_filename, data)
+        print(f"📦 Bundled {len(bundled)} mocks into {bundle_filename} ({len(data):,} bytes)")
+
+    # Remove mocks from earlier runs that this run no longer produces
+    total_removed = remove_stale_mocks({bundle_filename} if bundle_filename else set(written_files))
+    if total_removed:
+        print(f"🧹 Removed {total_removed} stale mock files")
+    
     print()
     print(f"📊 Summary:")
     print(f"   Request/Response: {success_count} files")
     print(f"   Standalone types: {standalone_success} files")
     print(f"   OneOf/AnyOf variants: {variant_success} files")
     print(f"   Total: {success_count + standalone_success + variant_success} files")
+    print(f"   JSON: {json_bytes:,} bytes {mock_format} ({json_bytes // max(len(written_files), 1):,} per mock)")
     print()
     print("📂 Files saved to:")
     for label, directory in TARGET_DIRECTORIES:
@@ -827,6 +1119,56 @@ def main():
     print("🎉 All done! Mock JSON files are ready for testing.")
     print()
     print("💡 Variant files significantly improve coverage by testing all enum cases!")
+    return written_files
+
+def generate_fixtures(size: SizeClass, schema_names: Sequence[str] = BENCHMARK_SCHEMAS, spec: Optional[Spec] = None,
+                      use_cache: bool = True, seed: int = DEFAULT_SEED, output_dir: str = FIXTURES_DIR) -> List[str]:
+    """Write minified `size` class samples of `schema_names` to `output_dir` as
+    <SwiftName>_<size>.json fixtures for the decode benchmarks. Returns the
+    written file names."""
+    global _compiled_cache_dir, _seed
+    _compiled_cache_dir = CACHE_DIR if use_cache else None
+    ensure_loaded(spec)
+    if seed != _seed:
+        _seed = seed
+        _samples.clear()
+    previous = _size_class
+    set_size_class(size)
+    written_files: List[str] = []
+    try:
+        print(f"📏 Generating {size.name} fixtures in {output_dir}")
+        prepare_sampling()
+        for schema_name in schema_names:
+            if schema_name not in _ir.schemas:
+                print(f"❌ Unknown schema: {schema_name}")
+                continue
+            started = time.perf_counter()
+            with profiler.timed(SAMPLE, schema_name):
+                sample = generate_sample_for_schema(schema_name)
+                content = json.dumps(sample, separators=(",", ":"))
+            filename = f"{_ir.schemas[schema_name].swift_name}_{size.name}.json"
+            write_file(os.path.join(output_dir, filename), content)
+            written_files.append(filename)
+            elapsed = time.perf_counter() - started
+            print(f"✅ {filename}: {len(content):,} bytes in {elapsed:.2f}s")
+    finally:
+        set_size_class(previous)
+    return written_files
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate mock JSON files from the OpenAPI specification")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"seed for the generated values (default: {DEFAULT_SEED})")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N", help="number of worker processes (default: 1)")
+    parser.add_argument("--format", choices=MOCK_FORMATS, default=PRETTY_FORMAT,
+                        help=f"mock output format (default: {PRETTY_FORMAT}); see mock_bundle.py")
+    parser.add_argument("--size-class", choices=SIZE_CLASSES,
+                        help=f"instead of the mocks, write fixtures of this size class to {FIXTURES_DIR}")
+    parser.add_argument("--schema", action="append", metavar="NAME",
+                        help=f"schema to write a fixture of, repeatable (default: {', '.join(BENCHMARK_SCHEMAS)})")
+    args = parser.parse_args()
+    if args.size_class:
+        generate_fixtures(SIZE_CLASSES[args.size_class], args.schema or BENCHMARK_SCHEMAS, seed=args.seed)
+    else:
+        main(seed=args.seed, jobs=args.jobs, mock_format=args.format)
+    outputs.save_manifest()
+    print(outputs.stats.summary())
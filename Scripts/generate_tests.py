@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
-import json
 import os
-from typing import Dict, Any, List, Tuple, Set, Optional
+from typing import Dict, List, Set, Optional
+
+from decode_timing import (
+    TIMING_BASELINE, TIMING_DEFAULT_ITERATIONS, TIMING_ITERATIONS_ENV, TIMING_OUTPUT_ENV, TIMING_TEST_OUTPUT,
+)
+from mock_bundle import (
+    BINARY_FORMAT, BINARY_MAGIC, BUNDLE_FILENAMES, BUNDLE_FORMAT, BUNDLE_VERSION, PRETTY_FORMAT, bundle_filenames,
+)
+from openapi_spec import Spec, load_spec
+import outputs
+from outputs import remove_file, write_file
+from spec_ir import Method, SchemaNode, SpecIR, to_swift_type_name
 
-OPENAPI_PATH = "./openapi.json"
 MOCK_DIR_TYPES = "../Tests/NearJsonRpcTypesTests/Mock"
 MOCK_DIR_CLIENT = "../Tests/NearJsonRpcClientTests/Mock"
 
@@ -14,130 +23,241 @@ STANDALONE_TYPES_TEST_OUTPUT = "../Tests/NearJsonRpcTypesTests/StandaloneTypesTe
 ENHANCED_TEST_OUTPUT = "../Tests/NearJsonRpcTypesTests/EnhancedCoverageTests.swift"
 CLIENT_TEST_OUTPUT = "../Tests/NearJsonRpcClientTests/ClientTests.swift"
 CLIENT_METHOD_TEST_OUTPUT = "../Tests/NearJsonRpcClientTests/ClientMethodTests.swift"
+# Line width of the repo's .swiftformat, which generated code that is checked in keeps to
+SWIFT_MAX_WIDTH = 120
+# Loader of the mock bundle, emitted into every test target that has mocks
+MOCK_FIXTURES_OUTPUTS = [
+    "../Tests/NearJsonRpcTypesTests/MockFixtures.swift",
+    "../Tests/NearJsonRpcClientTests/MockFixtures.swift",
+]
 
 
-def to_swift_type_name(name: str) -> str:
-    """Convert schema name to Swift type name (PascalCase)"""
-    if not name:
-        return name
-    
-    if "_" in name:
-        parts = name.split("_")
-        processed_parts = []
-        for part in parts:
-            if part.islower():
-                processed_parts.append(part.capitalize())
-            else:
-                processed_parts.append(part)
-        return "".join(processed_parts)
-    
-    if name and name[0].islower():
-        return name[0].upper() + name[1:]
-    
-    return name
+def list_mock_files(mock_files: Optional[List[str]] = None) -> List[str]:
+    """Return the mock JSON file names, listing the mock directory (or the
+    mock bundle's index) only when they were not handed over by the mock
+    generation phase"""
+    if mock_files is not None:
+        return [f for f in mock_files if f.endswith('.json')]
+    if os.path.exists(MOCK_DIR_TYPES):
+        bundle_filename = BUNDLE_FILENAMES.get(detect_mock_format())
+        if bundle_filename:
+            return bundle_filenames(os.path.join(MOCK_DIR_TYPES, bundle_filename))
+        return [f for f in os.listdir(MOCK_DIR_TYPES) if f.endswith('.json')]
+    return []
 
 
-def to_swift_property_name(name: str) -> str:
-    """Convert property name to Swift property name (camelCase)"""
-    if "_" in name:
-        parts = name.split("_")
-        return parts[0].lower() + "".join(part.capitalize() for part in parts[1:])
-    if name.isupper() and len(name) > 1:
-        return name.lower()
-    return name[0].lower() + name[1:] if name else name
+def detect_mock_format() -> str:
+    """Format of the mocks on disk: the bundle's format if there is one,
+    otherwise PRETTY_FORMAT (minified files are loaded the same way)"""
+    for mock_format, filename in BUNDLE_FILENAMES.items():
+        if os.path.exists(os.path.join(MOCK_DIR_TYPES, filename)):
+            return mock_format
+    return PRETTY_FORMAT
+
+
+def mock_loader(bundle: bool) -> str:
+    """The `loadMockJSON` helper of a test type, reading the mock file from the
+    test bundle or serving it from the mock bundle"""
+    if bundle:
+        return """    /// Load mock JSON data from the mock bundle
+    func loadMockJSON(_ filename: String) throws -> Data {
+        try MockFixtures.data(named: filename)
+    }
+
+"""
+    return """    /// Load mock JSON data from file
+    func loadMockJSON(_ filename: String) throws -> Data {
+        let testBundle = Bundle.module
+        guard let url = testBundle.url(
+            forResource: filename.replacingOccurrences(of: ".json", with: ""),
+            withExtension: "json",
+            subdirectory: "Mock",
+        ) else {
+            throw NSError(
+                domain: "TestError",
+                code: 1,
+                userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"],
+            )
+        }
+        return try Data(contentsOf: url)
+    }
 
+"""
 
-def to_swift_function_name(rpc_method: str) -> str:
-    """Convert RPC method name to Swift function name (camelCase)"""
-    method_name = rpc_method
-    if method_name.startswith("rpc_"):
-        method_name = method_name[4:]
-    if method_name.startswith("EXPERIMENTAL_"):
-        method_name = "experimental_" + method_name[len("EXPERIMENTAL_"):]
-    return to_swift_property_name(method_name)
 
+def wrap_swift_call(prefix: str, arguments: List[str], indent: str) -> str:
+    """`prefix(arguments)` as a Swift statement line, wrapped the way the repo's
+    .swiftformat does when it is wider than SWIFT_MAX_WIDTH: one argument per
+    line with a trailing comma, array literal arguments split the same way"""
+    line = f"{indent}{prefix}({', '.join(arguments)})"
+    if len(line) <= SWIFT_MAX_WIDTH:
+        return line + "\n"
+    inner = indent + "    "
+    code = f"{indent}{prefix}(\n"
+    for argument in arguments:
+        if len(inner) + len(argument) + 1 > SWIFT_MAX_WIDTH and argument.startswith("[") and argument.endswith("]"):
+            code += f"{inner}[\n"
+            for element in argument[1:-1].split(", "):
+                code += f"{inner}    {element},\n"
+            code += f"{inner}],\n"
+        else:
+            code += f"{inner}{argument},\n"
+    return code + f"{indent})\n"
 
-def load_openapi() -> Dict[str, Any]:
-    """Load OpenAPI specification"""
-    if not os.path.exists(OPENAPI_PATH):
-        raise FileNotFoundError(f"{OPENAPI_PATH} not found")
-    with open(OPENAPI_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
 
+def generate_bundle_reader(mock_format: str) -> str:
+    """Swift that splits the bundle `data` into its header index and JSON body"""
+    if mock_format == BINARY_FORMAT:
+        magic = BINARY_MAGIC.decode("ascii")
+        return f"""        return try data.withUnsafeBytes {{ raw in
+            var position = 0
+            func read<T: FixedWidthInteger>(_: T.Type) throws -> T {{
+                guard position + MemoryLayout<T>.size <= raw.count else {{
+                    throw fixtureError("Truncated mock bundle")
+                }}
+                defer {{ position += MemoryLayout<T>.size }}
+                return T(littleEndian: raw.loadUnaligned(fromByteOffset: position, as: T.self))
+            }}
+            let magic = Array("{magic}".utf8)
+            guard raw.count >= magic.count, Array(raw[0 ..< magic.count]) == magic else {{
+                throw fixtureError("Not a binary mock bundle")
+            }}
+            position = magic.count
+            let version = try read(UInt32.self)
+            guard version == {BUNDLE_VERSION} else {{
+                throw fixtureError("Unsupported mock bundle version \\(version)")
+            }}
+            let count = try read(UInt32.self)
+            var index: [String: Range<Int>] = [:]
+            index.reserveCapacity(Int(count))
+            for _ in 0 ..< count {{
+                let nameLength = try Int(read(UInt16.self))
+                guard position + nameLength <= raw.count else {{
+                    throw fixtureError("Truncated mock bundle")
+                }}
+                let name = String(decoding: raw[position ..< position + nameLength], as: UTF8.self)
+                position += nameLength
+                let offset = try Int(read(UInt32.self))
+                let length = try Int(read(UInt32.self))
+                index[name] = offset ..< offset + length
+            }}
+            return Store(body: data.subdata(in: data.startIndex + position ..< data.endIndex), index: index)
+        }}"""
+    return f"""        guard let newline = data.firstIndex(of: UInt8(ascii: "\\n")) else {{
+            throw fixtureError("Mock bundle has no header line")
+        }}
+        let header = try JSONDecoder().decode(Header.self, from: data.subdata(in: data.startIndex ..< newline))
+        guard header.format == "{BUNDLE_FORMAT}", header.version == {BUNDLE_VERSION} else {{
+            throw fixtureError("Unsupported mock bundle: \\(header.format) v\\(header.version)")
+        }}
+        var index: [String: Range<Int>] = [:]
+        index.reserveCapacity(header.index.count)
+        for (name, span) in header.index where span.count == 2 {{
+            index[name] = span[0] ..< span[0] + span[1]
+        }}
+        return Store(body: data.subdata(in: data.index(after: newline) ..< data.endIndex), index: index)"""
 
-def extract_method_info(openapi: Dict[str, Any]) -> List[Tuple[str, str, str, str, str]]:
-    """Extract method information from OpenAPI spec
-    Returns: List of (method_name, swift_function_name, request_type, response_type, result_type)
-    """
-    methods = []
-    paths = openapi.get("paths", {})
-    
-    for path, path_item in paths.items():
-        if "post" not in path_item:
-            continue
-        
-        post_op = path_item["post"]
-        method_name = path.lstrip("/")
-        swift_function_name = to_swift_function_name(method_name)
-        
-        # Get request type from requestBody
-        request_type = None
-        if "requestBody" in post_op:
-            content = post_op["requestBody"].get("content", {})
-            json_content = content.get("application/json", {})
-            schema = json_content.get("schema", {})
-            if "$ref" in schema:
-                request_type = schema["$ref"].split("/")[-1]
-        
-        # Get response type from responses
-        response_type = None
-        result_type = None
-        if "responses" in post_op:
-            success_response = post_op["responses"].get("200", {})
-            content = success_response.get("content", {})
-            json_content = content.get("application/json", {})
-            schema = json_content.get("schema", {})
-            if "$ref" in schema:
-                response_type = schema["$ref"].split("/")[-1]
-                
-                # Extract the result type from response schema
-                schemas = openapi.get("components", {}).get("schemas", {})
-                response_schema = schemas.get(response_type, {})
-                
-                # Check if it's a oneOf response (result or error)
-                if "oneOf" in response_schema:
-                    for variant in response_schema["oneOf"]:
-                        if "$ref" in variant:
-                            continue
-                        props = variant.get("properties", {})
-                        if "result" in props:
-                            result_ref = props["result"].get("$ref", "")
-                            if result_ref:
-                                result_type = result_ref.split("/")[-1]
-                            else:
-                                result_schema = props["result"]
-                                result_type = result_schema.get("type", "Any")
-                            break
-        
-        if request_type and response_type:
-            methods.append((method_name, swift_function_name, request_type, response_type, result_type or "Unknown"))
-    
-    return methods
-
-
-def extract_all_type_names(openapi: Dict[str, Any]) -> Dict[str, str]:
+
+def generate_mock_fixtures(mock_format: str) -> str:
+    """Generate the loader serving fixtures from the mock bundle (see mock_bundle.py)"""
+    bundle_filename = BUNDLE_FILENAMES[mock_format]
+    name, extension = os.path.splitext(bundle_filename)
+    if mock_format == BINARY_FORMAT:
+        layout = """/// The bundle starts with a binary index mapping each mock name to the byte
+/// offset and length of its JSON after the index."""
+        header = ""
+    else:
+        layout = """/// The bundle's first line is a JSON header whose index maps each mock name to
+/// the byte offset and length of its JSON after the header."""
+        header = """    private struct Header: Decodable {
+        let format: String
+        let version: Int
+        let index: [String: [Int]]
+    }
+
+"""
+    return f"""
+import Foundation
+
+/// Mock fixtures served from the single Mock/{bundle_filename} bundle.
+///
+{layout} The file is read
+/// once, on first use, and every fixture is a slice of that buffer.
+enum MockFixtures {{
+{header}    private struct Store: Sendable {{
+        let body: Data
+        let index: [String: Range<Int>]
+    }}
+
+    private static let store: Result<Store, any Error> = Result {{ try load() }}
+
+    /// JSON data of the mock with the given file name
+    static func data(named filename: String) throws -> Data {{
+        let bundle = try store.get()
+        let name = filename.replacingOccurrences(of: ".json", with: "")
+        guard let span = bundle.index[name] else {{
+            throw fixtureError("Mock file not found: \\(filename)")
+        }}
+        let start = bundle.body.startIndex
+        return bundle.body.subdata(in: start + span.lowerBound ..< start + span.upperBound)
+    }}
+
+    private static func load() throws -> Store {{
+        guard let url = Bundle.module.url(forResource: "{name}", withExtension: "{extension[1:]}", subdirectory: "Mock") else {{
+            throw fixtureError("Mock bundle not found: {bundle_filename}")
+        }}
+        let data = try Data(contentsOf: url, options: .mappedIfSafe)
+{generate_bundle_reader(mock_format)}
+    }}
+
+    private static func fixtureError(_ message: String) -> NSError {{
+        NSError(domain: "TestError", code: 1, userInfo: [NSLocalizedDescriptionKey: message])
+    }}
+}}
+"""
+
+
+def client_test_methods(ir: SpecIR) -> List[Method]:
+    """Methods whose request and response envelopes are named components, sorted by RPC method"""
+    methods = [
+        method for method in ir.methods
+        if method.request is not None and method.request.name
+        and method.response is not None and method.response.name
+    ]
+    return sorted(methods, key=lambda method: method.rpc_method)
+
+
+def is_decode_timed(node: SchemaNode) -> bool:
+    """Whether decoding `node` exercises generated code: objects and unions, not typealiases"""
+    return node.type == "object" or bool(node.properties) or node.union is not None or bool(node.all_of)
+
+
+def result_types(ir: SpecIR) -> List[str]:
+    """Swift names of the component result types of the RPC methods, sorted"""
+    names = {ir.responses[method.response_type].result_type for method in client_test_methods(ir)}
+    return sorted(name for name in names if name in ir.by_swift_name and is_decode_timed(ir.by_swift_name[name]))
+
+
+def type_mocks(type_name: str, mock_files: List[str]) -> List[str]:
+    """Mock files of `type_name`: its own mock, or one per union variant"""
+    if f"{type_name}.json" in mock_files:
+        return [f"{type_name}.json"]
+    return sorted(f for f in mock_files if f.startswith(f"{type_name}_Variant"))
+
+
+def extract_all_type_names(ir: SpecIR) -> Dict[str, str]:
     """Extract all type names from OpenAPI schemas and categorize them.
     Returns a dict mapping type_name -> category (enum, struct, typealias, etc.)
     """
-    schemas = openapi.get("components", {}).get("schemas", {})
     types = {}
     
-    for schema_name, schema in schemas.items():
+    for schema_name, node in ir.schemas.items():
         # Skip request/response types as they're tested separately
         if schema_name.startswith("JsonRpcRequest") or schema_name.startswith("JsonRpcResponse"):
             continue
             
-        swift_name = to_swift_type_name(schema_name)
+        schema = node.raw
+        swift_name = node.swift_name
         
         # Determine type category
         if "enum" in schema and isinstance(schema.get("enum"), list):
@@ -160,13 +280,11 @@ def extract_all_type_names(openapi: Dict[str, Any]) -> Dict[str, str]:
     return types
 
 
-def generate_types_tests(openapi: Dict[str, Any]) -> str:
+def generate_types_tests(ir: SpecIR, mock_files: Optional[List[str]] = None, bundle: bool = False) -> str:
     """Generate tests for type encoding/decoding"""
     
     # Get all mock JSON files
-    mock_files = []
-    if os.path.exists(MOCK_DIR_TYPES):
-        mock_files = [f for f in os.listdir(MOCK_DIR_TYPES) if f.endswith('.json')]
+    mock_files = list_mock_files(mock_files)
     
     code = """
 import Testing
@@ -188,16 +306,7 @@ struct TypesDecodingTests {
         encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
     }
     
-    /// Load mock JSON data from file
-    func loadMockJSON(_ filename: String) throws -> Data {
-        let testBundle = Bundle.module
-        guard let url = testBundle.url(forResource: filename.replacingOccurrences(of: ".json", with: ""), withExtension: "json", subdirectory: "Mock") else {
-            throw NSError(domain: "TestError", code: 1, userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"])
-        }
-        return try Data(contentsOf: url)
-    }
-    
-"""
+""" + mock_loader(bundle)
     
     # Generate test for each request type
     request_files = sorted([f for f in mock_files if f.startswith('JsonRpcRequestFor')])
@@ -295,7 +404,7 @@ struct TypesDecodingTests {
 # STANDALONE TYPES TESTS GENERATOR
 # =============================================================================
 
-def generate_standalone_types_tests(openapi: Dict[str, Any]) -> str:
+def generate_standalone_types_tests(ir: SpecIR, mock_files: Optional[List[str]] = None, bundle: bool = False) -> str:
     """Generate tests for standalone types (not just request/response)"""
     
     code = """
@@ -318,23 +427,12 @@ struct StandaloneTypesTests {
         encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
     }
     
-    /// Load mock JSON data from file
-    func loadMockJSON(_ filename: String) throws -> Data {
-        let testBundle = Bundle.module
-        guard let url = testBundle.url(forResource: filename.replacingOccurrences(of: ".json", with: ""), withExtension: "json", subdirectory: "Mock") else {
-            throw NSError(domain: "TestError", code: 1, userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"])
-        }
-        return try Data(contentsOf: url)
-    }
-    
-"""
+""" + mock_loader(bundle)
     
-    types = extract_all_type_names(openapi)
+    types = extract_all_type_names(ir)
     
     # Check which types have mock files (including variants)
-    mock_files = set()
-    if os.path.exists(MOCK_DIR_TYPES):
-        mock_files = {f.replace('.json', '') for f in os.listdir(MOCK_DIR_TYPES) if f.endswith('.json')}
+    mock_files = {f.replace('.json', '') for f in list_mock_files(mock_files)}
     
     test_count = 0
     variant_test_count = 0
@@ -392,11 +490,92 @@ struct StandaloneTypesTests {
     return code
 
 
+# =============================================================================
+# DECODE TIMING HARNESS GENERATOR
+# =============================================================================
+
+def generate_timing_tests(ir: SpecIR, mock_files: Optional[List[str]] = None, bundle: bool = False) -> str:
+    """Generate the decode timing harness compared against TIMING_BASELINE by perf_gate.py"""
+    mock_files = list_mock_files(mock_files)
+
+    code = f"""import Foundation
+@testable import NearJsonRpcTypes
+import Testing
+
+/// Median decode times of the RPC result types over their mocks.
+///
+/// Only runs when {TIMING_OUTPUT_ENV} names the JSON file to write the timings to
+/// ({TIMING_ITERATIONS_ENV} sets the iterations, default {TIMING_DEFAULT_ITERATIONS}). Compare them with
+/// {os.path.basename(TIMING_BASELINE)} using Scripts/perf_gate.py.
+@Suite("Decode Timing", .enabled(if: ProcessInfo.processInfo.environment["{TIMING_OUTPUT_ENV}"] != nil))
+struct DecodeTimingTests {{
+    /// Timings written to {TIMING_OUTPUT_ENV}, in nanoseconds per decode of a type's mocks
+    struct Timings: Codable {{
+        let iterations: Int
+        let medians: [String: UInt64]
+    }}
+
+    let decoder: JSONDecoder
+
+    init() {{
+        decoder = JSONDecoder()
+        decoder.keyDecodingStrategy = .convertFromSnakeCase
+    }}
+
+""" + mock_loader(bundle) + f"""    /// Median time in nanoseconds to decode all of `fixtures` as `T`
+    func medianDecodeTime<T: Decodable>(_: T.Type, _ fixtures: [String], iterations: Int) throws -> UInt64 {{
+        let data = try fixtures.map {{ try loadMockJSON($0) }}
+        for fixture in data {{
+            _ = try decoder.decode(T.self, from: fixture)
+        }}
+        var times: [UInt64] = []
+        times.reserveCapacity(iterations)
+        for _ in 0 ..< iterations {{
+            let start = DispatchTime.now().uptimeNanoseconds
+            for fixture in data {{
+                _ = try decoder.decode(T.self, from: fixture)
+            }}
+            times.append(DispatchTime.now().uptimeNanoseconds - start)
+        }}
+        times.sort()
+        return times[times.count / 2]
+    }}
+
+    @Test("Record decode timings of the RPC result types")
+    func recordDecodeTimings() throws {{
+        let environment = ProcessInfo.processInfo.environment
+        let path = try #require(environment["{TIMING_OUTPUT_ENV}"])
+        let iterations = max(Int(environment["{TIMING_ITERATIONS_ENV}"] ?? "") ?? {TIMING_DEFAULT_ITERATIONS}, 1)
+        var medians: [String: UInt64] = [:]
+"""
+    timed = 0
+    for type_name in result_types(ir):
+        fixtures = type_mocks(type_name, mock_files)
+        if not fixtures:
+            continue
+        fixture_list = ", ".join(f'"{f}"' for f in fixtures)
+        code += wrap_swift_call(
+            f'medians["{type_name}"] = try medianDecodeTime',
+            [f"{type_name}.self", f"[{fixture_list}]", "iterations: iterations"],
+            "        ",
+        )
+        timed += 1
+    code += """
+        let encoder = JSONEncoder()
+        encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
+        try encoder.encode(Timings(iterations: iterations, medians: medians)).write(to: URL(fileURLWithPath: path))
+    }
+}
+"""
+    print(f"   Timing {timed} result types")
+    return code
+
+
 # =============================================================================
 # ENHANCED COVERAGE TESTS GENERATOR
 # =============================================================================
 
-def generate_enhanced_tests(openapi: Dict[str, Any]) -> str:
+def generate_enhanced_tests(ir: SpecIR, mock_files: Optional[List[str]] = None, bundle: bool = False) -> str:
     """Generate enhanced tests for better coverage"""
     
     code = """
@@ -419,29 +598,16 @@ struct EnhancedCoverageTests {
         encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
     }
     
-    /// Load mock JSON data from file
-    func loadMockJSON(_ filename: String) throws -> Data {
-        let testBundle = Bundle.module
-        guard let url = testBundle.url(forResource: filename.replacingOccurrences(of: ".json", with: ""), withExtension: "json", subdirectory: "Mock") else {
-            throw NSError(domain: "TestError", code: 1, userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"])
-        }
-        return try Data(contentsOf: url)
-    }
-    
-"""
-    
-    schemas = openapi.get("components", {}).get("schemas", {})
+""" + mock_loader(bundle)
     
     # Get all standalone types (exclude request/response)
     standalone_schemas = {
-        name: schema for name, schema in schemas.items()
+        name: schema for name, schema in ir.schemas.items()
         if not (name.startswith("JsonRpcRequest") or name.startswith("JsonRpcResponse"))
     }
     
     # Get available mock files
-    mock_files = set()
-    if os.path.exists(MOCK_DIR_TYPES):
-        mock_files = {f.replace('.json', '') for f in os.listdir(MOCK_DIR_TYPES) if f.endswith('.json')}
+    mock_files = {f.replace('.json', '') for f in list_mock_files(mock_files)}
     
     test_count = 0
     variant_test_count = 0
@@ -450,8 +616,9 @@ struct EnhancedCoverageTests {
     skip_types = {"RpcError", "RpcClientConfigResponse"}
     
     for schema_name in sorted(standalone_schemas.keys()):
-        schema = standalone_schemas[schema_name]
-        swift_name = to_swift_type_name(schema_name)
+        node = standalone_schemas[schema_name]
+        schema = node.raw
+        swift_name = node.swift_name
         
         if swift_name in skip_types:
             continue
@@ -509,7 +676,7 @@ struct EnhancedCoverageTests {
     return code
 
 
-def generate_client_tests(methods: List[Tuple[str, str, str, str, str]]) -> str:
+def generate_client_tests(methods: List[Method], bundle: bool = False) -> str:
     """Generate tests for client methods"""
     
     code = """
@@ -531,50 +698,44 @@ struct ClientTests {
         decoder.keyDecodingStrategy = .convertFromSnakeCase
     }
     
-    /// Load mock JSON data from file
-    func loadMockJSON(_ filename: String) throws -> Data {
-        let testBundle = Bundle.module
-        guard let url = testBundle.url(forResource: filename.replacingOccurrences(of: ".json", with: ""), withExtension: "json", subdirectory: "Mock") else {
-            throw NSError(domain: "TestError", code: 1, userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"])
-        }
-        return try Data(contentsOf: url)
-    }
-    
-"""
+""" + mock_loader(bundle)
     
     # Generate test for each method
-    for method_name, swift_function_name, request_type, response_type, result_type in sorted(methods):
+    for method in methods:
+        method_name = method.rpc_method
+        request_swift = method.request.swift_name
+        response_swift = method.response.swift_name
         # Test request and success response
         test_name_success = f"test{to_swift_type_name(method_name)}RequestAndSuccessResponse"
-        request_file = f"{to_swift_type_name(request_type)}.json"
-        response_success_file = f"{to_swift_type_name(response_type)}_Success.json"
+        request_file = f"{request_swift}.json"
+        response_success_file = f"{response_swift}_Success.json"
         
         code += f"""    @Test("{method_name} request and success response types are valid")
     func {test_name_success}() throws {{
         // Test request type decoding
         let requestData = try loadMockJSON("{request_file}")
-        _ = try decoder.decode({to_swift_type_name(request_type)}.self, from: requestData)
+        _ = try decoder.decode({request_swift}.self, from: requestData)
         
         // Test success response type decoding
         let responseData = try loadMockJSON("{response_success_file}")
-        _ = try decoder.decode({to_swift_type_name(response_type)}.self, from: responseData)
+        _ = try decoder.decode({response_swift}.self, from: responseData)
     }}
     
 """
         
         # Test request and error response
         test_name_error = f"test{to_swift_type_name(method_name)}RequestAndErrorResponse"
-        response_error_file = f"{to_swift_type_name(response_type)}_Error.json"
+        response_error_file = f"{response_swift}_Error.json"
         
         code += f"""    @Test("{method_name} request and error response types are valid")
     func {test_name_error}() throws {{
         // Test request type decoding
         let requestData = try loadMockJSON("{request_file}")
-        _ = try decoder.decode({to_swift_type_name(request_type)}.self, from: requestData)
+        _ = try decoder.decode({request_swift}.self, from: requestData)
         
         // Test error response type decoding
         let responseData = try loadMockJSON("{response_error_file}")
-        _ = try decoder.decode({to_swift_type_name(response_type)}.self, from: responseData)
+        _ = try decoder.decode({response_swift}.self, from: responseData)
     }}
     
 """
@@ -649,7 +810,7 @@ def generate_mock_url_protocol_class() -> str:
 """
 
 
-def generate_test_utilities() -> str:
+def generate_test_utilities(bundle: bool = False) -> str:
     """Generate utility functions for tests"""
     return '''
 // MARK: - Test Utilities
@@ -663,23 +824,7 @@ extension ClientMethodTests {
         return URLSession(configuration: configuration)
     }
     
-    /// Load mock JSON data from file
-    func loadMockJSON(_ filename: String) throws -> Data {
-        let testBundle = Bundle.module
-        guard let url = testBundle.url(
-            forResource: filename.replacingOccurrences(of: ".json", with: ""),
-            withExtension: "json",
-            subdirectory: "Mock"
-        ) else {
-            throw NSError(
-                domain: "TestError",
-                code: 1,
-                userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \\(filename)"]
-            )
-        }
-        return try Data(contentsOf: url)
-    }
-    
+''' + mock_loader(bundle) + '''
     /// Create a mock HTTP response
     func createHTTPResponse(statusCode: Int = 200) -> HTTPURLResponse {
         return HTTPURLResponse(
@@ -754,13 +899,13 @@ extension ClientMethodTests {
 '''
 
 
-def generate_method_test(method_name: str, swift_function_name: str, 
-                         request_type: str, response_type: str, result_type: str) -> str:
+def generate_method_test(method: Method) -> str:
     """Generate a comprehensive test for a single method"""
     
-    # Convert types to Swift names
-    request_swift = to_swift_type_name(request_type)
-    response_swift = to_swift_type_name(response_type)
+    method_name = method.rpc_method
+    swift_function_name = method.swift_method
+    request_swift = method.request.swift_name
+    response_swift = method.response.swift_name
     swift_method_name = to_swift_type_name(method_name)
     
     test_name = f"test{swift_function_name.capitalize()}"
@@ -866,7 +1011,7 @@ def generate_method_test(method_name: str, swift_function_name: str,
 '''
 
 
-def generate_client_method_tests(methods: List[Tuple[str, str, str, str, str]]) -> str:
+def generate_client_method_tests(methods: List[Method], bundle: bool = False) -> str:
     """Generate comprehensive tests for all client methods"""
     
     code = """
@@ -901,75 +1046,92 @@ struct ClientMethodTests {
 """
     
     # Add individual method tests
-    for method_name, swift_function_name, request_type, response_type, result_type in sorted(methods):
-        code += generate_method_test(method_name, swift_function_name, request_type, response_type, result_type)
+    for method in methods:
+        code += generate_method_test(method)
     
     code += "}\n"
     
     # Add test utilities (at file scope, as extension)
-    code += generate_test_utilities()
+    code += generate_test_utilities(bundle)
     
     return code
 
 
-def main():
-    print("🔄 Loading OpenAPI specification...")
-    openapi = load_openapi()
+def main(spec: Optional[Spec] = None, mock_files: Optional[List[str]] = None, mock_format: Optional[str] = None):
+    """Generate the Swift test files for mocks written in `mock_format` (by
+    default, whatever is on disk). For the bundled formats the tests load their
+    mocks through a MockFixtures loader of the bundle."""
+    if spec is None:
+        print("🔄 Loading OpenAPI specification...")
+        spec = load_spec()
+    ir = spec.ir
+    if mock_format is None:
+        mock_format = detect_mock_format()
+    bundle = mock_format in BUNDLE_FILENAMES
     
     print("🔄 Extracting method information...")
-    methods = extract_method_info(openapi)
+    methods = client_test_methods(ir)
     print(f"   Found {len(methods)} methods")
     print()
     
     # Generate Types Tests
     print("📝 Generating type decoding tests...")
-    types_tests = generate_types_tests(openapi)
+    types_tests = generate_types_tests(ir, mock_files, bundle)
     
-    os.makedirs(os.path.dirname(TYPES_TEST_OUTPUT), exist_ok=True)
-    with open(TYPES_TEST_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(types_tests)
+    write_file(TYPES_TEST_OUTPUT, types_tests)
     print(f"   ✅ {TYPES_TEST_OUTPUT}")
     print()
     
     print("📝 Generating standalone type tests...")
-    standalone_tests = generate_standalone_types_tests(openapi)
+    standalone_tests = generate_standalone_types_tests(ir, mock_files, bundle)
     
-    os.makedirs(os.path.dirname(STANDALONE_TYPES_TEST_OUTPUT), exist_ok=True)
-    with open(STANDALONE_TYPES_TEST_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(standalone_tests)
+    write_file(STANDALONE_TYPES_TEST_OUTPUT, standalone_tests)
     print(f"   ✅ {STANDALONE_TYPES_TEST_OUTPUT}")
     print()
     
     # Generate Enhanced Coverage Tests
     print("📝 Generating enhanced coverage tests...")
-    enhanced_tests = generate_enhanced_tests(openapi)
+    enhanced_tests = generate_enhanced_tests(ir, mock_files, bundle)
     
-    os.makedirs(os.path.dirname(ENHANCED_TEST_OUTPUT), exist_ok=True)
-    with open(ENHANCED_TEST_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(enhanced_tests)
+    write_file(ENHANCED_TEST_OUTPUT, enhanced_tests)
     print(f"   ✅ {ENHANCED_TEST_OUTPUT}")
     print()
     
+    print("📝 Generating decode timing harness...")
+    timing_tests = generate_timing_tests(ir, mock_files, bundle)
+    
+    write_file(TIMING_TEST_OUTPUT, timing_tests)
+    print(f"   ✅ {TIMING_TEST_OUTPUT}")
+    print()
+    
     # Generate Client Tests
     print("📝 Generating client tests...")
-    client_tests = generate_client_tests(methods)
+    client_tests = generate_client_tests(methods, bundle)
     
-    os.makedirs(os.path.dirname(CLIENT_TEST_OUTPUT), exist_ok=True)
-    with open(CLIENT_TEST_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(client_tests)
+    write_file(CLIENT_TEST_OUTPUT, client_tests)
     print(f"   ✅ {CLIENT_TEST_OUTPUT}")
     print()
     
     print("📝 Generating client method tests...")
-    client_method_tests = generate_client_method_tests(methods)
+    client_method_tests = generate_client_method_tests(methods, bundle)
     
-    os.makedirs(os.path.dirname(CLIENT_METHOD_TEST_OUTPUT), exist_ok=True)
-    with open(CLIENT_METHOD_TEST_OUTPUT, "w", encoding="utf-8") as f:
-        f.write(client_method_tests)
+    write_file(CLIENT_METHOD_TEST_OUTPUT, client_method_tests)
     print(f"   ✅ {CLIENT_METHOD_TEST_OUTPUT}")
     print(f"   Generated {len(methods) * 3} tests ({len(methods)} methods × 3 test cases each)")
     print()
     
+    if bundle:
+        print("📝 Generating mock bundle loaders...")
+        mock_fixtures = generate_mock_fixtures(mock_format)
+        for path in MOCK_FIXTURES_OUTPUTS:
+            write_file(path, mock_fixtures)
+            print(f"   ✅ {path}")
+        print()
+    else:
+        for path in MOCK_FIXTURES_OUTPUTS:
+            if os.path.exists(path):
+                remove_file(path)
+    
     # Summary
     print("✨ Test generation complete!")
     print()
@@ -977,8 +1139,12 @@ def main():
     print(f"   • {TYPES_TEST_OUTPUT}")
     print(f"   • {STANDALONE_TYPES_TEST_OUTPUT}")
     print(f"   • {ENHANCED_TEST_OUTPUT}")
+    print(f"   • {TIMING_TEST_OUTPUT}")
     print(f"   • {CLIENT_TEST_OUTPUT}")
     print(f"   • {CLIENT_METHOD_TEST_OUTPUT}")
+    if bundle:
+        for path in MOCK_FIXTURES_OUTPUTS:
+            print(f"   • {path}")
     print()
     print("📋 Test coverage includes:")
     print("   • Request/response type encoding/decoding")
@@ -997,3 +1163,5 @@ def main():
 
 if __name__ == "__main__":
     main()
+    outputs.save_manifest()
+    print(outputs.stats.summary())
@@ -1,12 +1,30 @@
 import json
 import os
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-OPENAPI_PATH = "./openapi.json"
+from fragment_cache import FragmentCache
+from openapi_spec import Spec, load_spec
+import outputs
+from outputs import write_file
+from profiling import EMIT, call_with_schema_times, profiler
+from ref_graph import RefGraph
+from spec_ir import Property, SchemaNode, SpecIR, to_swift_property_name, to_swift_type_name
+from swift_writer import ShardedSwiftWriter, SwiftWriter, remove_stale_shards
+from type_shards import SHARD_FILE_PREFIX, ShardMode, shard_for
+
 OUTPUT_PATH = "../Sources/NearJsonRpcTypes/Types.swift"
 METHODS_OUTPUT_PATH = "../Sources/NearJsonRpcClient/Methods.swift"
 
+# Inline objects used to share one struct named InlineObject, which had the
+# properties of the last one emitted. The name stays as a deprecated alias of
+# the inline object with exactly those properties while only one has them
+LEGACY_INLINE_OBJECT_NAME = "InlineObject"
+LEGACY_INLINE_OBJECT_PROPERTIES = ("account_id",)
+
 SWIFT_RESERVED_KEYWORDS = {
     "protocol", "class", "struct", "enum", "func", "var", "let", "if", "else", 
     "for", "while", "return", "break", "continue", "default", "case", "switch", 
@@ -88,7 +106,7 @@ struct AnyCodingKey: CodingKey {
 """
 
 DECODING_DIAGNOSTICS_CODE = """// MARK: - Decoding Diagnostics Helpers
-fileprivate func describeCodingKey(_ key: CodingKey) -> String {
+func describeCodingKey(_ key: CodingKey) -> String {
     if let intValue = key.intValue {
         return "[\\(intValue)]"
     }
@@ -96,7 +114,7 @@ fileprivate func describeCodingKey(_ key: CodingKey) -> String {
     return stringValue.isEmpty ? "\\\"\\\"" : stringValue
 }
 
-fileprivate func describeCodingPath(_ codingPath: [CodingKey]) -> String {
+func describeCodingPath(_ codingPath: [CodingKey]) -> String {
     guard !codingPath.isEmpty else { return "<root>" }
     var description = ""
     for key in codingPath {
@@ -112,7 +130,7 @@ fileprivate func describeCodingPath(_ codingPath: [CodingKey]) -> String {
     return description
 }
 
-fileprivate func describeDecodingError(_ error: Error) -> String {
+func describeDecodingError(_ error: Error) -> String {
     if let decodingError = error as? DecodingError {
         switch decodingError {
         case .typeMismatch(_, let context):
@@ -133,24 +151,17 @@ fileprivate func describeDecodingError(_ error: Error) -> String {
 """
 
 
-def load_openapi() -> Dict[str, Any]:
-    if not os.path.exists(OPENAPI_PATH):
-        raise FileNotFoundError(f"{OPENAPI_PATH} not found")
-    with open(OPENAPI_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
 def escape_swift_keyword(property_name: str) -> str:
     """Escape Swift reserved keywords by wrapping in backticks"""
     if property_name in SWIFT_RESERVED_KEYWORDS:
         return f"`{property_name}`"
     return property_name
 
-def is_discriminator_field(prop_name: str, prop_schema: Dict[str, Any]) -> bool:
+def is_discriminator_field(prop_name: str, prop_schema: SchemaNode) -> bool:
     """Check if a property is a discriminator field (single-value enum)"""
     # Check if this is a single-value enum used as a discriminator
-    if "enum" in prop_schema and prop_schema.get("type") == "string":
-        enum_values = prop_schema["enum"]
+    if prop_schema.enum is not None and prop_schema.type == "string":
+        enum_values = prop_schema.enum
         if len(enum_values) == 1 and enum_values[0] is not None:
             # Common discriminator field names
             discriminator_patterns = ["type", "request_type", "changes_type", "kind"]
@@ -162,10 +173,7 @@ def get_discriminator_enum_type(prop_name: str) -> str:
     return to_swift_type_name(prop_name)
 
 def process_property_for_struct(
-    prop_name: str, 
-    prop_schema: Dict[str, Any], 
-    required: Set[str], 
-    components: Dict[str, Any],
+    prop: Property,
     context: str = "",
     generated_types: Optional[Set[str]] = None,
     inline_types: Optional[Dict[str, str]] = None
@@ -177,26 +185,21 @@ def process_property_for_struct(
     generated_types = generated_types or set()
     inline_types = inline_types or {}
     
-    swift_prop_name = to_swift_property_name(prop_name)
-    swift_prop_name = escape_swift_keyword(swift_prop_name)
+    prop_name = prop.name
+    prop_schema = prop.schema
+    swift_prop_name = escape_swift_keyword(prop.swift_name)
     
     # Check if this is a discriminator field - if so, use the generated enum type
     if is_discriminator_field(prop_name, prop_schema):
         prop_type = get_discriminator_enum_type(prop_name)
-    elif context and generated_types and inline_types:
-        prop_type = get_swift_type(prop_schema, components, context=context, generated_types=generated_types, inline_types=inline_types)
+    elif context:
+        prop_type = get_swift_type(prop_schema, context=context, generated_types=generated_types, inline_types=inline_types)
     else:
-        prop_type = get_swift_type(prop_schema, components)
+        prop_type = get_swift_type(prop_schema)
     
     # Check if nullable or optional
-    is_nullable = prop_schema.get("nullable", False)
-    is_required = prop_name in required
-    
-    # Handle nullable in resolved refs
-    if "$ref" in prop_schema and not is_nullable:
-        ref_schema = resolve_ref_schema(prop_schema["$ref"], components.get("schemas", {}))
-        if ref_schema and ref_schema.get("nullable", False):
-            is_nullable = True
+    is_nullable = prop_schema.nullable
+    is_required = prop.required
     
     # Make optional if not required or if nullable
     if not is_required or is_nullable:
@@ -222,103 +225,15 @@ def generate_coding_keys_section(property_mappings: Dict[str, str], all_properti
     # Only generate if there are escaped keywords or other special cases
     return ""
 
-def ensure_unique_type_name(name: str, generated_types: Set[str]) -> str:
-    """Ensure a type name is unique by adding suffix if needed"""
-    swift_name = to_swift_type_name(name)
-    original_swift_name = swift_name
-    
-    if swift_name in generated_types:
-        counter = 2
-        while swift_name in generated_types:
-            swift_name = f"{original_swift_name}{counter}"
-            counter += 1
-    
-    return swift_name
-
-def register_generated_type(swift_name: str, generated_types: Set[str]) -> bool:
-    """Register a type as generated. Returns True if successfully added, False if already exists"""
-    if swift_name in generated_types:
-        return False
-    generated_types.add(swift_name)
-    return True
-
-
-def to_swift_type_name(name: str) -> str:
-    """Convert schema name to Swift type name (PascalCase)"""
-    if not name:
-        return name
-    
-    # Handle names with underscores - preserve existing casing of each part
-    if "_" in name:
-        parts = name.split("_")
-        # Capitalize any lowercase parts (which are likely connecting words)
-        processed_parts = []
-        for part in parts:
-            if part.islower():
-                processed_parts.append(part.capitalize())
-            else:
-                processed_parts.append(part)
-        return "".join(processed_parts)
-    
-    # Handle camelCase to PascalCase
-    if name and name[0].islower():
-        return name[0].upper() + name[1:]
-    
-    # Already PascalCase or simple name
-    return name
-
-def to_swift_property_name(name: str) -> str:
-    """Convert property name to Swift property name (camelCase)"""
-    if "_" in name:
-        parts = name.split("_")
-
-        def transform_part(part: str) -> str:
-            if not part:
-                return ""
-            # Preserve specialized casing when digits are present (e.g. p2p -> P2P)
-            if part.islower():
-                if any(ch.isdigit() for ch in part):
-                    digit_indices = [idx for idx, ch in enumerate(part) if ch.isdigit()]
-                    if digit_indices:
-                        has_letter_before = any(ch.isalpha() for ch in part[:digit_indices[0]])
-                        has_letter_after = any(ch.isalpha() for ch in part[digit_indices[-1] + 1:])
-                        if has_letter_before and has_letter_after:
-                            return "".join(ch.upper() if ch.isalpha() else ch for ch in part)
-                return part.capitalize()
-            if part.isupper():
-                return part
-            return part[0].upper() + part[1:]
-
-        first_part = parts[0].lower() if parts else ""
-        transformed = [transform_part(part) for part in parts[1:]]
-        return first_part + "".join(transformed)
-    # Handle all caps (ID -> id, URL -> url)
-    if name.isupper() and len(name) > 1:
-        return name.lower()
-    # Already camelCase or simple name
-    return name[0].lower() + name[1:] if name else name
-
-def resolve_ref_name(ref: str) -> Optional[str]:
-    """Extract type name from $ref"""
-    if not ref.startswith("#/components/schemas/"):
-        return None
-    return ref.split("/")[-1]
-
-def resolve_ref_schema(ref: str, components: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Resolve a $ref to its schema definition"""
-    name = resolve_ref_name(ref)
-    if name:
-        return components.get(name)
-    return None
-
-def generate_schema_hash(schema: Dict[str, Any]) -> str:
-    """Generate a short hash for a schema to create unique names"""
+def generate_schema_hash(schema: Dict[str, Any], length: int = 8) -> str:
+    """Generate a short content hash for a schema"""
     schema_str = json.dumps(schema, sort_keys=True)
-    return hashlib.md5(schema_str.encode()).hexdigest()[:8]
+    return hashlib.md5(schema_str.encode()).hexdigest()[:length]
 
-def generate_unique_type_name(base_name: str, schema: Dict[str, Any], context: str = "", generated_types: Set[str] = None) -> str:
+def generate_unique_type_name(base_name: str, schema: Dict[str, Any], context: str = "", generated_types: Set[str] = None, reserved: Optional[Set[str]] = None) -> str:
     """Generate a unique type name for inline objects"""
     generated_types = generated_types or set()
+    reserved = reserved if reserved is not None else set()
     
     # Start with the base name
     candidate = to_swift_type_name(base_name)
@@ -328,33 +243,33 @@ def generate_unique_type_name(base_name: str, schema: Dict[str, Any], context: s
         candidate = f"{to_swift_type_name(context)}{candidate}"
     
     # If it's unique, return it
-    if candidate not in generated_types:
+    if candidate not in generated_types and candidate not in reserved:
         return candidate
     
     # If not unique, add numeric suffix for better readability
     counter = 1
     final_candidate = f"{candidate}{counter}"
-    while final_candidate in generated_types:
+    while final_candidate in generated_types or final_candidate in reserved:
         counter += 1
         final_candidate = f"{candidate}{counter}"
     
     return final_candidate
 
-def should_generate_inline_struct(schema: Dict[str, Any]) -> bool:
+def should_generate_inline_struct(schema: SchemaNode) -> bool:
     """Determine if we should generate an inline struct for this schema"""
-    if schema.get("type") != "object":
+    if schema.type != "object":
         return False
     
     # Must have properties to be worth generating
-    properties = schema.get("properties", {})
+    properties = schema.properties
     if not properties:
         return False
     
     # Don't generate for very simple objects (1-2 primitive properties)
     if len(properties) <= 2:
         all_primitive = True
-        for prop_schema in properties.values():
-            if not is_primitive_type(prop_schema):
+        for prop in properties.values():
+            if not is_primitive_type(prop.schema):
                 all_primitive = False
                 break
         if all_primitive:
@@ -362,42 +277,32 @@ def should_generate_inline_struct(schema: Dict[str, Any]) -> bool:
     
     return True
 
-def is_primitive_type(schema: Dict[str, Any]) -> bool:
+def is_primitive_type(schema: SchemaNode) -> bool:
     """Check if a schema represents a primitive type"""
-    if "$ref" in schema:
+    if "$ref" in schema.raw:
         return False  # References are not primitive
     
-    schema_type = schema.get("type")
+    schema_type = schema.type
     if schema_type in ["string", "integer", "number", "boolean"]:
         return True
     
     if schema_type == "array":
-        items = schema.get("items", {})
-        return is_primitive_type(items)
+        return schema.items is not None and is_primitive_type(schema.items)
     
     return False
 
-def get_swift_primitive_type(schema: Dict[str, Any], components: Dict[str, Any], seen_refs: Optional[Set[str]] = None, context: str = "", generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
+def get_swift_primitive_type(schema: SchemaNode, context: str = "", generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
     """Map OpenAPI primitive types to Swift types"""
-    seen_refs = seen_refs or set()
     generated_types = generated_types or set()
     inline_types = inline_types or {}
     
-    typ = schema.get("type")
-    fmt = schema.get("format", "")
+    typ = schema.type
+    fmt = schema.format
     
     # Handle refs first
-    if "$ref" in schema:
-        ref = schema["$ref"]
-        if ref in seen_refs:
-            ref_name = resolve_ref_name(ref)
-            if ref_name:
-                return to_swift_type_name(ref_name)
-            return "Any"
-        seen_refs.add(ref)
-        ref_name = resolve_ref_name(ref)
-        if ref_name:
-            return to_swift_type_name(ref_name)
+    if "$ref" in schema.raw:
+        if schema.ref_name:
+            return schema.ref_swift_name
         return "Any"
     
     if typ == "string":
@@ -427,34 +332,36 @@ def get_swift_primitive_type(schema: Dict[str, Any], components: Dict[str, Any],
     elif typ == "boolean":
         return "Bool"
     elif typ == "array":
-        items = schema.get("items", {})
-        items_type = get_swift_type(items, components, seen_refs, context, generated_types, inline_types)
+        items = schema.items if schema.items is not None else SchemaNode(raw={})
+        items_type = get_swift_type(items, context, generated_types, inline_types)
         return f"[{items_type}]"
     elif typ == "object":
         # For inline objects with properties, try to generate specific types
-        if "properties" in schema and should_generate_inline_struct(schema):
-            # Generate a unique name for this inline object
-            schema_key = json.dumps(schema, sort_keys=True)
+        if "properties" in schema.raw and should_generate_inline_struct(schema):
+            # Generate a unique name for this inline object. Identical inline objects
+            # share one struct for the whole run; distinct ones get distinct names
+            schema_key = json.dumps(schema.raw, sort_keys=True)
             if schema_key in inline_types:
                 return inline_types[schema_key]
+            if schema_key in _global_inline_object_types:
+                return _global_inline_object_types[schema_key]
             
-            type_name = generate_unique_type_name("InlineObject", schema, context, generated_types)
+            type_name = generate_unique_type_name("InlineObject", schema.raw, context, generated_types, _global_inline_object_names)
             inline_types[schema_key] = type_name
+            _global_inline_object_types[schema_key] = type_name
+            _global_inline_object_names.add(type_name)
             generated_types.add(type_name)
             
             # Generate the struct code and store it for later output
-            struct_code = generate_inline_object_struct(type_name, schema, components, generated_types, inline_types)
-            # Store the struct code in a global registry (we'll need to modify the main function to handle this)
-            if not hasattr(get_swift_primitive_type, '_inline_structs'):
-                get_swift_primitive_type._inline_structs = {}
-            get_swift_primitive_type._inline_structs[type_name] = struct_code
+            struct_code = generate_inline_object_struct(type_name, schema, generated_types, inline_types)
+            _global_inline_structs[type_name] = struct_code
             
             return type_name
         
         # For objects with additionalProperties, use dictionary
-        elif "additionalProperties" in schema and "properties" not in schema:
-            if isinstance(schema["additionalProperties"], dict):
-                value_type = get_swift_type(schema["additionalProperties"], components, seen_refs, context, generated_types, inline_types)
+        elif "additionalProperties" in schema.raw and "properties" not in schema.raw:
+            if schema.additional_properties is not None:
+                value_type = get_swift_type(schema.additional_properties, context, generated_types, inline_types)
                 return f"[String: {value_type}]"
             else:
                 return "AnyCodable"  # Use AnyCodable for arbitrary objects
@@ -466,59 +373,48 @@ def get_swift_primitive_type(schema: Dict[str, Any], components: Dict[str, Any],
     # because Any is not Codable in Swift
     return "AnyCodable"
 
-def get_swift_type(schema: Dict[str, Any], components: Dict[str, Any], seen_refs: Optional[Set[str]] = None, context: str = "", generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
+def get_swift_type(schema: SchemaNode, context: str = "", generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
     """Get Swift type for a schema"""
-    seen_refs = seen_refs or set()
     generated_types = generated_types or set()
     inline_types = inline_types or {}
     
-    if "$ref" in schema:
-        ref = schema["$ref"]
-        if ref in seen_refs:
-            ref_name = resolve_ref_name(ref)
-            if ref_name:
-                return to_swift_type_name(ref_name)
-            return "Any"
-        seen_refs.add(ref)
-        ref_name = resolve_ref_name(ref)
-        if ref_name:
-            return to_swift_type_name(ref_name)
+    if "$ref" in schema.raw:
+        if schema.ref_name:
+            return schema.ref_swift_name
         return "Any"
     
-    if "enum" in schema:
+    if "enum" in schema.raw:
         # For simple enums, use the primitive type
-        return get_swift_primitive_type(schema, components, seen_refs, context, generated_types, inline_types)
+        return get_swift_primitive_type(schema, context, generated_types, inline_types)
     
-    if "allOf" in schema:
+    if "allOf" in schema.raw:
         # For allOf, try to find the main type
-        for item in schema["allOf"]:
-            if "$ref" in item:
-                ref_name = resolve_ref_name(item["$ref"])
-                if ref_name:
-                    return to_swift_type_name(ref_name)
+        for item in schema.all_of:
+            if "$ref" in item.raw and item.ref_name:
+                return item.ref_swift_name
         # If no ref found, might be a composite type
-        return get_swift_primitive_type(schema, components, seen_refs, context, generated_types, inline_types)
+        return get_swift_primitive_type(schema, context, generated_types, inline_types)
     
-    if "oneOf" in schema or "anyOf" in schema:
+    if "oneOf" in schema.raw or "anyOf" in schema.raw:
         # For oneOf/anyOf, we'd need to create an enum with associated values
         # For now, use Any
-        choices = schema.get("oneOf") or schema.get("anyOf")
+        choices = schema.union.variants if schema.union else ()
         if choices and len(choices) == 2:
             # Special case: nullable type (one option is null)
             for choice in choices:
-                if choice.get("type") == "null":
+                if choice.type == "null":
                     continue
-                return get_swift_type(choice, components, seen_refs, context, generated_types, inline_types) + "?"
+                return get_swift_type(choice, context, generated_types, inline_types) + "?"
         return "Any"
     
-    return get_swift_primitive_type(schema, components, seen_refs, context, generated_types, inline_types)
+    return get_swift_primitive_type(schema, context, generated_types, inline_types)
 
-def generate_swift_enum(name: str, schema: Dict[str, Any]) -> str:
+def generate_swift_enum(schema: SchemaNode) -> str:
     """Generate Swift enum for schemas with enum values"""
-    swift_name = to_swift_type_name(name)
-    enum_values = schema.get("enum", [])
-    typ = schema.get("type", "string")
-    is_nullable = schema.get("nullable", False)
+    swift_name = schema.swift_name
+    enum_values = schema.enum or []
+    typ = schema.type or "string"
+    is_nullable = schema.nullable
     
     if not enum_values:
         return ""
@@ -618,56 +514,25 @@ def generate_swift_enum(name: str, schema: Dict[str, Any]) -> str:
     code += "}\n"
     return code
 
-def merge_allof_for_swift(allof_list: List[Dict[str, Any]], components: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge allOf schemas for Swift generation"""
-    merged = {"type": "object", "properties": {}, "required": []}
-    
-    for item in allof_list:
-        if "$ref" in item:
-            resolved = resolve_ref_schema(item["$ref"], components)
-            if resolved:
-                if "properties" in resolved:
-                    merged["properties"].update(resolved["properties"])
-                if "required" in resolved:
-                    merged["required"].extend(resolved["required"])
-                if "type" in resolved and "type" not in merged:
-                    merged["type"] = resolved["type"]
-        
-        if "properties" in item:
-            merged["properties"].update(item["properties"])
-        if "required" in item:
-            merged["required"].extend(item["required"])
-        if "type" in item and "type" not in merged:
-            merged["type"] = item["type"]
-    
-    # Remove duplicates from required
-    merged["required"] = list(dict.fromkeys(merged["required"]))
-    return merged
-
-def generate_swift_struct(name: str, schema: Dict[str, Any], components: Dict[str, Any], generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> str:
+def generate_swift_struct(node: SchemaNode, generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> str:
     """Generate Swift struct for object schemas"""
     inline_types = inline_types or {}
-    swift_name = ensure_unique_type_name(name, generated_types)
-    
-    # Skip if already generated
-    if not register_generated_type(swift_name, generated_types):
-        return ""
+    swift_name = node.swift_name
     
-    # Handle allOf by merging schemas
-    if "allOf" in schema:
-        schema = merge_allof_for_swift(schema["allOf"], components)
+    # Handle allOf by using the merged schema
+    schema = node.merged if node.all_of else node
     
     # Handle oneOf/anyOf as enums with associated values
-    if "oneOf" in schema or "anyOf" in schema:
-        return generate_swift_enum_with_associated_values(name, schema, components, generated_types, inline_types)[1] + generate_swift_enum_with_associated_values(name, schema, components, generated_types, inline_types)[0]
+    if "oneOf" in schema.raw or "anyOf" in schema.raw:
+        enum_code, inline_structs = generate_swift_enum_with_associated_values(swift_name, schema, generated_types, inline_types)
+        return inline_structs + enum_code
     
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
+    properties = schema.properties
     
     # If no properties but has additionalProperties, generate a typealias
-    if not properties and "additionalProperties" in schema:
-        if isinstance(schema["additionalProperties"], dict):
-            value_type = get_swift_type(schema["additionalProperties"], components)
+    if not properties and "additionalProperties" in schema.raw:
+        if schema.additional_properties is not None:
+            value_type = get_swift_type(schema.additional_properties)
         else:
             value_type = "Any"
         return f"public typealias {swift_name} = [String: {value_type}]\n"
@@ -677,10 +542,8 @@ def generate_swift_struct(name: str, schema: Dict[str, Any], components: Dict[st
     # Generate properties using helper function
     property_mappings = {}
     property_info = []  # Store property info for initializer
-    for prop_name, prop_schema in properties.items():
-        swift_prop_name, prop_type, property_line, needs_mapping = process_property_for_struct(
-            prop_name, prop_schema, required, components
-        )
+    for prop_name, prop in properties.items():
+        swift_prop_name, prop_type, property_line, needs_mapping = process_property_for_struct(prop)
         code += property_line
         property_info.append((swift_prop_name, prop_type))
         
@@ -714,52 +577,52 @@ def generate_swift_struct(name: str, schema: Dict[str, Any], components: Dict[st
     code += "}\n"
     return code
 
-def analyze_oneof_variant(variant: Dict[str, Any], components: Dict[str, Any], context: str = "", generated_types: Optional[Set[str]] = None) -> Tuple[str, str, bool, bool]:
+def analyze_oneof_variant(variant: SchemaNode, context: str = "", generated_types: Optional[Set[str]] = None) -> Tuple[str, str, bool, bool]:
     """
     Analyze a oneOf variant to determine the case name, type, and if it needs inline struct
     Returns: (case_name, type_name, needs_inline_struct, is_wrapped_object)
     """
     generated_types = generated_types or set()
+    raw = variant.raw
     
     # Handle direct enum values - these should be raw value enums, not associated values
-    if "enum" in variant and len(variant["enum"]) == 1:
-        enum_value = variant["enum"][0]
+    if variant.enum is not None and len(variant.enum) == 1:
+        enum_value = variant.enum[0]
         case_name = to_swift_property_name(str(enum_value).replace("-", "_").replace(".", "_"))
         # Return a special marker to indicate this is a literal enum value
         return case_name, f'LITERAL:{enum_value}', False, False
     
     # Handle simple types
-    if variant.get("type") in ["string", "integer", "number", "boolean", "array"] and "properties" not in variant:
-        type_name = get_swift_primitive_type(variant, components)
-        case_name = variant.get("type", "value").lower()
+    if variant.type in ["string", "integer", "number", "boolean", "array"] and "properties" not in raw:
+        type_name = get_swift_primitive_type(variant)
+        case_name = (variant.type or "value").lower()
         return case_name, type_name, False, False
     
     # Handle $ref
-    if "$ref" in variant:
-        ref_name = resolve_ref_name(variant["$ref"])
-        if ref_name:
-            case_name = to_swift_property_name(ref_name)
-            type_name = to_swift_type_name(ref_name)
+    if "$ref" in raw:
+        if variant.ref_name:
+            case_name = to_swift_property_name(variant.ref_name)
+            type_name = variant.ref_swift_name
             return case_name, type_name, False, False
     
     # Handle allOf schemas (merge multiple objects)
-    if "allOf" in variant:
-        merged_schema = merge_allof_for_swift(variant["allOf"], components)
+    if "allOf" in raw:
+        merged_schema = variant.merged
         
         # Use the title if available, otherwise generate a name
-        if "title" in variant:
-            case_name = to_swift_property_name(variant["title"])
-            type_name = to_swift_type_name(variant["title"])
+        if "title" in raw:
+            case_name = to_swift_property_name(raw["title"])
+            type_name = to_swift_type_name(raw["title"])
         else:
             # Generate name based on merged properties
-            properties = merged_schema.get("properties", {})
+            properties = merged_schema.properties
             if properties:
                 prop_names = sorted(properties.keys())[:3]
                 pascal_prop_names = [to_swift_type_name(name) for name in prop_names]
                 base_name = "OneOf" + "".join(pascal_prop_names)
                 if len(properties) > 3:
                     base_name += "Etc"
-                type_name = generate_unique_type_name(base_name, merged_schema, context, generated_types)
+                type_name = generate_unique_type_name(base_name, merged_schema.raw, context, generated_types)
                 case_name = to_swift_property_name(type_name.replace("OneOf", ""))
             else:
                 case_name = "mergedVariant"
@@ -768,8 +631,8 @@ def analyze_oneof_variant(variant: Dict[str, Any], components: Dict[str, Any], c
         return case_name, type_name, True, False
     
     # Handle anyOf schemas (especially nullable references)
-    if "anyOf" in variant:
-        choices = variant["anyOf"]
+    if "anyOf" in raw:
+        choices = variant.union.variants if variant.union else ()
         
         # Check for nullable reference pattern
         if len(choices) == 2:
@@ -777,87 +640,84 @@ def analyze_oneof_variant(variant: Dict[str, Any], components: Dict[str, Any], c
             null_choice = None
             
             for choice in choices:
-                if "$ref" in choice:
+                if "$ref" in choice.raw:
                     ref_choice = choice
-                elif choice.get("enum") == [None] and choice.get("nullable"):
+                elif choice.enum == [None] and choice.nullable:
                     null_choice = choice
             
             if ref_choice and null_choice:
-                ref_name = resolve_ref_name(ref_choice["$ref"])
-                if ref_name:
-                    case_name = to_swift_property_name(ref_name)
+                if ref_choice.ref_name:
+                    case_name = to_swift_property_name(ref_choice.ref_name)
                     # Check if the referenced type is already nullable
-                    ref_schema = resolve_ref_schema(ref_choice["$ref"], components)
-                    if ref_schema and ref_schema.get("enum") == [None] and ref_schema.get("nullable"):
-                        type_name = to_swift_type_name(ref_name)  # Use the actual type name
+                    ref_schema = ref_choice.ref
+                    if ref_schema and ref_schema.enum == [None] and ref_schema.nullable:
+                        type_name = ref_choice.ref_swift_name  # Use the actual type name
                     else:
-                        type_name = f"{to_swift_type_name(ref_name)}?"
+                        type_name = f"{ref_choice.ref_swift_name}?"
                     return case_name, type_name, False, False
         
         # Fallback for complex anyOf - use first non-null choice
         for choice in choices:
-            if choice.get("enum") != [None]:
-                return analyze_oneof_variant(choice, components, context, generated_types)
+            if choice.enum != [None]:
+                return analyze_oneof_variant(choice, context, generated_types)
     
     # Handle objects with properties
-    if variant.get("type") == "object" and "properties" in variant:
-        properties = variant["properties"]
-        required = set(variant.get("required", []))
+    if variant.type == "object" and "properties" in raw:
+        properties = variant.properties
         
         # Check if this is a wrapped object pattern (single property with $ref)
         if len(properties) == 1:
-            prop_name = list(properties.keys())[0]
+            prop = next(iter(properties.values()))
+            prop_name = prop.name
             # Use proper PascalCase for the property name
-            case_name = to_swift_property_name(prop_name)
-            prop_schema = properties[prop_name]
+            case_name = prop.swift_name
+            prop_schema = prop.schema
             
             # Handle anyOf in property (like nullable references)
-            if "anyOf" in prop_schema:
-                choices = prop_schema["anyOf"]
+            if "anyOf" in prop_schema.raw:
+                choices = prop_schema.union.variants if prop_schema.union else ()
                 if len(choices) == 2:
                     ref_choice = None
                     null_choice = None
                     
                     for choice in choices:
-                        if "$ref" in choice:
+                        if "$ref" in choice.raw:
                             ref_choice = choice
-                        elif choice.get("enum") == [None] and choice.get("nullable"):
+                        elif choice.enum == [None] and choice.nullable:
                             null_choice = choice
                     
                     if ref_choice and null_choice:
-                        ref_name = resolve_ref_name(ref_choice["$ref"])
-                        if ref_name:
+                        if ref_choice.ref_name:
                             # Check if the referenced type is already nullable
-                            ref_schema = resolve_ref_schema(ref_choice["$ref"], components)
-                            if ref_schema and ref_schema.get("enum") == [None] and ref_schema.get("nullable"):
-                                type_name = to_swift_type_name(ref_name)  # Use the actual type name
+                            ref_schema = ref_choice.ref
+                            if ref_schema and ref_schema.enum == [None] and ref_schema.nullable:
+                                type_name = ref_choice.ref_swift_name  # Use the actual type name
                             else:
-                                type_name = f"{to_swift_type_name(ref_name)}?"
+                                type_name = f"{ref_choice.ref_swift_name}?"
                             return case_name, type_name, False, True  # is_wrapped_object = True
             
             # If it's a reference, this is a wrapped object
-            if "$ref" in prop_schema:
-                ref_name = resolve_ref_name(prop_schema["$ref"])
-                if ref_name:
-                    type_name = to_swift_type_name(ref_name)
+            if "$ref" in prop_schema.raw:
+                if prop_schema.ref_name:
+                    type_name = prop_schema.ref_swift_name
                     return case_name, type_name, False, True  # is_wrapped_object = True
             
             # If it's an inline object, we need to create a struct for it
-            if prop_schema.get("type") == "object" and "properties" in prop_schema:
+            if prop_schema.type == "object" and "properties" in prop_schema.raw:
                 # Use the property name in PascalCase for better naming
                 pascal_prop_name = to_swift_type_name(prop_name)
-                type_name = generate_unique_type_name(f"OneOf{pascal_prop_name}Inline", prop_schema, context, generated_types)
+                type_name = generate_unique_type_name(f"OneOf{pascal_prop_name}Inline", prop_schema.raw, context, generated_types)
                 return case_name, type_name, True, True  # Both inline and wrapped
             
             # Otherwise, get the type directly - this is still wrapped
-            prop_type = get_swift_primitive_type(prop_schema, components)
+            prop_type = get_swift_primitive_type(prop_schema)
             return case_name, prop_type, False, True
         else:
             # Multiple properties - create a struct name based on schema content
             # Use title if available
-            if "title" in variant:
-                case_name = to_swift_property_name(variant["title"])
-                type_name = to_swift_type_name(variant["title"])
+            if "title" in raw:
+                case_name = to_swift_property_name(raw["title"])
+                type_name = to_swift_type_name(raw["title"])
             else:
                 # Generate a more descriptive name using property names and schema hash
                 prop_names = sorted(properties.keys())[:3]  # Use first 3 property names
@@ -867,7 +727,7 @@ def analyze_oneof_variant(variant: Dict[str, Any], components: Dict[str, Any], c
                 if len(properties) > 3:
                     base_name += "Etc"
                 
-                type_name = generate_unique_type_name(base_name, variant, context, generated_types)
+                type_name = generate_unique_type_name(base_name, raw, context, generated_types)
                 # Add the generated type name to the set to ensure future variants get unique names
                 if generated_types is not None:
                     generated_types.add(type_name)
@@ -880,21 +740,20 @@ def analyze_oneof_variant(variant: Dict[str, Any], components: Dict[str, Any], c
     type_name = "Any"
     return case_name, type_name, False, False
 
-def generate_inline_object_struct(type_name: str, schema: Dict[str, Any], components: Dict[str, Any], generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
+def generate_inline_object_struct(type_name: str, schema: SchemaNode, generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
     """Generate a struct for an inline object schema"""
     generated_types = generated_types or set()
     inline_types = inline_types or {}
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
+    properties = schema.properties
     
     code = f"public struct {type_name}: Codable, Sendable {{\n"
     
     # Generate properties using helper function
     property_mappings = {}
     property_info = []  # Store property info for initializer
-    for prop_name, prop_schema in properties.items():
+    for prop_name, prop in properties.items():
         swift_prop_name, prop_type, property_line, needs_mapping = process_property_for_struct(
-            prop_name, prop_schema, required, components, type_name, generated_types, inline_types
+            prop, type_name, generated_types, inline_types
         )
         code += property_line
         property_info.append((swift_prop_name, prop_type))
@@ -929,21 +788,20 @@ def generate_inline_object_struct(type_name: str, schema: Dict[str, Any], compon
     code += "}\n\n"
     return code
 
-def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any], components: Dict[str, Any], generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+def generate_swift_enum_with_associated_values(swift_name: str, schema: SchemaNode, generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
     """
     Generate Swift enum with associated values for oneOf/anyOf schemas
     Returns: (main_enum_code, inline_structs_code)
     """
     inline_types = inline_types or {}
-    swift_name = to_swift_type_name(name)
-    choices = schema.get("oneOf") or schema.get("anyOf", [])
+    choices = schema.union.variants if schema.union else ()
     
     if not choices:
         return "", ""
     
     # Check if this is just a nullable type
     if len(choices) == 2:
-        null_count = sum(1 for choice in choices if choice.get("type") == "null")
+        null_count = sum(1 for choice in choices if choice.type == "null")
         if null_count == 1:
             # This is just a nullable type, not a real union
             return "", ""
@@ -954,11 +812,11 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
     inline_structs_generated = set()  # Track generated inline struct names
     
     for choice in choices:
-        case_name, type_name, needs_inline, is_wrapped = analyze_oneof_variant(choice, components, swift_name, generated_types)
+        case_name, type_name, needs_inline, is_wrapped = analyze_oneof_variant(choice, swift_name, generated_types)
         variants.append((case_name, type_name, choice, is_wrapped))
         
         if needs_inline and type_name not in inline_structs_generated:
-            inline_struct_code = generate_oneof_inline_struct(case_name, type_name, choice, components, generated_types, inline_types)
+            inline_struct_code = generate_oneof_inline_struct(case_name, type_name, choice, generated_types, inline_types)
             inline_structs += inline_struct_code
             inline_structs_generated.add(type_name)
 
@@ -968,8 +826,7 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
         if type_name.startswith('LITERAL:'):
             continue
         if is_wrapped:
-            properties = choice.get("properties", {})
-            if properties:
+            if choice.properties:
                 collects_decoding_errors = True
                 break
         else:
@@ -1027,11 +884,11 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
             code += f"        }}\n"
         elif is_wrapped:
             # For wrapped objects, decode using raw keys via AnyCodingKey to avoid keyDecodingStrategy side effects
-            properties = choice.get("properties", {})
-            if properties:
-                prop_name = list(properties.keys())[0]  # Wrapper property key as it appears in JSON
+            if choice.properties:
+                wrapper = next(iter(choice.properties.values()))
+                prop_name = wrapper.name  # Wrapper property key as it appears in JSON
                 candidate_keys = [prop_name]
-                swift_prop_variant = to_swift_property_name(prop_name)
+                swift_prop_variant = wrapper.swift_name
                 if swift_prop_variant and swift_prop_variant not in candidate_keys:
                     candidate_keys.append(swift_prop_variant)
                 lowercase_variant = prop_name[:1].lower() + prop_name[1:]
@@ -1091,10 +948,10 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
         needs_coding_keys = {}
         for case_name, type_name, choice, is_wrapped in variants:
             if is_wrapped:
-                properties = choice.get("properties", {})
-                if properties:
-                    prop_name = list(properties.keys())[0]
-                    swift_prop_name = to_swift_property_name(prop_name)
+                if choice.properties:
+                    wrapper = next(iter(choice.properties.values()))
+                    prop_name = wrapper.name
+                    swift_prop_name = wrapper.swift_name
                     
                     # Check if this is a simple snake_case conversion
                     # convertFromSnakeCase handles: "chunk_id" -> "chunkId", "block_id" -> "blockId"
@@ -1137,17 +994,16 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
             literal_value = type_name[8:]  # Remove 'LITERAL:' prefix
             literal_cases.append((case_name, literal_value))
         elif is_wrapped:
-            properties = choice.get("properties", {})
-            if properties:
-                prop_name = list(properties.keys())[0]
-                wrapped_cases.append((case_name, prop_name))
+            if choice.properties:
+                wrapped_cases.append((case_name, next(iter(choice.properties.values()))))
         else:
             direct_cases.append(case_name)
     
     if wrapped_cases:
         code += "        switch self {\n"
-        for case_name, prop_name in wrapped_cases:
-            swift_prop_name = to_swift_property_name(prop_name)
+        for case_name, wrapper in wrapped_cases:
+            prop_name = wrapper.name
+            swift_prop_name = wrapper.swift_name
             code += f"        case .{case_name}(let value):\n"
             
             # Check if this property needs CodingKeys or if it's snake_case
@@ -1188,20 +1044,24 @@ def generate_swift_enum_with_associated_values(name: str, schema: Dict[str, Any]
 
 
 _global_inline_struct_schemas = {}
+_global_inline_object_types: Dict[str, str] = {}
+_global_inline_object_names: Set[str] = set()
+# Inline object structs, emitted after all component types
+_global_inline_structs: Dict[str, str] = {}
 
 
-def generate_oneof_inline_struct(case_name: str, type_name: str, variant: Dict[str, Any], components: Dict[str, Any], generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
+def generate_oneof_inline_struct(case_name: str, type_name: str, variant: SchemaNode, generated_types: Optional[Set[str]] = None, inline_types: Optional[Dict[str, str]] = None) -> str:
     """Generate an inline struct for oneOf variants that need it"""
     global _global_inline_struct_schemas
     
     generated_types = generated_types or set()
     inline_types = inline_types or {}
     
-    # Handle allOf variants by merging schemas first
-    if "allOf" in variant:
-        variant = merge_allof_for_swift(variant["allOf"], components)
+    # Handle allOf variants by using the merged schema
+    if "allOf" in variant.raw:
+        variant = variant.merged
     
-    if variant.get("type") != "object" or "properties" not in variant:
+    if variant.type != "object" or "properties" not in variant.raw:
         return ""
     
     # Check if we've already generated a struct with this exact type_name
@@ -1212,16 +1072,14 @@ def generate_oneof_inline_struct(case_name: str, type_name: str, variant: Dict[s
         # Return empty string - this struct has already been generated
         return ""
     
-    properties = variant["properties"]
-    required = set(variant.get("required", []))
+    properties = variant.properties
     
     # Handle the special case where we have a single property that is itself an inline object
     if len(properties) == 1 and type_name.endswith("Inline"):
-        prop_name = list(properties.keys())[0]
-        prop_schema = properties[prop_name]
-        if prop_schema.get("type") == "object" and "properties" in prop_schema:
+        prop_schema = next(iter(properties.values())).schema
+        if prop_schema.type == "object" and "properties" in prop_schema.raw:
             # Generate struct for the inline object inside the property
-            return generate_inline_object_struct(type_name, prop_schema, components, generated_types, inline_types)
+            return generate_inline_object_struct(type_name, prop_schema, generated_types, inline_types)
     
     # Register this type_name as being generated
     _global_inline_struct_schemas[type_name] = type_name
@@ -1232,10 +1090,8 @@ def generate_oneof_inline_struct(case_name: str, type_name: str, variant: Dict[s
     # Generate properties using helper function
     property_mappings = {}
     property_info = []  # Store property info for initializer
-    for prop_name, prop_schema in properties.items():
-        swift_prop_name, prop_type, property_line, needs_mapping = process_property_for_struct(
-            prop_name, prop_schema, required, components
-        )
+    for prop_name, prop in properties.items():
+        swift_prop_name, prop_type, property_line, needs_mapping = process_property_for_struct(prop, type_name, generated_types, inline_types)
         code += property_line
         property_info.append((swift_prop_name, prop_type))
         
@@ -1269,20 +1125,17 @@ def generate_oneof_inline_struct(case_name: str, type_name: str, variant: Dict[s
     code += "}\n\n"
     return code
 
-def generate_swift_type_alias(name: str, schema: Dict[str, Any], components: Dict[str, Any]) -> str:
+def generate_swift_type_alias(swift_name: str, schema: SchemaNode) -> str:
     """Generate type alias for simple types or references"""
-    swift_name = to_swift_type_name(name)
-    
     # Don't create redundant type aliases for direct references
-    if "$ref" in schema and len(schema) == 1:
-        ref_name = resolve_ref_name(schema["$ref"])
-        if ref_name:
-            ref_swift_name = to_swift_type_name(ref_name)
+    if "$ref" in schema.raw and len(schema.raw) == 1:
+        if schema.ref_name:
+            ref_swift_name = schema.ref_swift_name
             if swift_name != ref_swift_name:
                 return f"public typealias {swift_name} = {ref_swift_name}\n"
         return ""
     
-    base_type = get_swift_type(schema, components)
+    base_type = get_swift_type(schema)
     
     # Don't create type alias if it would be the same as the name
     if base_type == swift_name:
@@ -1290,188 +1143,41 @@ def generate_swift_type_alias(name: str, schema: Dict[str, Any], components: Dic
     
     return f"public typealias {swift_name} = {base_type}\n"
 
-def generate_swift_for_schema(name: str, schema: Dict[str, Any], components: Dict[str, Any], generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> str:
-    """Generate Swift code for a single schema"""
+def generate_swift_for_schema(node: SchemaNode, generated_types: Set[str], inline_types: Optional[Dict[str, str]] = None) -> str:
+    """Generate Swift code for a single component schema.
+
+    Component type names are reserved in `generated_types` up front (see main),
+    so this only registers the inline types it creates along the way.
+    """
     inline_types = inline_types or {}
-    swift_name = to_swift_type_name(name)
-    
-    # Skip if already generated - but handle duplicates by adding suffix
-    original_swift_name = swift_name
-    if swift_name in generated_types:
-        # Check if this is the same schema as the already generated one
-        # For duplicates with different schema content, add a suffix
-        counter = 2
-        while swift_name in generated_types:
-            swift_name = f"{original_swift_name}{counter}"
-            counter += 1
+    schema = node.raw
     
     # Handle different schema types
     if "enum" in schema and not ("oneOf" in schema or "anyOf" in schema):
-        code = generate_swift_enum(name, schema)
-        if code:
-            generated_types.add(swift_name)
-        return code
+        return generate_swift_enum(node)
     elif "oneOf" in schema or "anyOf" in schema:
-        enum_code, inline_structs = generate_swift_enum_with_associated_values(name, schema, components, generated_types, inline_types)
-        if enum_code:
-            generated_types.add(swift_name)
+        enum_code, inline_structs = generate_swift_enum_with_associated_values(node.swift_name, node, generated_types, inline_types)
         return inline_structs + enum_code
     elif "allOf" in schema:
         # Check if allOf contains only a single $ref - this should be a type alias
-        allof_items = schema["allOf"]
-        if len(allof_items) == 1 and "$ref" in allof_items[0] and len(allof_items[0]) == 1:
+        allof_items = node.all_of
+        if len(allof_items) == 1 and "$ref" in allof_items[0].raw and len(allof_items[0].raw) == 1:
             # Simple allOf with single reference - create type alias
-            ref_schema = {"$ref": allof_items[0]["$ref"]}
-            return generate_swift_type_alias(name, ref_schema, components)
+            return generate_swift_type_alias(node.swift_name, allof_items[0])
         else:
             # Complex allOf - treat as struct
-            return generate_swift_struct(name, schema, components, generated_types, inline_types)
-    elif schema.get("type") == "object" or "properties" in schema:
-        return generate_swift_struct(name, schema, components, generated_types, inline_types)
+            return generate_swift_struct(node, generated_types, inline_types)
+    elif node.type == "object" or "properties" in schema:
+        return generate_swift_struct(node, generated_types, inline_types)
     elif "$ref" in schema and len(schema) == 1:
         # Pure reference - might need type alias
-        return generate_swift_type_alias(name, schema, components)
-    elif schema.get("type") in ["string", "integer", "number", "boolean", "array"]:
+        return generate_swift_type_alias(node.swift_name, node)
+    elif node.type in ["string", "integer", "number", "boolean", "array"]:
         # Simple types - create type alias if it adds value
-        alias = generate_swift_type_alias(name, schema, components)
-        if alias:
-            generated_types.add(swift_name)
-        return alias
+        return generate_swift_type_alias(node.swift_name, node)
     else:
         # Default to struct for complex types
-        return generate_swift_struct(name, schema, components, generated_types)
-
-
-def resolve_schema(schema: Optional[Dict[str, Any]], components: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Resolve a schema, following $ref pointers."""
-    if schema is None:
-        return None
-    if "$ref" in schema:
-        return resolve_ref_schema(schema["$ref"], components)
-    return schema
-
-
-def is_null_schema(schema: Optional[Dict[str, Any]]) -> bool:
-    """Check whether a schema represents a null literal."""
-    if not schema:
-        return False
-    if schema.get("type") == "null":
-        return True
-    enum_values = schema.get("enum")
-    if enum_values and all(value is None for value in enum_values):
-        return True
-    return False
-
-
-def schema_to_swift_type_name(schema: Optional[Dict[str, Any]], components: Dict[str, Any], default: str = "AnyCodable") -> str:
-    """Convert an OpenAPI schema snippet to the corresponding Swift type name."""
-    if schema is None:
-        return default
-    if "$ref" in schema:
-        ref_name = resolve_ref_name(schema["$ref"])
-        if ref_name:
-            return to_swift_type_name(ref_name)
-        return default
-    if "allOf" in schema:
-        for item in schema["allOf"]:
-            if "$ref" in item:
-                return schema_to_swift_type_name(item, components, default)
-        return default
-    if "anyOf" in schema:
-        options = schema["anyOf"]
-        non_null_options = [opt for opt in options if not is_null_schema(opt)]
-        if not non_null_options:
-            return default
-        base = schema_to_swift_type_name(non_null_options[0], components, default)
-        if any(is_null_schema(opt) or opt.get("nullable") for opt in options):
-            if not base.endswith("?"):
-                base = f"{base}?"
-        return base
-    if "oneOf" in schema:
-        options = schema["oneOf"]
-        non_null_options = [opt for opt in options if not is_null_schema(opt)]
-        if len(non_null_options) == 1 and len(options) == 2 and any(is_null_schema(opt) for opt in options):
-            base = schema_to_swift_type_name(non_null_options[0], components, default)
-            if not base.endswith("?"):
-                base = f"{base}?"
-            return base
-        return default
-    schema_type = schema.get("type")
-    if schema_type == "array":
-        items_type = schema_to_swift_type_name(schema.get("items"), components, default="AnyCodable")
-        result = f"[{items_type}]"
-    elif schema_type == "object":
-        if "additionalProperties" in schema:
-            value_type = schema_to_swift_type_name(schema.get("additionalProperties"), components, default="AnyCodable")
-            result = f"[String: {value_type}]"
-        else:
-            result = "AnyCodable"
-    elif schema_type == "string":
-        fmt = schema.get("format")
-        if fmt in ("byte", "binary"):
-            result = "Data"
-        elif fmt == "uuid":
-            result = "UUID"
-        elif fmt == "uint64":
-            result = "UInt64"
-        else:
-            result = "String"
-    elif schema_type == "integer":
-        fmt = schema.get("format")
-        if fmt == "int32":
-            result = "Int32"
-        elif fmt == "int64":
-            result = "Int64"
-        elif fmt == "uint64":
-            result = "UInt64"
-        else:
-            result = "Int"
-    elif schema_type == "number":
-        fmt = schema.get("format")
-        if fmt == "float":
-            result = "Float"
-        else:
-            result = "Double"
-    elif schema_type == "boolean":
-        result = "Bool"
-    elif schema_type == "null":
-        result = "NSNull"
-    else:
-        result = default
-    if schema.get("nullable") and not result.endswith("?"):
-        result = f"{result}?"
-    return result
-
-
-def derive_result_type_name(response_schema: Optional[Dict[str, Any]], components: Dict[str, Any]) -> str:
-    """Determine the Swift type of the `result` payload inside a JSON-RPC response schema."""
-    if not response_schema:
-        return "AnyCodable"
-    if "oneOf" in response_schema:
-        for variant in response_schema["oneOf"]:
-            properties = variant.get("properties", {})
-            if "result" in properties:
-                return schema_to_swift_type_name(properties["result"], components, default="AnyCodable")
-        return "AnyCodable"
-    if "allOf" in response_schema:
-        for item in response_schema["allOf"]:
-            properties = item.get("properties", {})
-            if "result" in properties:
-                return schema_to_swift_type_name(properties["result"], components, default="AnyCodable")
-    properties = response_schema.get("properties", {})
-    if "result" in properties:
-        return schema_to_swift_type_name(properties["result"], components, default="AnyCodable")
-    return "AnyCodable"
-
-
-def to_swift_client_method_name(rpc_method: str) -> str:
-    """Convert the RPC method string to a Swift method name."""
-    method_name = rpc_method
-    if method_name.startswith("rpc_"):
-        method_name = method_name[4:]
-    if method_name.startswith("EXPERIMENTAL_"):
-        method_name = "experimental_" + method_name[len("EXPERIMENTAL_"):]
-    return to_swift_property_name(method_name)
+        return generate_swift_struct(node, generated_types)
 
 
 def format_doc_comment(description: str, rpc_method: str) -> str:
@@ -1482,67 +1188,9 @@ def format_doc_comment(description: str, rpc_method: str) -> str:
     return "\n".join(f"    /// {line}" for line in lines)
 
 
-def extract_rpc_methods(openapi: Dict[str, Any], components: Dict[str, Any]) -> List[Dict[str, str]]:
-    """Extract RPC method metadata from the OpenAPI document."""
-    methods: List[Dict[str, str]] = []
-    seen_swift_names: Set[str] = set()
-    paths = openapi.get("paths", {})
-    for path_item in paths.values():
-        for http_method, operation in path_item.items():
-            if http_method.lower() != "post":
-                continue
-            request_body = operation.get("requestBody", {})
-            request_schema = request_body.get("content", {}).get("application/json", {}).get("schema")
-            if not request_schema:
-                continue
-            resolved_request_schema = resolve_schema(request_schema, components)
-            if not resolved_request_schema:
-                continue
-            props = resolved_request_schema.get("properties", {})
-            method_property = props.get("method", {})
-            method_enum = method_property.get("enum", [])
-            rpc_method = method_enum[0] if method_enum else operation.get("operationId")
-            if not rpc_method:
-                continue
-            params_schema = props.get("params")
-            request_type = schema_to_swift_type_name(params_schema, components, default="AnyCodable")
-            responses = operation.get("responses", {})
-            success_response = responses.get("200")
-            if not success_response:
-                for status_code, candidate in responses.items():
-                    if isinstance(status_code, str) and status_code.startswith("2"):
-                        success_response = candidate
-                        break
-            if not success_response:
-                continue
-            response_schema = success_response.get("content", {}).get("application/json", {}).get("schema")
-            response_type = schema_to_swift_type_name(response_schema, components, default="AnyCodable")
-            resolved_response_schema = resolve_schema(response_schema, components)
-            result_type = derive_result_type_name(resolved_response_schema, components)
-            swift_method_name = to_swift_client_method_name(rpc_method)
-            original_swift_method_name = swift_method_name
-            counter = 2
-            while swift_method_name in seen_swift_names:
-                swift_method_name = f"{original_swift_method_name}{counter}"
-                counter += 1
-            seen_swift_names.add(swift_method_name)
-            description = operation.get("summary") or operation.get("description") or ""
-            methods.append(
-                {
-                    "rpc_method": rpc_method,
-                    "swift_method": swift_method_name,
-                    "request_type": request_type,
-                    "response_type": response_type,
-                    "result_type": result_type,
-                    "doc": description.strip(),
-                }
-            )
-    return methods
-
-
-def generate_methods_code(openapi: Dict[str, Any], components: Dict[str, Any]) -> Tuple[str, int]:
+def generate_methods_code(ir: SpecIR) -> Tuple[str, int]:
     """Generate the Swift methods implementation from the OpenAPI specification."""
-    methods = extract_rpc_methods(openapi, components)
+    methods = ir.methods
     header = """
 import Foundation
 import NearJsonRpcTypes
@@ -1552,38 +1200,22 @@ public extension NearJsonRpcClient {
 """
     method_blocks = []
     for method in methods:
-        doc_comment = format_doc_comment(method["doc"], method["rpc_method"])
+        doc_comment = format_doc_comment(method.doc, method.rpc_method)
         
-        # Extract error type response schema
-        response_type = method['response_type']
-        error_wrapper_case = None
-        
-        # Extract error type
-        for schema_name, schema in components.items():
-            swift_schema_name = to_swift_type_name(schema_name)
-            if swift_schema_name == response_type:
-                one_of = schema.get("oneOf", [])
-                for variant in one_of:
-                    variant_props = variant.get("properties", {})
-                    if "error" in variant_props:
-                        error_schema = variant_props["error"]
-                        if "$ref" in error_schema:
-                            ref = error_schema["$ref"]
-                            error_type_name = ref.split("/")[-1]
-                            error_wrapper_case = to_swift_property_name(error_type_name)
-                            break
-                break
-        
-        if not error_wrapper_case:
+        # Error type of the response envelope, from the table built with the methods
+        response_type = method.response_type
+        error_type = ir.responses[response_type].error_type
+        if not error_type:
             raise ValueError(f"Could not find error type for response: {response_type}")
+        error_wrapper_case = to_swift_property_name(error_type)
         
         method_block = f"""
 {doc_comment}
-    func {method['swift_method']}(_ request: {method['request_type']}) async throws(NearJsonRpcError) -> {method['result_type']} {{
-        let response: {method['response_type']} = try await performRequest(
-            method: "{method['rpc_method']}",
+    func {method.swift_method}(_ request: {method.request_type}) async throws(NearJsonRpcError) -> {method.result_type} {{
+        let response: {method.response_type} = try await performRequest(
+            method: "{method.rpc_method}",
             params: request,
-            responseType: {method['response_type']}.self
+            responseType: {method.response_type}.self
         )
         
         switch response {{
@@ -1602,30 +1234,25 @@ public extension NearJsonRpcClient {
     full_code = header + methods_code + footer
     return full_code, len(methods)
 
-def collect_discriminator_enums(schemas: Dict[str, Any]) -> Dict[str, Set[str]]:
+def collect_discriminator_enums(schemas: Dict[str, SchemaNode]) -> Dict[str, Set[str]]:
     """Collect all discriminator enum values across all schemas"""
     discriminators: Dict[str, Set[str]] = {}
     
-    def extract_from_schema(schema: Dict[str, Any]):
+    def extract_from_schema(schema: SchemaNode):
         """Recursively extract discriminator values from a schema"""
-        if not isinstance(schema, dict):
-            return
-        
         # Check properties
-        properties = schema.get("properties", {})
-        for prop_name, prop_schema in properties.items():
-            if is_discriminator_field(prop_name, prop_schema):
-                enum_values = prop_schema.get("enum", [])
+        for prop_name, prop in schema.properties.items():
+            if is_discriminator_field(prop_name, prop.schema):
+                enum_values = prop.schema.enum
                 if enum_values and enum_values[0] is not None:
                     if prop_name not in discriminators:
                         discriminators[prop_name] = set()
                     discriminators[prop_name].update(enum_values)
         
         # Check oneOf/anyOf/allOf variants
-        for key in ["oneOf", "anyOf", "allOf"]:
-            if key in schema:
-                for variant in schema[key]:
-                    extract_from_schema(variant)
+        variants = schema.union.variants if schema.union else ()
+        for variant in variants + schema.all_of:
+            extract_from_schema(variant)
     
     # Process all schemas
     for schema in schemas.values():
@@ -1633,10 +1260,8 @@ def collect_discriminator_enums(schemas: Dict[str, Any]) -> Dict[str, Set[str]]:
     
     return discriminators
 
-def generate_discriminator_enums(discriminators: Dict[str, Set[str]]) -> str:
-    """Generate Swift enum types for discriminator fields"""
-    code = ""
-    
+def generate_discriminator_enums(discriminators: Dict[str, Set[str]], out: SwiftWriter) -> None:
+    """Write Swift enum types for discriminator fields to `out`"""
     for field_name, values in sorted(discriminators.items()):
         if not values:
             continue
@@ -1644,8 +1269,8 @@ def generate_discriminator_enums(discriminators: Dict[str, Set[str]]) -> str:
         # Generate enum name from field name
         enum_name = to_swift_type_name(field_name)
         
-        code += f"// MARK: - {enum_name}\n\n"
-        code += f"public enum {enum_name}: String, Codable, Sendable {{\n"
+        out.mark(enum_name, blank_line=True)
+        out.write(f"public enum {enum_name}: String, Codable, Sendable {{\n")
         
         # Generate cases
         seen_cases = set()
@@ -1667,102 +1292,302 @@ def generate_discriminator_enums(discriminators: Dict[str, Set[str]]) -> str:
             seen_cases.add(case_name)
             
             if case_name != value:
-                code += f'    case {case_name} = "{value}"\n'
+                out.write(f'    case {case_name} = "{value}"\n')
             else:
-                code += f'    case {case_name}\n'
+                out.write(f'    case {case_name}\n')
         
-        code += "}\n\n"
-    
-    return code
+        out.write("}\n\n")
 
-def extract_error_types_from_responses(openapi: Dict[str, Any], components: Dict[str, Any]) -> Set[str]:
+def extract_error_types_from_responses(ir: SpecIR) -> Set[str]:
     """Extract all error types used in JSON-RPC response schemas"""
     error_types = set()
     
     # Scan all response schemas to find error types
-    for schema_name, schema in components.items():
+    for schema_name, schema in ir.schemas.items():
         # Look for JsonRpcResponse schemas with error variants
         if not schema_name.startswith("JsonRpcResponse"):
             continue
         
-        one_of = schema.get("oneOf", [])
+        one_of = schema.union.variants if schema.union and schema.union.keyword == "oneOf" else ()
         for variant in one_of:
             # Check if this is an error variant
-            variant_props = variant.get("properties", {})
-            if "error" in variant_props:
-                error_schema = variant_props["error"]
-                if "$ref" in error_schema:
-                    # Extract the error type name from the reference
-                    ref = error_schema["$ref"]
-                    error_type = ref.split("/")[-1]
-                    error_types.add(error_type)
+            if "error" in variant.properties:
+                error_schema = variant.properties["error"].schema
+                if error_schema.ref_name:
+                    error_types.add(error_schema.ref_name)
     
     return error_types
 
-def generate_rpc_error_enum(openapi: Dict[str, Any], components: Dict[str, Any]) -> str:
-    """Generate an enum that wraps all RPC error types"""
-    error_types = extract_error_types_from_responses(openapi, components)
+def generate_rpc_error_enum(ir: SpecIR, out: SwiftWriter) -> None:
+    """Write an enum that wraps all RPC error types to `out`"""
+    error_types = extract_error_types_from_responses(ir)
     
     if not error_types:
-        # Return empty implementation if no error types found
-        return ""
+        # Write nothing if no error types found
+        return
 
     error_types_sorted = sorted(error_types)
     
-    code = "// MARK: - RPC Errors\n\n"
-    code += "/// Enum wrapping all possible RPC error types\n"
-    code += "public enum RpcErrorDetails: Codable, Sendable {\n"
+    out.mark("RPC Errors", blank_line=True)
+    out.write("/// Enum wrapping all possible RPC error types\n")
+    out.write("public enum RpcErrorDetails: Codable, Sendable {\n")
     
     # Generate cases for error types
     for error_type in error_types_sorted:
         case_name = to_swift_property_name(error_type)
         swift_type = to_swift_type_name(error_type)
-        code += f"    case {case_name}({swift_type})\n"
+        out.write(f"    case {case_name}({swift_type})\n")
     
-    code += "\n"
-    code += "    public init(from decoder: Decoder) throws {\n"
-    code += "        // Try to decode as each error type\n"
+    out.write("\n")
+    out.write("    public init(from decoder: Decoder) throws {\n")
+    out.write("        // Try to decode as each error type\n")
     
     for i, error_type in enumerate(error_types_sorted):
         case_name = to_swift_property_name(error_type)
         swift_type = to_swift_type_name(error_type)
         if i == 0:
-            code += f"        if let error = try? {swift_type}(from: decoder) {{\n"
+            out.write(f"        if let error = try? {swift_type}(from: decoder) {{\n")
         else:
-            code += f"        else if let error = try? {swift_type}(from: decoder) {{\n"
-        code += f"            self = .{case_name}(error)\n"
-        code += "        }\n"
-    
-    code += "        else {\n"
-    code += "            throw DecodingError.dataCorrupted(\n"
-    code += "                DecodingError.Context(\n"
-    code += "                    codingPath: decoder.codingPath,\n"
-    code += '                    debugDescription: "Could not decode RpcErrorDetails - no matching error type found"\n'
-    code += "                )\n"
-    code += "            )\n"
-    code += "        }\n"
-    code += "    }\n"
-    code += "\n"
-    code += "    public func encode(to encoder: Encoder) throws {\n"
-    code += "        switch self {\n"
+            out.write(f"        else if let error = try? {swift_type}(from: decoder) {{\n")
+        out.write(f"            self = .{case_name}(error)\n")
+        out.write("        }\n")
+    
+    out.write("        else {\n")
+    out.write("            throw DecodingError.dataCorrupted(\n")
+    out.write("                DecodingError.Context(\n")
+    out.write("                    codingPath: decoder.codingPath,\n")
+    out.write('                    debugDescription: "Could not decode RpcErrorDetails - no matching error type found"\n')
+    out.write("                )\n")
+    out.write("            )\n")
+    out.write("        }\n")
+    out.write("    }\n")
+    out.write("\n")
+    out.write("    public func encode(to encoder: Encoder) throws {\n")
+    out.write("        switch self {\n")
     
     for error_type in error_types_sorted:
         case_name = to_swift_property_name(error_type)
-        code += f"        case .{case_name}(let error):\n"
-        code += "            try error.encode(to: encoder)\n"
+        out.write(f"        case .{case_name}(let error):\n")
+        out.write("            try error.encode(to: encoder)\n")
     
-    code += "        }\n"
-    code += "    }\n"
-    code += "}\n\n"
+    out.write("        }\n")
+    out.write("    }\n")
+    out.write("}\n\n")
+
+def reset_registries(ir: SpecIR, fragments: Optional[FragmentCache] = None) -> Set[str]:
+    """Reset the run-wide registries and return `generated_types` with every
+    component's type name reserved, so inline types never take one.
+
+    With `fragments` the registries are tracked, so cached and speculatively
+    emitted fragments can be checked against them and replayed into them.
+    """
+    global _global_inline_struct_schemas, _global_inline_object_types, _global_inline_object_names, _global_inline_structs
+    component_names = [node.swift_name for node in ir.schemas.values()]
+    if fragments is None:
+        _global_inline_struct_schemas = {}
+        _global_inline_object_types = {}
+        _global_inline_object_names = set()
+        _global_inline_structs = {}
+        return set(component_names)
+    _global_inline_struct_schemas = fragments.track_dict("inline_struct_schemas")
+    _global_inline_object_types = fragments.track_dict("inline_object_types")
+    _global_inline_object_names = fragments.track_set("inline_object_names")
+    _global_inline_structs = fragments.track_dict("inline_structs")
+    return fragments.track_set("generated_types", component_names)
+
+def schema_dependencies(graph: RefGraph, schema_hashes: List[str], node_id: int) -> Dict[str, str]:
+    """Content hashes of every schema `node_id` transitively references, by schema name"""
+    return {
+        graph.nodes[dependency].name: schema_hashes[dependency]
+        for dependency in sorted(graph.transitive_dependencies([node_id]))
+    }
+
+_worker_spec: Optional[Spec] = None
+_worker_schema_hashes: List[str] = []
+
+def _init_emission_worker(spec: Spec, schema_hashes: List[str], profile: bool) -> None:
+    global _worker_spec, _worker_schema_hashes
+    _worker_spec = spec
+    _worker_schema_hashes = schema_hashes
+    if profile:
+        profiler.enable(memory=False)
+
+def _emit_schema_chunk(node_ids: List[int]) -> Dict[str, Any]:
+    """Emit a run of schemas in a worker process against fresh registries"""
+    graph = _worker_spec.graph
+    fragments = FragmentCache(path=None)
+    generated_types = reset_registries(_worker_spec.ir, fragments)
+    for node_id in node_ids:
+        node = graph.nodes[node_id]
+        with profiler.timed(EMIT, node.name):
+            fragments.emit(
+                node.name,
+                _worker_schema_hashes[node_id],
+                schema_dependencies(graph, _worker_schema_hashes, node_id),
+                lambda: generate_swift_for_schema(node, generated_types, {}),
+            )
+    return fragments.fragments
+
+def emit_schemas_in_parallel(spec: Spec, node_ids: List[int], schema_hashes: List[str], jobs: int) -> Dict[str, Any]:
+    """Emit `node_ids` speculatively across `jobs` worker processes.
+
+    Each worker emits a contiguous run of the serial order, so schemas only
+    miss the registry entries written by earlier runs. The results are offered
+    to the serial pass in main as candidates: a fragment whose registry reads
+    don't match the serial state is re-emitted there, which keeps the output
+    byte-identical to a serial run.
+    """
+    chunk_size = -(-len(node_ids) // jobs)
+    chunks = [node_ids[start:start + chunk_size] for start in range(0, len(node_ids), chunk_size)]
+    candidates: Dict[str, Any] = {}
+    initargs = (spec, schema_hashes, profiler.enabled)
+    with ProcessPoolExecutor(max_workers=len(chunks), initializer=_init_emission_worker, initargs=initargs) as executor:
+        if profiler.enabled:
+            for chunk_fragments, schema_times in executor.map(partial(call_with_schema_times, _emit_schema_chunk), chunks):
+                candidates.update(chunk_fragments)
+                profiler.merge_schema_times(schema_times)
+        else:
+            for chunk_fragments in executor.map(_emit_schema_chunk, chunks):
+                candidates.update(chunk_fragments)
+    return candidates
+
+def write_swift_types(
+    spec: Spec,
+    out: SwiftWriter,
+    discriminators: Dict[str, Set[str]],
+    fragments: Optional[FragmentCache] = None,
+    jobs: int = 1,
+    shards: Optional[ShardedSwiftWriter] = None,
+    shard_mode: Optional[ShardMode] = None,
+) -> Set[str]:
+    """Write the contents of Types.swift to `out`. Returns the generated type names.
+
+    Parallel emission (`jobs` > 1) needs `fragments` to merge worker results.
+    With `shards`, component types and the inline types they create are
+    written to the shard `shard_mode` assigns them instead of to `out`.
+    """
+    ir = spec.ir
+    out.write("import Foundation\n\n")
+    out.mark("Auto-generated Types", blank_line=True)
     
-    return code
+    # Add AnyCodable helper for arbitrary JSON objects
+    out.write(ANYCODABLE_HELPER_CODE)
+    out.write(DECODING_DIAGNOSTICS_CODE)
+    
+    # Generate discriminator enums first (they're used by other types)
+    if discriminators:
+        out.mark("Discriminator Enums", blank_line=True)
+        generate_discriminator_enums(discriminators, out)
+    
+    # Emit each schema once, after the schemas it references (recursive
+    # schemas are emitted together with the rest of their SCC)
+    graph = spec.graph
+    order = [node_id for scc in graph.topological_order() for node_id in scc]
+    generated_types = reset_registries(ir, fragments)
+    inline_types = {}
+    
+    if fragments is not None:
+        schema_hashes = [generate_schema_hash(node.raw, 16) for node in graph.nodes]
+        dependencies = {node_id: schema_dependencies(graph, schema_hashes, node_id) for node_id in order}
+        if jobs > 1:
+            pending = [
+                node_id for node_id in order
+                if not fragments.is_cached(graph.nodes[node_id].name, schema_hashes[node_id], dependencies[node_id])
+            ]
+            if pending:
+                fragments.add_candidates(emit_schemas_in_parallel(spec, pending, schema_hashes, jobs))
+    
+    inline_owners: Dict[str, str] = {}
+    for node_id in order:
+        node = graph.nodes[node_id]
+        inline_count = len(_global_inline_structs)
+        with profiler.timed(EMIT, node.name):
+            if fragments is None:
+                code = generate_swift_for_schema(node, generated_types, inline_types)
+            else:
+                code = fragments.emit(
+                    node.name,
+                    schema_hashes[node_id],
+                    dependencies[node_id],
+                    lambda: generate_swift_for_schema(node, generated_types, inline_types),
+                )
+        target = out
+        if shards is not None:
+            shard = shard_for(node.name, shard_mode)
+            target = shards.shard(shard)
+            for type_name in islice(_global_inline_structs, inline_count, None):
+                inline_owners[type_name] = shard
+        if code:
+            target.mark(node.swift_name)
+            target.write(code)
+            target.write("\n")
+    
+    # Add any generated inline structs, next to the types that use them when sharded
+    if _global_inline_structs:
+        if shards is None:
+            out.mark("Generated Inline Types", blank_line=True)
+            for type_name, struct_code in _global_inline_structs.items():
+                out.write(struct_code)
+                out.write("\n")
+        else:
+            marked: Set[str] = set()
+            for type_name, struct_code in _global_inline_structs.items():
+                shard = inline_owners[type_name]
+                target = shards.shard(shard)
+                if shard not in marked:
+                    target.mark("Generated Inline Types", blank_line=True)
+                    marked.add(shard)
+                target.write(struct_code)
+                target.write("\n")
+    
+    alias = legacy_inline_object_alias(generated_types)
+    if alias:
+        out.mark("Deprecated Names", blank_line=True)
+        out.write(alias)
+        out.write("\n")
+    
+    # Generate RPC error enum
+    generate_rpc_error_enum(ir, out)
+    return generated_types
 
-def main():
-    """Main function to generate Swift types from OpenAPI spec"""
-    print(f"Loading OpenAPI specification from {OPENAPI_PATH}...")
-    openapi = load_openapi()
+def legacy_inline_object_alias(generated_types: Set[str]) -> str:
+    """Deprecated `InlineObject` typealias for the one inline object of the old shape, if unambiguous"""
+    if LEGACY_INLINE_OBJECT_NAME in generated_types:
+        return ""
+    matches = {
+        type_name for schema_key, type_name in _global_inline_object_types.items()
+        if tuple(sorted(json.loads(schema_key).get("properties", {}))) == LEGACY_INLINE_OBJECT_PROPERTIES
+    }
+    if len(matches) != 1:
+        return ""
+    type_name = matches.pop()
+    return (
+        "/// Inline objects are named after the type that contains them\n"
+        f'@available(*, deprecated, renamed: "{type_name}")\n'
+        f"public typealias {LEGACY_INLINE_OBJECT_NAME} = {type_name}\n"
+    )
+
+def main(
+    spec: Optional[Spec] = None,
+    fragments: Optional[FragmentCache] = None,
+    jobs: int = 1,
+    shard_mode: Optional[ShardMode] = None,
+):
+    """Main function to generate Swift types from OpenAPI spec.
+
+    With `fragments`, component schemas whose content and dependencies are
+    unchanged since the run that wrote the manifest are spliced in from it
+    instead of being regenerated. With `jobs` > 1 the remaining schemas are
+    emitted on a process pool first (see emit_schemas_in_parallel). With
+    `shard_mode`, component types go to Types+<Shard>.swift files next to
+    Types.swift (see type_shards.py).
+    """
+    if spec is None:
+        spec = load_spec()
+        print(f"Loaded OpenAPI specification from {spec.path}")
+    ir = spec.ir
     
-    components_schemas = openapi.get("components", {}).get("schemas", {})
+    components_schemas = ir.schemas
     if not components_schemas:
         print("No schemas found in OpenAPI specification")
         return
@@ -1774,87 +1599,39 @@ def main():
     discriminators = collect_discriminator_enums(components_schemas)
     print(f"Found {len(discriminators)} discriminator fields with enum values")
     
-    # Generate Swift code
-    swift_code = "import Foundation\n\n"
-    swift_code += "// MARK: - Auto-generated Types\n\n"
+    # Parallel emission merges worker results through an in-memory fragment cache
+    if jobs > 1 and fragments is None:
+        fragments = FragmentCache(path=None)
     
-    
-    # Add AnyCodable helper for arbitrary JSON objects
-    swift_code += ANYCODABLE_HELPER_CODE
-    swift_code += DECODING_DIAGNOSTICS_CODE
-    
-    # Generate discriminator enums first (they're used by other types)
-    if discriminators:
-        swift_code += "// MARK: - Discriminator Enums\n\n"
-        swift_code += generate_discriminator_enums(discriminators)
-    
-    generated_types = set()
-    inline_types = {}
-    
-    # Clear the global inline struct registry to ensure clean state
-    global _global_inline_struct_schemas
-    _global_inline_struct_schemas = {}
-    
-    # Clear any previous inline structs registry
-    if hasattr(get_swift_primitive_type, '_inline_structs'):
-        delattr(get_swift_primitive_type, '_inline_structs')
-    
-    # Sort schemas by dependency (simple types first, then complex)
-    def schema_complexity(item):
-        name, schema = item
-        if "$ref" in schema and len(schema) == 1:
-            return 0  # Simple reference
-        elif schema.get("type") in ["string", "integer", "number", "boolean"]:
-            return 1  # Primitive
-        elif "enum" in schema:
-            return 2  # Enum
-        elif schema.get("type") == "array":
-            return 3  # Array
-        elif "oneOf" in schema or "anyOf" in schema:
-            return 4  # Union
-        elif "allOf" in schema:
-            return 5  # Composition
-        else:
-            return 6  # Object
-    
-    sorted_schemas = sorted(components_schemas.items(), key=schema_complexity)
-    
-    # Generate types
-    for name, schema in sorted_schemas:
-        code = generate_swift_for_schema(name, schema, components_schemas, generated_types, inline_types)
-        if code:
-            swift_code += f"// MARK: - {to_swift_type_name(name)}\n"
-            swift_code += code + "\n"
-    
-    # Add any generated inline structs
-    if hasattr(get_swift_primitive_type, '_inline_structs'):
-        swift_code += "// MARK: - Generated Inline Types\n\n"
-        for type_name, struct_code in get_swift_primitive_type._inline_structs.items():
-            swift_code += struct_code + "\n"
-    
-    # Generate RPC error enum
-    swift_code += generate_rpc_error_enum(openapi, components_schemas)
-    
-    # Write to file
+    # Generate Swift code, streaming it to the output file as it is produced
+    output_dir = os.path.dirname(OUTPUT_PATH)
     print(f"Writing Swift types to {OUTPUT_PATH}...")
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        f.write(swift_code)
+    if shard_mode is None:
+        with SwiftWriter(OUTPUT_PATH) as out:
+            generated_types = write_swift_types(spec, out, discriminators, fragments, jobs)
+        remove_stale_shards(output_dir, SHARD_FILE_PREFIX)
+    else:
+        with SwiftWriter(OUTPUT_PATH) as out, ShardedSwiftWriter(output_dir, SHARD_FILE_PREFIX, "import Foundation\n\n") as shards:
+            generated_types = write_swift_types(spec, out, discriminators, fragments, jobs, shards, shard_mode)
+        print(f"Sharded component types into {len(shards.shards)} {SHARD_FILE_PREFIX}*.swift files ({shard_mode})")
     
-    total_generated = len(generated_types)
-    if hasattr(get_swift_primitive_type, '_inline_structs'):
-        total_generated += len(get_swift_primitive_type._inline_structs)
+    total_generated = len(generated_types) + len(_global_inline_structs)
     
     print(f"Successfully generated {total_generated} Swift types")
+    if jobs > 1:
+        print(f"Merged {fragments.merged} schemas emitted on {jobs} worker processes, re-emitted {fragments.emitted} serially")
+    if fragments is not None and fragments.path is not None:
+        fragments.save()
+        print(f"Reused {fragments.reused} cached schema fragments, regenerated {fragments.emitted + fragments.merged}")
     print(f"Output written to: {OUTPUT_PATH}")
 
-    methods_code, method_count = generate_methods_code(openapi, components_schemas)
-    methods_output_dir = os.path.dirname(os.path.abspath(METHODS_OUTPUT_PATH))
-    os.makedirs(methods_output_dir, exist_ok=True)
+    methods_code, method_count = generate_methods_code(ir)
     print(f"Writing Swift methods to {METHODS_OUTPUT_PATH}...")
-    with open(METHODS_OUTPUT_PATH, "w", encoding="utf-8") as f:
-        f.write(methods_code)
+    write_file(METHODS_OUTPUT_PATH, methods_code)
     print(f"Successfully generated {method_count} RPC methods")
     print(f"Output written to: {METHODS_OUTPUT_PATH}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    outputs.save_manifest()
+    print(outputs.stats.summary())
\ No newline at end of file
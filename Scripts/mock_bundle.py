@@ -0,0 +1,128 @@
+"""Output formats of the generated mocks.
+
+By default every mock is written as an indented JSON file to each test
+target's Mock directory (`pretty`); `minified` writes the same files without
+whitespace. The other two formats write a single bundle per Mock directory
+holding the minified JSON of every mock, so test resources are copied and
+loaded in one bulk operation:
+
+`ndjson` writes `mocks.ndjson`:
+
+    {"format":"near-mock-bundle","version":1,"index":{"<name>":[offset,length],...}}
+    <mock JSON on one line>
+    <mock JSON on one line>
+    ...
+
+`binary` writes `mocks.bin`, the same JSON bytes behind a binary index that is
+read without a JSON parser (all integers little-endian):
+
+    "NEARMOCK"  u32 version  u32 count
+    count x (u16 name length, UTF-8 name, u32 offset, u32 length)
+    <mock JSON><mock JSON>...
+
+In both, a mock's name is its file name without `.json`, and its offset is
+counted from the start of the data after the header. Readers load the file
+once and slice fixtures out of it without parsing the other mocks; the
+generated Swift loader is `MockFixtures` (see generate_tests.py).
+"""
+
+import json
+import struct
+from typing import Dict, Iterable, List, Tuple
+
+PRETTY_FORMAT = "pretty"
+MINIFIED_FORMAT = "minified"
+NDJSON_FORMAT = "ndjson"
+BINARY_FORMAT = "binary"
+MOCK_FORMATS = (PRETTY_FORMAT, MINIFIED_FORMAT, NDJSON_FORMAT, BINARY_FORMAT)
+
+# Bundle file written to each Mock directory, by format
+BUNDLE_FILENAMES = {NDJSON_FORMAT: "mocks.ndjson", BINARY_FORMAT: "mocks.bin"}
+BUNDLE_FORMAT = "near-mock-bundle"
+BUNDLE_VERSION = 1
+BINARY_MAGIC = b"NEARMOCK"
+
+MOCK_EXTENSION = ".json"
+
+_COUNTS = struct.Struct("<II")
+_NAME_LENGTH = struct.Struct("<H")
+_SPAN = struct.Struct("<II")
+
+
+def is_minified(mock_format: str) -> bool:
+    """Whether mocks in `mock_format` are serialized without whitespace"""
+    return mock_format != PRETTY_FORMAT
+
+
+def mock_name(filename: str) -> str:
+    """Bundle key of a mock file name"""
+    return filename[:-len(MOCK_EXTENSION)] if filename.endswith(MOCK_EXTENSION) else filename
+
+
+def _spans(mocks: Iterable[Tuple[str, str]], separator: bytes) -> Tuple[List[Tuple[str, int, int]], List[bytes]]:
+    spans: List[Tuple[str, int, int]] = []
+    chunks: List[bytes] = []
+    offset = 0
+    for filename, content in mocks:
+        data = content.encode("utf-8")
+        spans.append((mock_name(filename), offset, len(data)))
+        chunks.append(data)
+        offset += len(data) + len(separator)
+    return spans, chunks
+
+
+def encode_bundle(mocks: Iterable[Tuple[str, str]], mock_format: str = NDJSON_FORMAT) -> bytes:
+    """Bundle of (file name, minified JSON) mocks in `mock_format`, in the given order"""
+    if mock_format == BINARY_FORMAT:
+        spans, chunks = _spans(mocks, b"")
+        header = [BINARY_MAGIC, _COUNTS.pack(BUNDLE_VERSION, len(spans))]
+        for name, offset, length in spans:
+            encoded = name.encode("utf-8")
+            header += [_NAME_LENGTH.pack(len(encoded)), encoded, _SPAN.pack(offset, length)]
+        return b"".join(header + chunks)
+    spans, chunks = _spans(mocks, b"\n")
+    if any(b"\n" in chunk for chunk in chunks):
+        raise ValueError("mocks in an NDJSON bundle must be on a single line")
+    index = {name: [offset, length] for name, offset, length in spans}
+    header = {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "index": index}
+    lines = [json.dumps(header, separators=(",", ":")).encode("utf-8")] + chunks
+    return b"\n".join(lines) + b"\n"
+
+
+def _split(data: bytes) -> Tuple[Dict[str, List[int]], bytes]:
+    if data.startswith(BINARY_MAGIC):
+        position = len(BINARY_MAGIC)
+        version, count = _COUNTS.unpack_from(data, position)
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"unsupported binary mock bundle version {version}")
+        position += _COUNTS.size
+        index: Dict[str, List[int]] = {}
+        for _ in range(count):
+            (name_length,) = _NAME_LENGTH.unpack_from(data, position)
+            position += _NAME_LENGTH.size
+            name = data[position:position + name_length].decode("utf-8")
+            position += name_length
+            index[name] = list(_SPAN.unpack_from(data, position))
+            position += _SPAN.size
+        return index, data[position:]
+    newline = data.find(b"\n")
+    if newline < 0:
+        raise ValueError("mock bundle has no header line")
+    header = json.loads(data[:newline])
+    if header.get("format") != BUNDLE_FORMAT or header.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"unsupported mock bundle: {header.get('format')} v{header.get('version')}")
+    return header["index"], data[newline + 1:]
+
+
+def read_bundle(path: str) -> Dict[str, bytes]:
+    """Mock name -> JSON bytes of every mock in the bundle at `path`"""
+    with open(path, "rb") as f:
+        index, body = _split(f.read())
+    return {name: body[offset:offset + length] for name, (offset, length) in index.items()}
+
+
+def bundle_filenames(path: str) -> List[str]:
+    """Mock file names in the bundle at `path`, in bundle order"""
+    with open(path, "rb") as f:
+        index, _ = _split(f.read())
+    return [name + MOCK_EXTENSION for name in index]
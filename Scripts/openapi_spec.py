@@ -0,0 +1,139 @@
+"""Shared loading of the OpenAPI specification used by every generator phase.
+
+Parsed specs are cached on disk in CACHE_DIR as pickles keyed by the SHA-256 of
+openapi.json and a generator version, so repeated regenerations skip JSON
+parsing and index building entirely. Entries for any other spec or generator
+version are evicted whenever a new entry is written.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+from ref_graph import RefGraph
+from spec_ir import SpecIR, build_ir
+
+OPENAPI_PATH = "./openapi.json"
+CACHE_DIR = "./.cache"
+
+# Bump when the layout of the cached `Spec` changes in a way the source hash
+# below would not catch (e.g. a pickle protocol change)
+SPEC_CACHE_VERSION = 1
+
+# Modules whose code shapes the cached `Spec`; editing any of them invalidates the cache
+_CACHE_SOURCES = ("openapi_spec.py", "spec_ir.py", "ref_graph.py")
+_CACHE_PREFIX = "spec-"
+_CACHE_SUFFIX = ".pickle"
+
+
+class Spec:
+    """Parsed OpenAPI document together with the lookup tables derived from it"""
+
+    __slots__ = ("path", "document", "schemas", "paths", "ir", "graph")
+
+    def __init__(self, document: Dict[str, Any], path: str = OPENAPI_PATH):
+        self.path = path
+        self.document = document
+        self.schemas: Dict[str, Any] = document.get("components", {}).get("schemas", {}) or {}
+        self.paths: Dict[str, Any] = document.get("paths", {}) or {}
+        self.ir: SpecIR = build_ir(document)
+        self.graph: RefGraph = RefGraph(self.ir)
+
+
+def load_openapi(path: str = OPENAPI_PATH) -> Dict[str, Any]:
+    """Read and parse the OpenAPI document at `path`"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generator_version(sources: Tuple[str, ...] = _CACHE_SOURCES, version: int = SPEC_CACHE_VERSION) -> str:
+    """Short hash of a cache format `version` and the `sources` that produce the cached data.
+
+    Defaults to the sources that build the cached `Spec`.
+    """
+    digest = hashlib.sha256(str(version).encode())
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    for source in sources:
+        with open(os.path.join(scripts_dir, source), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def spec_cache_path(raw: bytes, cache_dir: str = CACHE_DIR) -> str:
+    """Cache file for the spec with content `raw` under the current generator version"""
+    content_hash = hashlib.sha256(raw).hexdigest()
+    return os.path.join(cache_dir, f"{_CACHE_PREFIX}{content_hash}-{generator_version()}{_CACHE_SUFFIX}")
+
+
+def _read_cached_spec(cache_path: str) -> Optional[Spec]:
+    try:
+        with open(cache_path, "rb") as f:
+            spec = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable spec cache {cache_path}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(cache_path)
+        return None
+    return spec if isinstance(spec, Spec) else None
+
+
+def _write_cached_spec(cache_path: str, spec: Spec) -> None:
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    evict_stale_cache_entries(cache_dir, keep=os.path.basename(cache_path))
+
+
+def evict_stale_cache_entries(cache_dir: str = CACHE_DIR, keep: Optional[str] = None) -> int:
+    """Remove cached specs other than `keep`. Returns the number of removed entries"""
+    if not os.path.isdir(cache_dir):
+        return 0
+    removed = 0
+    for filename in os.listdir(cache_dir):
+        if filename == keep or not filename.startswith(_CACHE_PREFIX):
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def load_spec(path: Optional[str] = None, use_cache: bool = True, cache_dir: str = CACHE_DIR) -> Spec:
+    """Load the OpenAPI document and build the shared `Spec` for it.
+
+    With `use_cache`, a pickled `Spec` matching the document's content hash and
+    the generator version is returned when present; otherwise the document is
+    parsed, indexed and written back to the cache.
+    """
+    path = path or OPENAPI_PATH
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found")
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    cache_path = spec_cache_path(raw, cache_dir) if use_cache else None
+    if cache_path:
+        spec = _read_cached_spec(cache_path)
+        if spec is not None:
+            spec.path = path
+            return spec
+
+    spec = Spec(json.loads(raw), path)
+    if cache_path:
+        try:
+            _write_cached_spec(cache_path, spec)
+        except OSError as e:
+            print(f"⚠️  Could not write spec cache {cache_path}: {e}")
+    return spec
@@ -0,0 +1,190 @@
+"""Compare-before-write layer for every file the generators produce.
+
+A file is only rewritten when its content changes; identical output leaves the
+existing file (and its mtime) alone, so a no-op regeneration doesn't invalidate
+Swift build caches. Every write, skip and removal is counted in `stats` for the
+summary printed at the end of a run.
+
+codegen.sh runs swiftformat over the generated Swift afterwards, so the bytes on
+disk are not the bytes the generator produced. The manifest in CACHE_DIR
+therefore records, per output, the SHA-256 of the generated content together
+with the size and mtime the file had after the run (`python3 -m outputs refresh`
+re-reads them once formatting is done). A file whose generated hash matches and
+which hasn't been touched since is skipped without being read at all.
+
+Usage (from the Scripts directory):
+    python3 -m outputs refresh    # record the current size and mtime of every output
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Union
+
+from openapi_spec import CACHE_DIR
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, "outputs-manifest.json")
+
+
+class OutputStats:
+    """Counts of generated files written, left unchanged and removed"""
+
+    __slots__ = ("written", "unchanged", "removed")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def record(self, written: bool) -> None:
+        if written:
+            self.written += 1
+        else:
+            self.unchanged += 1
+
+    def summary(self) -> str:
+        line = f"📦 Output files: {self.written} written, {self.unchanged} unchanged"
+        if self.removed:
+            line += f", {self.removed} removed"
+        return line
+
+
+stats = OutputStats()
+
+# path -> [sha256 of generated content, size, mtime_ns]; loaded on first use
+_manifest: Optional[Dict[str, List[Any]]] = None
+_manifest_dirty = False
+
+
+def _entries() -> Dict[str, List[Any]]:
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _remember(path: str, digest: str) -> None:
+    global _manifest_dirty
+    st = os.stat(path)
+    _entries()[os.path.normpath(path)] = [digest, st.st_size, st.st_mtime_ns]
+    _manifest_dirty = True
+
+
+def _is_recorded(path: str, digest: str) -> bool:
+    """Whether `path` was produced from content with `digest` and hasn't changed since"""
+    entry = _entries().get(os.path.normpath(path))
+    if entry is None or entry[0] != digest:
+        return False
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return entry[1] == st.st_size and entry[2] == st.st_mtime_ns
+
+
+def _has_content(path: str, data: bytes) -> bool:
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def write_file(path: str, content: Union[str, bytes]) -> bool:
+    """Write `content` to `path` unless it is already there. Returns whether the file was written"""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()
+    if _is_recorded(path, digest):
+        stats.record(False)
+        return False
+    written = not _has_content(path, data)
+    if written:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    _remember(path, digest)
+    stats.record(written)
+    return written
+
+
+def write_json(path: str, value: Any) -> bool:
+    """Write `value` as indented JSON, the format of the mock files"""
+    return write_file(path, json.dumps(value, indent=2))
+
+
+def replace_file(tmp_path: str, path: str, digest: str) -> bool:
+    """Move the finished `tmp_path` (content hash `digest`) to `path` unless `path` is up to date.
+
+    Returns whether `path` was written; `tmp_path` is gone either way.
+    """
+    if _is_recorded(path, digest) or (os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False)):
+        os.remove(tmp_path)
+        _remember(path, digest)
+        stats.record(False)
+        return False
+    os.replace(tmp_path, path)
+    _remember(path, digest)
+    stats.record(True)
+    return True
+
+
+def remove_file(path: str) -> None:
+    """Remove a generated file that is no longer produced"""
+    global _manifest_dirty
+    os.remove(path)
+    if _entries().pop(os.path.normpath(path), None) is not None:
+        _manifest_dirty = True
+    stats.removed += 1
+
+
+def save_manifest() -> None:
+    """Persist the output manifest if this run changed it"""
+    global _manifest_dirty
+    if not _manifest_dirty:
+        return
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(_entries()))
+    os.replace(tmp_path, MANIFEST_PATH)
+    _manifest_dirty = False
+
+
+def refresh_manifest() -> int:
+    """Re-record size and mtime of every output, e.g. after formatting. Returns the number of outputs"""
+    global _manifest_dirty
+    entries = _entries()
+    for path in list(entries):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            del entries[path]
+            continue
+        entries[path][1:] = [st.st_size, st.st_mtime_ns]
+    _manifest_dirty = True
+    save_manifest()
+    return len(entries)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if args != ["refresh"]:
+        print("usage: python3 -m outputs refresh")
+        return 2
+    print(f"Recorded {refresh_manifest()} generated files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Decode-time regression gate for the generated types.
+
+The generated DecodeTimingTests (see generate_tests.py) time decoding every
+RPC result type over its mocks and write the medians to the JSON file named by
+NEAR_TIMING_OUTPUT. This compares such a run with the checked-in baseline and
+fails, naming the types, when any type got slower than its tolerance allows.
+
+Usage (from the Scripts directory):
+    (cd .. && NEAR_TIMING_OUTPUT=timings.json swift test --filter DecodeTimingTests)
+    python3 -m perf_gate compare ../timings.json                  # exit 1 on regressions
+    python3 -m perf_gate compare ../timings.json --type-tolerance RpcBlockResponse=0.5
+    python3 -m perf_gate update ../timings.json                   # record a new baseline
+
+The baseline holds the medians, a default relative tolerance and per-type
+tolerances; `update` replaces the medians and keeps the tolerances. A type only
+regresses when it is both over its tolerance and at least --min-delta-ns
+slower, so timer noise on the tiny mocks doesn't fail the gate. The floor is
+only a small absolute guard; the tolerances already scale with the medians,
+so a per-type tolerance is enforced as set.
+
+A baseline without medians puts `compare` in record mode: it has nothing to
+compare with, so it records the timings as the baseline, like `update`, and
+passes. Commit the recorded baseline to turn the gate on.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from decode_timing import TIMING_BASELINE
+
+DEFAULT_TOLERANCE = 0.25
+# Absolute slowdown below which a type never counts as regressed (timer noise)
+DEFAULT_MIN_DELTA_NS = 2_000
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+OK = "ok"
+NEW = "new"
+MISSING = "missing"
+
+
+class Comparison(NamedTuple):
+    type_name: str
+    baseline_ns: Optional[int]
+    current_ns: Optional[int]
+    tolerance: float
+    status: str
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_ns or self.current_ns is None:
+            return None
+        return self.current_ns / self.baseline_ns
+
+
+def load_json(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_baseline(path: str) -> Dict:
+    """Baseline at `path`, with defaults for a missing file or missing keys"""
+    try:
+        baseline = load_json(path)
+    except FileNotFoundError:
+        baseline = {}
+    baseline.setdefault("tolerance", DEFAULT_TOLERANCE)
+    baseline.setdefault("tolerances", {})
+    baseline.setdefault("iterations", 0)
+    baseline.setdefault("medians", {})
+    return baseline
+
+
+def compare(
+    current: Dict[str, int],
+    baseline: Dict[str, int],
+    tolerance: float,
+    tolerances: Dict[str, float],
+    min_delta_ns: int = DEFAULT_MIN_DELTA_NS,
+) -> List[Comparison]:
+    """Compare current medians with baseline medians, type by type"""
+    comparisons = []
+    for type_name in sorted(set(current) | set(baseline)):
+        type_tolerance = tolerances.get(type_name, tolerance)
+        before = baseline.get(type_name)
+        after = current.get(type_name)
+        if before is None:
+            status = NEW
+        elif after is None:
+            status = MISSING
+        elif after > before * (1 + type_tolerance) and after - before >= min_delta_ns:
+            status = REGRESSED
+        elif after < before / (1 + type_tolerance) and before - after >= min_delta_ns:
+            status = IMPROVED
+        else:
+            status = OK
+        comparisons.append(Comparison(type_name, before, after, type_tolerance, status))
+    return comparisons
+
+
+def format_time(nanoseconds: Optional[int]) -> str:
+    if nanoseconds is None:
+        return "-"
+    if nanoseconds >= 1_000_000:
+        return f"{nanoseconds / 1_000_000:.2f} ms"
+    return f"{nanoseconds / 1_000:.1f} µs"
+
+
+def format_report(comparisons: List[Comparison], min_delta_ns: int = DEFAULT_MIN_DELTA_NS) -> str:
+    """Readable table of the comparisons followed by a verdict"""
+    width = max([len("Type")] + [len(c.type_name) for c in comparisons])
+    lines = [
+        f"Median decode time per type vs baseline (regressions must also be {format_time(min_delta_ns)} slower)",
+        f"{'Type':<{width}}  {'Baseline':>10}  {'Current':>10}  {'Change':>8}  {'Allowed':>8}  Status",
+    ]
+    for c in comparisons:
+        change = f"{(c.ratio - 1) * 100:+.0f}%" if c.ratio is not None else "-"
+        lines.append(
+            f"{c.type_name:<{width}}  {format_time(c.baseline_ns):>10}  {format_time(c.current_ns):>10}  "
+            f"{change:>8}  {f'+{c.tolerance * 100:.0f}%':>8}  {c.status}"
+        )
+    lines.append("")
+
+    def by_status(status: str) -> List[Comparison]:
+        return [c for c in comparisons if c.status == status]
+
+    for c in by_status(NEW):
+        lines.append(f"🆕 {c.type_name} has no baseline yet")
+    for c in by_status(MISSING):
+        lines.append(f"⚠️  {c.type_name} is in the baseline but was not timed")
+    improved = by_status(IMPROVED)
+    if improved:
+        lines.append(f"🚀 {len(improved)} improved: {', '.join(c.type_name for c in improved)}; consider updating the baseline")
+    regressed = by_status(REGRESSED)
+    if regressed:
+        lines.append(f"❌ {len(regressed)} regressed:")
+        for c in regressed:
+            lines.append(
+                f"   • {c.type_name}: {format_time(c.baseline_ns)} → {format_time(c.current_ns)} "
+                f"({c.ratio:.2f}x, allowed {1 + c.tolerance:.2f}x)"
+            )
+    else:
+        lines.append(f"✅ No decode regressions in {len(comparisons)} types")
+    return "\n".join(lines)
+
+
+def record_baseline(baseline: Dict, timings: Dict, path: str) -> None:
+    """Replace the medians of `baseline` with those of `timings`, keeping its tolerances, and write it to `path`"""
+    baseline["iterations"] = timings.get("iterations", 0)
+    baseline["medians"] = dict(sorted(timings["medians"].items()))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    print(f"✅ Recorded {len(baseline['medians'])} medians in {path}")
+
+
+def parse_type_tolerance(value: str):
+    type_name, separator, tolerance = value.partition("=")
+    try:
+        if not separator or not type_name:
+            raise ValueError
+        return type_name, float(tolerance)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected TYPE=TOLERANCE, got {value}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m perf_gate",
+        description="Compare decode timings of the generated types with the checked-in baseline",
+    )
+    parser.add_argument("--baseline", default=TIMING_BASELINE, help=f"baseline file (default: {TIMING_BASELINE})")
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    check = subparsers.add_parser("compare", help="fail when a type decodes slower than its baseline allows")
+    check.add_argument("timings", help="timings written by DecodeTimingTests")
+    check.add_argument("--tolerance", type=float, help="relative slowdown allowed for every type (default: the baseline's)")
+    check.add_argument(
+        "--type-tolerance",
+        type=parse_type_tolerance,
+        action="append",
+        default=[],
+        metavar="TYPE=X",
+        help="relative slowdown allowed for one type, overriding the baseline",
+    )
+    check.add_argument(
+        "--min-delta-ns",
+        type=int,
+        default=DEFAULT_MIN_DELTA_NS,
+        metavar="N",
+        help=f"smallest slowdown in nanoseconds that counts as a regression (default: {DEFAULT_MIN_DELTA_NS})",
+    )
+    update = subparsers.add_parser("update", help="record the timings as the new baseline")
+    update.add_argument("timings", help="timings written by DecodeTimingTests")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    timings = load_json(args.timings)
+    baseline = load_baseline(args.baseline)
+
+    if args.command == "update":
+        record_baseline(baseline, timings, args.baseline)
+        return 0
+
+    if not baseline["medians"]:
+        print(f"📝 {args.baseline} has no medians yet, so there is nothing to compare with: recording this run")
+        record_baseline(baseline, timings, args.baseline)
+        print("   Commit the baseline to enable the regression gate")
+        return 0
+
+    tolerance = args.tolerance if args.tolerance is not None else baseline["tolerance"]
+    tolerances = dict(baseline["tolerances"])
+    tolerances.update(args.type_tolerance)
+    comparisons = compare(timings["medians"], baseline["medians"], tolerance, tolerances, args.min_delta_ns)
+    print(format_report(comparisons, args.min_delta_ns))
+    return 1 if any(c.status == REGRESSED for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
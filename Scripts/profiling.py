@@ -0,0 +1,182 @@
+"""Profiling of the generators themselves.
+
+With `python3 -m codegen --profile`, every phase of the run records its wall
+time and, through tracemalloc, the peak memory it allocated, and the generators
+record the time spent on each schema:
+
+    emit      emitting a component schema's Swift in the types phase
+    sample    generating and serializing a schema's mocks (validation included)
+    validate  validating a generated sample against its schema
+
+One-off setup the generators share across schemas, like loading the compiled
+validators, runs before the schema timers start, so it only shows in the
+phase's time.
+
+`--profile-dir DIR` also dumps cProfile stats of each phase to DIR/<phase>.prof
+(read them with `python3 -m pstats` or snakeviz), and `--profile-output FILE`
+writes the whole profile as JSON, which is what benchmark_codegen.py collects.
+Schema times recorded on worker processes (--jobs N) are sent back with the
+results; peak memory only covers the main process. tracemalloc slows a run
+down noticeably, so wall times measured with it are only comparable with each
+other; --no-tracemalloc keeps the timings without the memory peaks.
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Per-schema time categories, in report order
+EMIT = "emit"
+SAMPLE = "sample"
+VALIDATE = "validate"
+CATEGORIES = (EMIT, SAMPLE, VALIDATE)
+
+# Slowest schemas listed per category in the summary
+TOP_SCHEMAS = 10
+
+_NULL_CONTEXT = nullcontext()
+
+SchemaTimes = Dict[str, Dict[str, float]]
+
+
+class PhaseProfile(NamedTuple):
+    name: str
+    seconds: float
+    peak_bytes: Optional[int]  # None without tracemalloc
+
+
+class Profiler:
+    """Phase wall times, peak memory and per-schema times of a generator run"""
+
+    __slots__ = ("enabled", "memory", "dump_dir", "phases", "schemas")
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.dump_dir: Optional[str] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.phases: List[PhaseProfile] = []
+        # category -> schema name -> seconds
+        self.schemas: SchemaTimes = {category: {} for category in CATEGORIES}
+
+    def enable(self, memory: bool = True, dump_dir: Optional[str] = None) -> None:
+        """Record from now on; `memory` traces allocations, `dump_dir` gets cProfile dumps"""
+        self.enabled = True
+        self.memory = memory
+        self.dump_dir = dump_dir
+        if dump_dir:
+            os.makedirs(dump_dir, exist_ok=True)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the wall time (and peak memory, cProfile stats) of the enclosed phase"""
+        if not self.enabled:
+            yield
+            return
+        if self.memory:
+            # Restart tracing so the peak is this phase's own
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            tracemalloc.start()
+        profile = cProfile.Profile() if self.dump_dir else None
+        started = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            seconds = time.perf_counter() - started
+            peak_bytes = None
+            if self.memory:
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            if profile is not None:
+                profile.dump_stats(os.path.join(self.dump_dir, f"{name}.prof"))
+            self.phases.append(PhaseProfile(name, seconds, peak_bytes))
+
+    def timed(self, category: str, schema_name: str) -> ContextManager[None]:
+        """Add the time spent in the enclosed block to `schema_name` under `category`"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed(category, schema_name)
+
+    @contextmanager
+    def _timed(self, category: str, schema_name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            times = self.schemas[category]
+            times[schema_name] = times.get(schema_name, 0.0) + time.perf_counter() - started
+
+    def take_schema_times(self) -> SchemaTimes:
+        """The per-schema times recorded so far, clearing them (for worker processes)"""
+        schemas = self.schemas
+        self.schemas = {category: {} for category in CATEGORIES}
+        return schemas
+
+    def merge_schema_times(self, schemas: SchemaTimes) -> None:
+        """Add per-schema times recorded by a worker process"""
+        for category, times in schemas.items():
+            merged = self.schemas[category]
+            for schema_name, seconds in times.items():
+                merged[schema_name] = merged.get(schema_name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "phases": [phase._asdict() for phase in self.phases],
+            "schemas": self.schemas,
+        }
+
+    def save(self, path: str) -> None:
+        """Write the profile as JSON to `path`"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    def summary(self, top: int = TOP_SCHEMAS) -> str:
+        lines = ["⏱️  Profile:"]
+        for phase in self.phases:
+            line = f"   {phase.name:<12} {phase.seconds:8.2f}s"
+            if phase.peak_bytes is not None:
+                line += f"   peak {format_bytes(phase.peak_bytes)}"
+            lines.append(line)
+        if len(self.phases) > 1:
+            lines.append(f"   {'total':<12} {sum(phase.seconds for phase in self.phases):8.2f}s")
+        for category in CATEGORIES:
+            times = self.schemas[category]
+            if not times:
+                continue
+            lines.append(f"   Slowest schemas ({category}, {len(times)} schemas, {sum(times.values()):.2f}s in total):")
+            for schema_name, seconds in slowest(times, top):
+                lines.append(f"      {seconds * 1000:9.1f} ms  {schema_name}")
+        if self.dump_dir:
+            lines.append(f"   cProfile stats in {self.dump_dir}/<phase>.prof")
+        return "\n".join(lines)
+
+
+def slowest(times: Dict[str, float], top: int) -> List[Tuple[str, float]]:
+    """The `top` (name, seconds) entries of `times`, slowest first"""
+    return sorted(times.items(), key=lambda item: (-item[1], item[0]))[:top]
+
+
+def format_bytes(count: float) -> str:
+    return f"{count / (1 << 20):.1f} MB"
+
+
+profiler = Profiler()
+
+
+def call_with_schema_times(function: Callable[[Any], Any], argument: Any) -> Tuple[Any, SchemaTimes]:
+    """Run `function(argument)` on a worker process and return its result with
+    the schema times it recorded, for the main process to merge"""
+    result = function(argument)
+    return result, profiler.take_schema_times()
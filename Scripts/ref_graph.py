@@ -0,0 +1,154 @@
+"""Resolved `$ref` graph between the component schemas of a spec.
+
+Every component schema is a node identified by its `SchemaNode.id`. An edge
+A -> B means some schema nested in A references B. The graph is built once from
+the IR (and cached with the Spec), so generators answer "what does this type
+depend on" and "can this reference recurse" with list lookups instead of
+parsing `$ref` strings and threading sets of seen references.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Set
+
+from spec_ir import SchemaNode, SpecIR, iter_nodes
+
+
+class RefGraph:
+    """Adjacency lists, reverse edges and strongly-connected components of the component schemas"""
+
+    __slots__ = ("nodes", "ids", "edges", "reverse_edges", "sccs", "scc_ids", "recursive")
+
+    def __init__(self, ir: SpecIR):
+        self.nodes: List[SchemaNode] = list(ir.schemas.values())
+        self.ids: Dict[str, int] = {node.name: node.id for node in self.nodes}
+        self.edges: List[List[int]] = [_references(node) for node in self.nodes]
+        self.reverse_edges: List[List[int]] = [[] for _ in self.nodes]
+        for source, targets in enumerate(self.edges):
+            for target in targets:
+                self.reverse_edges[target].append(source)
+
+        # SCCs come out of Tarjan's algorithm dependencies-first
+        self.sccs: List[List[int]] = _strongly_connected_components(self.edges)
+        self.scc_ids: List[int] = [0] * len(self.nodes)
+        for scc_id, members in enumerate(self.sccs):
+            for member in members:
+                self.scc_ids[member] = scc_id
+        self.recursive: List[bool] = [
+            len(self.sccs[self.scc_ids[node_id]]) > 1 or node_id in self.edges[node_id]
+            for node_id in range(len(self.nodes))
+        ]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def is_recursive(self, node_id: int) -> bool:
+        """Whether the schema can (transitively) reference itself"""
+        return self.recursive[node_id]
+
+    def topological_order(self) -> List[List[int]]:
+        """SCCs ordered so every schema comes after the schemas it references.
+
+        Mutually recursive schemas share an SCC and are emitted together. Among
+        SCCs that are ready at the same time the one whose first member comes
+        first in the spec goes first, so the order is deterministic and stays
+        close to the spec's own ordering.
+        """
+        scc_count = len(self.sccs)
+        pending = [0] * scc_count
+        dependents: List[Set[int]] = [set() for _ in range(scc_count)]
+        for source, targets in enumerate(self.edges):
+            source_scc = self.scc_ids[source]
+            for target in targets:
+                target_scc = self.scc_ids[target]
+                if target_scc != source_scc and source_scc not in dependents[target_scc]:
+                    dependents[target_scc].add(source_scc)
+                    pending[source_scc] += 1
+
+        ready = [(self.sccs[scc_id][0], scc_id) for scc_id in range(scc_count) if pending[scc_id] == 0]
+        heapq.heapify(ready)
+        order: List[List[int]] = []
+        while ready:
+            _, scc_id = heapq.heappop(ready)
+            order.append(self.sccs[scc_id])
+            for dependent in dependents[scc_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    heapq.heappush(ready, (self.sccs[dependent][0], dependent))
+        return order
+
+    def transitive_dependencies(self, node_ids: Iterable[int]) -> Set[int]:
+        """All schemas reachable from `node_ids`, excluding the start nodes unless on a cycle"""
+        return _reachable(self.edges, node_ids)
+
+    def transitive_dependents(self, node_ids: Iterable[int]) -> Set[int]:
+        """All schemas that (transitively) reference any of `node_ids`"""
+        return _reachable(self.reverse_edges, node_ids)
+
+
+def _references(component: SchemaNode) -> List[int]:
+    """Sorted ids of the components referenced anywhere inside `component`"""
+    targets = {node.ref.id for node in iter_nodes(component) if node.ref is not None}
+    return sorted(targets)
+
+
+def _reachable(edges: List[List[int]], start: Iterable[int]) -> Set[int]:
+    seen: Set[int] = set()
+    stack = [target for node_id in start for target in edges[node_id]]
+    while stack:
+        node_id = stack.pop()
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        stack.extend(edges[node_id])
+    return seen
+
+
+def _strongly_connected_components(edges: List[List[int]]) -> List[List[int]]:
+    """Iterative Tarjan's algorithm. Returns SCCs in reverse topological order
+    (every SCC is listed after all SCCs it has edges to), members sorted by id"""
+    count = len(edges)
+    index = [-1] * count
+    lowlink = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    sccs: List[List[int]] = []
+    next_index = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node_id, edge_pos = work.pop()
+            if edge_pos == 0:
+                index[node_id] = lowlink[node_id] = next_index
+                next_index += 1
+                stack.append(node_id)
+                on_stack[node_id] = True
+            recursed = False
+            targets = edges[node_id]
+            while edge_pos < len(targets):
+                target = targets[edge_pos]
+                edge_pos += 1
+                if index[target] == -1:
+                    work.append((node_id, edge_pos))
+                    work.append((target, 0))
+                    recursed = True
+                    break
+                if on_stack[target]:
+                    lowlink[node_id] = min(lowlink[node_id], index[target])
+            if recursed:
+                continue
+            if lowlink[node_id] == index[node_id]:
+                members = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    members.append(member)
+                    if member == node_id:
+                        break
+                sccs.append(sorted(members))
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node_id])
+    return sccs
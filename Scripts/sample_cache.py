@@ -0,0 +1,69 @@
+"""Bounded LRU cache of generated mock subtrees.
+
+The same component schemas (`CryptoHash`, `BlockHeaderView`, `AccountView`,
+the error types, ...) are referenced from most request/response schemas and
+union variants, and `generate_sample` used to rebuild them from scratch every
+time. The generator now draws one of SUBTREE_SEEDS seeds for each `$ref` it
+expands and builds the referenced subtree with an RNG derived from the
+(ref, null admissibility, seed) key alone, so a subtree is a pure function of
+its key: it is generated once, and every later use with the same key gets the
+cached value. Repeated references still vary across the seeds, and evicting
+an entry never changes the output, it only costs a regeneration.
+
+Cached samples are shared, not copied: callers must treat them as read-only
+and shallow-copy a dict before adding or removing its keys.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+# Distinct samples kept per referenced schema, so repeated refs still vary
+SUBTREE_SEEDS = 8
+# Upper bound on cached subtrees; the spec needs a few hundred
+MAX_ENTRIES = 4096
+
+_MISSING = object()
+
+
+class SampleCache:
+    """LRU map from (ref, null admissibility, seed) keys to generated samples"""
+
+    __slots__ = ("entries", "max_entries", "hits", "misses", "evictions")
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(found, sample) for `key`, marking it most recently used"""
+        sample = self.entries.get(key, _MISSING)
+        if sample is _MISSING:
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, sample
+
+    def put(self, key: Hashable, sample: Any) -> None:
+        self.entries[key] = sample
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100 * self.hits / lookups if lookups else 0
+        line = f"♻️  Subtree cache: {self.hits}/{lookups} hits ({rate:.0f}%), {len(self.entries)} entries"
+        if self.evictions:
+            line += f", {self.evictions} evicted"
+        return line
@@ -0,0 +1,77 @@
+"""Size classes of generated mock samples.
+
+The regular mocks are `small`: one item per unbounded array, one-character
+strings and a single map entry, which keeps the test fixtures tiny but says
+nothing about decode throughput on real NEAR payloads. `medium` and `huge`
+scale array cardinality, string and byte-string lengths, map entries and
+recursion depth up, and give the arrays that dominate real responses (a
+chunk's transactions and receipts, a block's chunks, view_state values, state
+changes) their own, much larger, cardinalities. Bounds in the schema
+(minItems/maxItems, minLength/maxLength, patterns, formats) still win, so the
+samples stay valid in every class.
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+
+class SizeClass(NamedTuple):
+    name: str
+    array_items: int  # items in arrays the schema doesn't bound
+    string_length: int  # characters in unconstrained strings
+    bytes_length: int  # decoded bytes in base64 (`format: bytes`) strings
+    map_entries: int  # entries in additionalProperties maps
+    null_rate: float  # chance an optional nullable value is null rather than nested
+    recursion_budget: int  # expansions of a recursive SCC on one path
+    # Items of specific (schema, property) arrays, overriding array_items
+    property_items: Dict[Tuple[str, str], int]
+
+
+SMALL = SizeClass(
+    name="small",
+    array_items=1,
+    string_length=1,
+    bytes_length=6,
+    map_entries=1,
+    null_rate=0.1,
+    recursion_budget=3,
+    property_items={},
+)
+MEDIUM = SizeClass(
+    name="medium",
+    array_items=4,
+    string_length=32,
+    bytes_length=64,
+    map_entries=4,
+    null_rate=0.05,
+    recursion_budget=4,
+    property_items={
+        ("RpcBlockResponse", "chunks"): 16,
+        ("RpcChunkResponse", "transactions"): 200,
+        ("RpcChunkResponse", "receipts"): 200,
+        ("ViewStateResult", "values"): 1000,
+        ("ViewStateResult", "proof"): 32,
+        ("RpcStateChangesInBlockResponse", "changes"): 500,
+    },
+)
+HUGE = SizeClass(
+    name="huge",
+    array_items=6,
+    string_length=128,
+    bytes_length=256,
+    map_entries=16,
+    null_rate=0.0,
+    recursion_budget=6,
+    property_items={
+        ("RpcBlockResponse", "chunks"): 1024,
+        ("RpcChunkResponse", "transactions"): 2500,
+        ("RpcChunkResponse", "receipts"): 2500,
+        ("ViewStateResult", "values"): 12000,
+        ("ViewStateResult", "proof"): 256,
+        ("RpcStateChangesInBlockResponse", "changes"): 10000,
+    },
+)
+
+SIZE_CLASSES = {size.name: size for size in (SMALL, MEDIUM, HUGE)}
+
+# Schemas whose large samples benchmark decode throughput
+BENCHMARK_SCHEMAS = ("RpcBlockResponse", "RpcChunkResponse", "ViewStateResult", "RpcStateChangesInBlockResponse")
@@ -0,0 +1,549 @@
+"""Typed intermediate representation (IR) of the OpenAPI specification.
+
+The IR is built once per spec (and cached along with it, see openapi_spec.py)
+and is what the types, mocks and tests generators walk instead of the raw
+document. Compared to the raw dicts it:
+  - holds `$ref`s as direct pointers to the referenced component node
+  - precomputes Swift type and property names
+  - precomputes the merged form of every `allOf`
+  - extracts the JSON-RPC method table once for all generators, with an index
+    of the components by Swift name and the result and error payload types of
+    every response envelope
+
+Every node keeps the schema object it was built from in `raw`, so generators
+can still look at keywords the IR does not model.
+"""
+
+import sys
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+REF_PREFIX = "#/components/schemas/"
+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def to_swift_type_name(name: str) -> str:
+    """Convert schema name to Swift type name (PascalCase)"""
+    if not name:
+        return name
+
+    # Handle names with underscores - preserve existing casing of each part
+    if "_" in name:
+        parts = name.split("_")
+        # Capitalize any lowercase parts (which are likely connecting words)
+        processed_parts = []
+        for part in parts:
+            if part.islower():
+                processed_parts.append(part.capitalize())
+            else:
+                processed_parts.append(part)
+        return "".join(processed_parts)
+
+    # Handle camelCase to PascalCase
+    if name and name[0].islower():
+        return name[0].upper() + name[1:]
+
+    # Already PascalCase or simple name
+    return name
+
+def to_swift_property_name(name: str) -> str:
+    """Convert property name to Swift property name (camelCase)"""
+    if "_" in name:
+        parts = name.split("_")
+
+        def transform_part(part: str) -> str:
+            if not part:
+                return ""
+            # Preserve specialized casing when digits are present (e.g. p2p -> P2P)
+            if part.islower():
+                if any(ch.isdigit() for ch in part):
+                    digit_indices = [idx for idx, ch in enumerate(part) if ch.isdigit()]
+                    if digit_indices:
+                        has_letter_before = any(ch.isalpha() for ch in part[:digit_indices[0]])
+                        has_letter_after = any(ch.isalpha() for ch in part[digit_indices[-1] + 1:])
+                        if has_letter_before and has_letter_after:
+                            return "".join(ch.upper() if ch.isalpha() else ch for ch in part)
+                return part.capitalize()
+            if part.isupper():
+                return part
+            return part[0].upper() + part[1:]
+
+        first_part = parts[0].lower() if parts else ""
+        transformed = [transform_part(part) for part in parts[1:]]
+        return first_part + "".join(transformed)
+    # Handle all caps (ID -> id, URL -> url)
+    if name.isupper() and len(name) > 1:
+        return name.lower()
+    # Already camelCase or simple name
+    return name[0].lower() + name[1:] if name else name
+
+def to_swift_client_method_name(rpc_method: str) -> str:
+    """Convert the RPC method string to a Swift method name."""
+    method_name = rpc_method
+    if method_name.startswith("rpc_"):
+        method_name = method_name[4:]
+    if method_name.startswith("EXPERIMENTAL_"):
+        method_name = "experimental_" + method_name[len("EXPERIMENTAL_"):]
+    return to_swift_property_name(method_name)
+
+def resolve_ref_name(ref: str) -> Optional[str]:
+    """Extract type name from $ref"""
+    if not ref.startswith(REF_PREFIX):
+        return None
+    return ref.split("/")[-1]
+
+
+@dataclass(eq=False, **_SLOTS)
+class SchemaNode:
+    """A schema object of the spec, with refs resolved and names precomputed"""
+    raw: Dict[str, Any]
+    id: Optional[int] = None  # node id in the ref graph, for components
+    name: Optional[str] = None  # component name, for #/components/schemas entries
+    swift_name: Optional[str] = None  # Swift type name, for components
+    ref_name: Optional[str] = None  # component name a `$ref` points at
+    ref_swift_name: Optional[str] = None  # Swift type name a `$ref` points at
+    ref: Optional["SchemaNode"] = None  # node a `$ref` points at
+    type: Optional[str] = None
+    format: str = ""
+    nullable: bool = False
+    enum: Optional[List[Any]] = None
+    properties: Dict[str, "Property"] = field(default_factory=dict)
+    required: Tuple[str, ...] = ()
+    items: Optional["SchemaNode"] = None
+    tuple_items: Tuple["SchemaNode", ...] = ()  # tuple-style `items: [...]`
+    additional_properties: Optional["SchemaNode"] = None
+    pattern_properties: Dict[str, "SchemaNode"] = field(default_factory=dict)
+    union: Optional["Union"] = None
+    all_of: Tuple["SchemaNode", ...] = ()
+    merged: Optional["SchemaNode"] = None  # merged form of `all_of`
+
+    @property
+    def is_null(self) -> bool:
+        """Whether the schema only admits the null literal"""
+        if self.type == "null":
+            return True
+        return bool(self.enum) and all(value is None for value in self.enum)
+
+    @property
+    def target(self) -> "SchemaNode":
+        """The schema this node stands for once `$ref`s are followed"""
+        node = self
+        while node.ref is not None:
+            node = node.ref
+        return node
+
+
+@dataclass(eq=False, **_SLOTS)
+class Property:
+    """A named property of an object schema"""
+    name: str
+    swift_name: str
+    schema: SchemaNode
+    required: bool
+
+
+@dataclass(eq=False, **_SLOTS)
+class Union:
+    """The `oneOf`/`anyOf` alternatives of a schema"""
+    keyword: str
+    variants: Tuple[SchemaNode, ...]
+
+
+@dataclass(eq=False, **_SLOTS)
+class Method:
+    """A JSON-RPC method exposed by the spec"""
+    rpc_method: str
+    swift_method: str
+    doc: str
+    request: Optional[SchemaNode]  # JSON-RPC request envelope schema
+    response: Optional[SchemaNode]  # JSON-RPC response envelope schema
+    request_type: str  # Swift type of the request params
+    response_type: str  # Swift type of the response envelope
+    result_type: str  # Swift type of the `result` payload
+
+
+class ResponseTypes(NamedTuple):
+    """Payload types of a JSON-RPC response envelope"""
+    result_type: str  # Swift type of the `result` payload
+    error_type: Optional[str]  # component name of the `error` payload, e.g. ErrorWrapper_for_RpcStatusError
+
+
+class SpecIR:
+    """Component schemas and methods of a spec in IR form"""
+
+    __slots__ = ("schemas", "refs", "methods", "by_swift_name", "responses")
+
+    def __init__(self):
+        self.schemas: Dict[str, SchemaNode] = {}
+        self.refs: Dict[str, SchemaNode] = {}
+        self.methods: List[Method] = []
+        # Component by Swift type name (the first, should two share one)
+        self.by_swift_name: Dict[str, SchemaNode] = {}
+        # Payload types of every method's response envelope, by its Swift type
+        self.responses: Dict[str, ResponseTypes] = {}
+
+    def resolve(self, ref: str) -> Optional[SchemaNode]:
+        """Component node for a `#/components/schemas/...` reference"""
+        return self.refs.get(ref)
+
+    def build_node(self, raw: Dict[str, Any]) -> SchemaNode:
+        """Build a node for an ad-hoc schema object against this IR's components"""
+        built: List[SchemaNode] = []
+        node = _populate(SchemaNode(raw=raw), self, built)
+        _merge_all(built, self)
+        return node
+
+    def object_node(self, properties: Dict[str, SchemaNode], required: Sequence[str]) -> SchemaNode:
+        """Build an object node from existing property schema nodes"""
+        raw = {
+            "type": "object",
+            "properties": {name: schema.raw for name, schema in properties.items()},
+            "required": list(required),
+        }
+        return _object_node_from(raw, properties)
+
+    def with_properties(self, node: SchemaNode, properties: Dict[str, SchemaNode]) -> SchemaNode:
+        """Copy of `node` whose properties are replaced by `properties`"""
+        raw = dict(node.raw)
+        raw["properties"] = {name: schema.raw for name, schema in properties.items()}
+        required_set = set(node.required)
+        return replace(
+            node,
+            raw=raw,
+            id=None,
+            name=None,
+            swift_name=None,
+            properties={
+                name: Property(name, to_swift_property_name(name), schema, name in required_set)
+                for name, schema in properties.items()
+            },
+        )
+
+
+def _object_node_from(raw: Dict[str, Any], properties: Dict[str, SchemaNode]) -> SchemaNode:
+    required = tuple(raw.get("required", []))
+    required_set = set(required)
+    return SchemaNode(
+        raw=raw,
+        type="object",
+        properties={
+            name: Property(name, to_swift_property_name(name), schema, name in required_set)
+            for name, schema in properties.items()
+        },
+        required=required,
+    )
+
+
+def _populate(node: SchemaNode, ir: SpecIR, built: List[SchemaNode]) -> SchemaNode:
+    """Fill in `node` from its raw schema, building nodes for nested schemas"""
+    raw = node.raw
+    built.append(node)
+
+    ref = raw.get("$ref")
+    if isinstance(ref, str):
+        node.ref_name = resolve_ref_name(ref)
+        node.ref = ir.refs.get(ref)
+        if node.ref is not None:
+            node.ref_swift_name = node.ref.swift_name
+        elif node.ref_name:
+            node.ref_swift_name = to_swift_type_name(node.ref_name)
+
+    node.type = raw.get("type")
+    node.format = raw.get("format", "")
+    node.nullable = bool(raw.get("nullable", False))
+    if isinstance(raw.get("enum"), list):
+        node.enum = raw["enum"]
+
+    required = raw.get("required") or []
+    node.required = tuple(required)
+    required_set = set(required)
+    for prop_name, prop_raw in (raw.get("properties") or {}).items():
+        child = _populate(SchemaNode(raw=prop_raw), ir, built)
+        node.properties[prop_name] = Property(prop_name, to_swift_property_name(prop_name), child, prop_name in required_set)
+
+    items = raw.get("items")
+    if isinstance(items, dict):
+        node.items = _populate(SchemaNode(raw=items), ir, built)
+    elif isinstance(items, list):
+        node.tuple_items = tuple(_populate(SchemaNode(raw=item), ir, built) for item in items)
+    additional = raw.get("additionalProperties")
+    if isinstance(additional, dict):
+        node.additional_properties = _populate(SchemaNode(raw=additional), ir, built)
+    for pattern, pattern_raw in (raw.get("patternProperties") or {}).items():
+        node.pattern_properties[pattern] = _populate(SchemaNode(raw=pattern_raw), ir, built)
+
+    keyword = "oneOf" if raw.get("oneOf") else "anyOf" if raw.get("anyOf") else None
+    if keyword:
+        node.union = Union(keyword, tuple(_populate(SchemaNode(raw=choice), ir, built) for choice in raw[keyword]))
+    if raw.get("allOf"):
+        node.all_of = tuple(_populate(SchemaNode(raw=part), ir, built) for part in raw["allOf"])
+    return node
+
+
+def _merge_all(nodes: List[SchemaNode], ir: SpecIR) -> None:
+    for node in nodes:
+        if node.all_of:
+            node.merged = _merge_all_of(node.all_of, ir)
+
+
+def _merge_all_of(parts: Tuple[SchemaNode, ...], ir: SpecIR) -> SchemaNode:
+    """
+    Merge allOf parts. Handles:
+      - single $ref → the referenced node itself
+      - multiple schemas → merge object parts + primitive constraints
+    """
+    if len(parts) == 1 and parts[0].ref is not None:
+        return parts[0].ref
+
+    object_parts: List[SchemaNode] = []
+    primitive_parts: List[SchemaNode] = []
+
+    def classify(part: SchemaNode) -> None:
+        if part.type == "object" or "properties" in part.raw:
+            object_parts.append(part)
+        else:
+            primitive_parts.append(part)
+
+    for part in parts:
+        if part.ref_name is not None:
+            if part.ref is not None and part.ref.raw:
+                classify(part.ref)
+            inline = {k: v for k, v in part.raw.items() if k != "$ref"}
+            if inline:
+                classify(ir.build_node(inline))
+        elif part.raw:
+            classify(part)
+
+    if object_parts:
+        raw: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+        properties: Dict[str, SchemaNode] = {}
+        additional: Optional[SchemaNode] = None
+        for part in object_parts:
+            for prop_name, prop in part.properties.items():
+                raw["properties"][prop_name] = prop.schema.raw
+                properties[prop_name] = prop.schema
+            raw["required"] = list(dict.fromkeys(raw["required"] + list(part.required)))
+            if "additionalProperties" in part.raw:
+                raw["additionalProperties"] = part.raw["additionalProperties"]
+                additional = part.additional_properties
+        if primitive_parts:
+            # Overlay primitive constraints (like type, format, etc.)
+            raw.update(primitive_parts[0].raw)
+            return ir.build_node(raw)
+        merged = _object_node_from(raw, properties)
+        merged.additional_properties = additional
+        return merged
+
+    if primitive_parts:
+        return primitive_parts[0]
+
+    # Nothing could be merged
+    return SchemaNode(raw={})
+
+
+def schema_to_swift_type_name(node: Optional[SchemaNode], default: str = "AnyCodable") -> str:
+    """Convert an OpenAPI schema snippet to the corresponding Swift type name."""
+    if node is None:
+        return default
+    schema = node.raw
+    if "$ref" in schema:
+        if node.ref_swift_name:
+            return node.ref_swift_name
+        return default
+    if "allOf" in schema:
+        for item in node.all_of:
+            if "$ref" in item.raw:
+                return schema_to_swift_type_name(item, default)
+        return default
+    if "anyOf" in schema:
+        options = node.union.variants if node.union else ()
+        non_null_options = [opt for opt in options if not opt.is_null]
+        if not non_null_options:
+            return default
+        base = schema_to_swift_type_name(non_null_options[0], default)
+        if any(opt.is_null or opt.nullable for opt in options):
+            if not base.endswith("?"):
+                base = f"{base}?"
+        return base
+    if "oneOf" in schema:
+        options = node.union.variants if node.union else ()
+        non_null_options = [opt for opt in options if not opt.is_null]
+        if len(non_null_options) == 1 and len(options) == 2 and any(opt.is_null for opt in options):
+            base = schema_to_swift_type_name(non_null_options[0], default)
+            if not base.endswith("?"):
+                base = f"{base}?"
+            return base
+        return default
+    schema_type = node.type
+    if schema_type == "array":
+        items_type = schema_to_swift_type_name(node.items, default="AnyCodable")
+        result = f"[{items_type}]"
+    elif schema_type == "object":
+        if "additionalProperties" in schema:
+            value_type = schema_to_swift_type_name(node.additional_properties, default="AnyCodable")
+            result = f"[String: {value_type}]"
+        else:
+            result = "AnyCodable"
+    elif schema_type == "string":
+        fmt = schema.get("format")
+        if fmt in ("byte", "binary"):
+            result = "Data"
+        elif fmt == "uuid":
+            result = "UUID"
+        elif fmt == "uint64":
+            result = "UInt64"
+        else:
+            result = "String"
+    elif schema_type == "integer":
+        fmt = schema.get("format")
+        if fmt == "int32":
+            result = "Int32"
+        elif fmt == "int64":
+            result = "Int64"
+        elif fmt == "uint64":
+            result = "UInt64"
+        else:
+            result = "Int"
+    elif schema_type == "number":
+        fmt = schema.get("format")
+        if fmt == "float":
+            result = "Float"
+        else:
+            result = "Double"
+    elif schema_type == "boolean":
+        result = "Bool"
+    elif schema_type == "null":
+        result = "NSNull"
+    else:
+        result = default
+    if node.nullable and not result.endswith("?"):
+        result = f"{result}?"
+    return result
+
+
+def derive_result_type_name(response: Optional[SchemaNode]) -> str:
+    """Determine the Swift type of the `result` payload inside a JSON-RPC response schema."""
+    if response is None:
+        return "AnyCodable"
+    if "oneOf" in response.raw:
+        for variant in response.union.variants if response.union else ():
+            if "result" in variant.properties:
+                return schema_to_swift_type_name(variant.properties["result"].schema, default="AnyCodable")
+        return "AnyCodable"
+    if "allOf" in response.raw:
+        for item in response.all_of:
+            if "result" in item.properties:
+                return schema_to_swift_type_name(item.properties["result"].schema, default="AnyCodable")
+    if "result" in response.properties:
+        return schema_to_swift_type_name(response.properties["result"].schema, default="AnyCodable")
+    return "AnyCodable"
+
+
+def derive_error_type_name(response: Optional[SchemaNode]) -> Optional[str]:
+    """Component name of the `error` variant's payload in a oneOf JSON-RPC response schema."""
+    if response is None or response.union is None or response.union.keyword != "oneOf":
+        return None
+    for variant in response.union.variants:
+        if "error" in variant.properties and variant.properties["error"].schema.ref_name:
+            return variant.properties["error"].schema.ref_name
+    return None
+
+
+def _build_methods(paths: Dict[str, Any], ir: SpecIR) -> List[Method]:
+    """Extract RPC method metadata from the OpenAPI paths."""
+    methods: List[Method] = []
+    seen_swift_names = set()
+    for path_item in paths.values():
+        for http_method, operation in path_item.items():
+            if http_method.lower() != "post":
+                continue
+            request_body = operation.get("requestBody", {})
+            request_schema = request_body.get("content", {}).get("application/json", {}).get("schema")
+            if not request_schema:
+                continue
+            request = ir.build_node(request_schema).target
+            if not request.raw:
+                continue
+            method_property = request.properties.get("method")
+            method_enum = method_property.schema.enum if method_property else None
+            rpc_method = method_enum[0] if method_enum else operation.get("operationId")
+            if not rpc_method:
+                continue
+            params = request.properties.get("params")
+            request_type = schema_to_swift_type_name(params.schema if params else None, default="AnyCodable")
+            responses = operation.get("responses", {})
+            success_response = responses.get("200")
+            if not success_response:
+                for status_code, candidate in responses.items():
+                    if isinstance(status_code, str) and status_code.startswith("2"):
+                        success_response = candidate
+                        break
+            if not success_response:
+                continue
+            response_schema = success_response.get("content", {}).get("application/json", {}).get("schema")
+            response_node = ir.build_node(response_schema) if response_schema is not None else None
+            response_type = schema_to_swift_type_name(response_node, default="AnyCodable")
+            response = response_node.target if response_node is not None else None
+            result_type = derive_result_type_name(response)
+            if response_type not in ir.responses:
+                envelope = ir.by_swift_name.get(response_type)
+                ir.responses[response_type] = ResponseTypes(result_type, derive_error_type_name(envelope))
+            swift_method_name = to_swift_client_method_name(rpc_method)
+            original_swift_method_name = swift_method_name
+            counter = 2
+            while swift_method_name in seen_swift_names:
+                swift_method_name = f"{original_swift_method_name}{counter}"
+                counter += 1
+            seen_swift_names.add(swift_method_name)
+            description = operation.get("summary") or operation.get("description") or ""
+            methods.append(
+                Method(
+                    rpc_method=rpc_method,
+                    swift_method=swift_method_name,
+                    doc=description.strip(),
+                    request=request,
+                    response=response,
+                    request_type=request_type,
+                    response_type=response_type,
+                    result_type=result_type,
+                )
+            )
+    return methods
+
+
+def build_ir(document: Dict[str, Any]) -> SpecIR:
+    """Normalize an OpenAPI document into its IR"""
+    ir = SpecIR()
+    components = document.get("components", {}).get("schemas", {}) or {}
+    for name, raw in components.items():
+        node = SchemaNode(raw=raw, id=len(ir.schemas), name=name, swift_name=to_swift_type_name(name))
+        ir.schemas[name] = node
+        ir.by_swift_name.setdefault(node.swift_name, node)
+        ir.refs[f"{REF_PREFIX}{name}"] = node
+
+    built: List[SchemaNode] = []
+    for node in ir.schemas.values():
+        _populate(node, ir, built)
+    _merge_all(built, ir)
+
+    ir.methods = _build_methods(document.get("paths", {}) or {}, ir)
+    return ir
+
+
+def iter_nodes(node: SchemaNode) -> Iterator[SchemaNode]:
+    """Yield `node` and every schema nested in it, without following `$ref`s"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(prop.schema for prop in reversed(list(current.properties.values())))
+        if current.items is not None:
+            stack.append(current.items)
+        stack.extend(reversed(current.tuple_items))
+        if current.additional_properties is not None:
+            stack.append(current.additional_properties)
+        stack.extend(current.pattern_properties.values())
+        if current.union is not None:
+            stack.extend(reversed(current.union.variants))
+        stack.extend(reversed(current.all_of))
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Synthetic, scaled variants of the OpenAPI specification.
+
+Generator changes are mostly checked against the 293 schemas and 31 methods of
+openapi.json. This writes larger, valid variants of it so that
+benchmark_codegen.py can show how each phase grows with the spec, which is
+what exposes quadratic paths:
+
+    --scale N         N forks of the spec: every component schema and every
+                      method is copied with a `_ForkK` / `_forkK` suffix and
+                      its `$ref`s point into its own fork, so the reference
+                      graph (SCCs included) is repeated N times
+    --depth D         per fork, a chain of D schemas each extending the previous
+                      through allOf and adding a oneOf property, D levels deep
+    --union-width W   per fork, a oneOf of W object variants with distinct
+                      `kind` tags
+    --inline-objects N  per fork, an object with N inline object properties
+
+Synthetic schemas refer to real object schemas of their fork, and every `$ref`
+of the result is checked to resolve. The presets are what the benchmark uses.
+
+Usage (from the Scripts directory):
+    python3 -m spec_scaler 10x                      # openapi.10x.json
+    python3 -m spec_scaler --scale 3 --union-width 100 -o openapi.wide.json
+    python3 -m benchmark_codegen --spec-scale 2x --spec-scale 10x --spec-scale 50x
+"""
+
+import argparse
+import copy
+import json
+import sys
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from openapi_spec import OPENAPI_PATH, load_openapi
+from spec_ir import REF_PREFIX, resolve_ref_name
+
+
+class SpecScale(NamedTuple):
+    name: str
+    scale: int  # forks of the component schemas and methods
+    depth: int  # allOf/oneOf levels of the synthetic nesting chain
+    union_width: int  # variants of the synthetic union
+    inline_objects: int  # inline object properties of the synthetic object
+
+
+SCALE_PRESETS = {
+    preset.name: preset
+    for preset in (
+        SpecScale("2x", scale=2, depth=4, union_width=8, inline_objects=8),
+        SpecScale("10x", scale=10, depth=8, union_width=32, inline_objects=32),
+        SpecScale("50x", scale=50, depth=16, union_width=64, inline_objects=64),
+    )
+}
+
+# Names of the synthetic schemas in each fork
+NESTING_SCHEMA = "SyntheticNesting"
+UNION_SCHEMA = "SyntheticUnion"
+INLINE_OBJECTS_SCHEMA = "SyntheticInlineObjects"
+
+
+def fork_name(name: str, fork: int) -> str:
+    """Name of schema `name` in fork `fork`; fork 1 is the original"""
+    return name if fork == 1 else f"{name}_Fork{fork}"
+
+
+def fork_method(method: str, fork: int) -> str:
+    """RPC method name `method` in fork `fork`"""
+    return method if fork == 1 else f"{method}_fork{fork}"
+
+
+def ref_to(name: str) -> Dict[str, str]:
+    return {"$ref": f"{REF_PREFIX}{name}"}
+
+
+def iter_refs(value: Any) -> Iterator[Dict[str, Any]]:
+    """Every dict holding a `$ref` in `value`"""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if isinstance(current.get("$ref"), str):
+                yield current
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def fork_schema(schema: Dict[str, Any], name: str, fork: int, methods: Dict[str, str]) -> Dict[str, Any]:
+    """Copy of component `name` for `fork`, referring to the fork's schemas"""
+    forked = copy.deepcopy(schema)
+    for holder in iter_refs(forked):
+        target = resolve_ref_name(holder["$ref"])
+        if target is not None:
+            holder["$ref"] = f"{REF_PREFIX}{fork_name(target, fork)}"
+    if forked.get("title") == name:
+        forked["title"] = fork_name(name, fork)
+    # A request schema pins its RPC method name
+    method = forked.get("properties", {}).get("method")
+    if isinstance(method, dict) and method.get("enum") and method["enum"][0] in methods:
+        method["enum"] = [methods[method["enum"][0]]]
+    return forked
+
+
+def fork_path(path_item: Dict[str, Any], fork: int) -> Dict[str, Any]:
+    forked = copy.deepcopy(path_item)
+    for holder in iter_refs(forked):
+        target = resolve_ref_name(holder["$ref"])
+        if target is not None:
+            holder["$ref"] = f"{REF_PREFIX}{fork_name(target, fork)}"
+    for operation in forked.values():
+        if isinstance(operation, dict) and operation.get("operationId"):
+            operation["operationId"] = fork_method(operation["operationId"], fork)
+    return forked
+
+
+def rpc_methods(document: Dict[str, Any]) -> List[str]:
+    """RPC method names of the document's operations"""
+    return [
+        operation["operationId"]
+        for path_item in document.get("paths", {}).values()
+        for operation in path_item.values()
+        if isinstance(operation, dict) and operation.get("operationId")
+    ]
+
+
+def anchor_schemas(schemas: Dict[str, Any]) -> List[str]:
+    """Object schemas synthetic schemas refer to: those with properties, outside the JSON-RPC envelopes"""
+    return sorted(
+        name for name, schema in schemas.items()
+        if schema.get("properties") and not name.startswith(("JsonRpcRequest_", "JsonRpcResponse_"))
+    )
+
+
+def nesting_schemas(depth: int, anchors: List[str], fork: int) -> Dict[str, Any]:
+    """A chain of `depth` schemas, each the previous one plus a oneOf property of two tagged variants"""
+    schemas: Dict[str, Any] = {}
+    previous: Optional[str] = None
+    for level in range(1, depth + 1):
+        property_name = f"level{level}"
+        extension = {
+            "type": "object",
+            "properties": {
+                property_name: {
+                    # Tagged by `kind`, so no sample matches both variants
+                    "oneOf": [
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"type": "string", "enum": ["anchor"]},
+                                "anchor": ref_to(anchors[level % len(anchors)]),
+                            },
+                            "required": ["kind", "anchor"],
+                        },
+                        {
+                            "type": "object",
+                            "properties": {
+                                "kind": {"type": "string", "enum": ["depth"]},
+                                "depth": {"type": "integer", "format": "uint32", "minimum": 0},
+                            },
+                            "required": ["kind", "depth"],
+                        },
+                    ]
+                }
+            },
+            "required": [property_name],
+        }
+        name = fork_name(f"{NESTING_SCHEMA}{level}", fork)
+        schemas[name] = {"allOf": [ref_to(previous), extension]} if previous else extension
+        previous = name
+    return schemas
+
+
+def union_schema(width: int, anchors: List[str]) -> Dict[str, Any]:
+    """A oneOf of `width` object variants, told apart by their `kind`"""
+    variants = []
+    for index in range(width):
+        tag = f"variant_{index}"
+        variants.append({
+            "type": "object",
+            "properties": {"kind": {"type": "string", "enum": [tag]}, tag: ref_to(anchors[index % len(anchors)])},
+            "required": ["kind", tag],
+        })
+    return {"oneOf": variants}
+
+
+def inline_objects_schema(count: int, anchors: List[str]) -> Dict[str, Any]:
+    """An object with `count` inline object properties"""
+    properties = {}
+    for index in range(count):
+        properties[f"inline_{index}"] = {
+            "type": "object",
+            "properties": {"label": {"type": "string"}, "value": ref_to(anchors[index % len(anchors)])},
+            "required": ["label", "value"],
+        }
+    return {"type": "object", "properties": properties, "required": sorted(properties)}
+
+
+def check_refs(document: Dict[str, Any]) -> None:
+    """Raise ValueError if a `$ref` of `document` doesn't resolve to a component schema"""
+    schemas = document.get("components", {}).get("schemas", {})
+    for holder in iter_refs(document):
+        target = resolve_ref_name(holder["$ref"])
+        if target is None or target not in schemas:
+            raise ValueError(f"unresolved $ref {holder['$ref']}")
+
+
+def scale_spec(document: Dict[str, Any], scale: int = 1, depth: int = 0, union_width: int = 0, inline_objects: int = 0) -> Dict[str, Any]:
+    """A copy of `document` with `scale` forks and the given synthetic schemas in each"""
+    if scale < 1:
+        raise ValueError(f"scale must be at least 1, got {scale}")
+    schemas = document.get("components", {}).get("schemas", {})
+    paths = document.get("paths", {})
+    anchors = anchor_schemas(schemas)
+    if not anchors and (depth or union_width or inline_objects):
+        raise ValueError("the spec has no object schemas for synthetic schemas to refer to")
+
+    scaled_schemas: Dict[str, Any] = {}
+    scaled_paths: Dict[str, Any] = {}
+    for fork in range(1, scale + 1):
+        methods = {method: fork_method(method, fork) for method in rpc_methods(document)}
+        for name, schema in schemas.items():
+            scaled_schemas[fork_name(name, fork)] = fork_schema(schema, name, fork, methods) if fork > 1 else schema
+        for path, path_item in paths.items():
+            scaled_paths[fork_method(path, fork)] = fork_path(path_item, fork) if fork > 1 else path_item
+        fork_anchors = [fork_name(name, fork) for name in anchors]
+        if depth:
+            scaled_schemas.update(nesting_schemas(depth, fork_anchors, fork))
+        if union_width:
+            scaled_schemas[fork_name(UNION_SCHEMA, fork)] = union_schema(union_width, fork_anchors)
+        if inline_objects:
+            scaled_schemas[fork_name(INLINE_OBJECTS_SCHEMA, fork)] = inline_objects_schema(inline_objects, fork_anchors)
+
+    scaled = dict(document)
+    scaled["paths"] = scaled_paths
+    scaled["components"] = {**document.get("components", {}), "schemas": scaled_schemas}
+    check_refs(scaled)
+    return scaled
+
+
+def write_scaled_spec(preset: SpecScale, output_path: str, openapi_path: str = OPENAPI_PATH) -> Dict[str, Any]:
+    """Write `openapi_path` scaled by `preset` to `output_path` and return the scaled document"""
+    scaled = scale_spec(load_openapi(openapi_path), preset.scale, preset.depth, preset.union_width, preset.inline_objects)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(scaled, f, indent=2)
+        f.write("\n")
+    return scaled
+
+
+def default_output_path(name: str) -> str:
+    return f"openapi.{name}.json"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m spec_scaler",
+        description="Write a synthetic, scaled variant of the OpenAPI specification",
+    )
+    parser.add_argument("preset", nargs="?", choices=SCALE_PRESETS, help="preset scale; the options below override it")
+    parser.add_argument("--openapi", default=OPENAPI_PATH, help=f"spec to scale (default: {OPENAPI_PATH})")
+    parser.add_argument("--output", "-o", help="where to write the scaled spec (default: openapi.<preset>.json)")
+    parser.add_argument("--scale", type=int, help="forks of the component schemas and methods")
+    parser.add_argument("--depth", type=int, help="levels of the synthetic allOf/oneOf nesting chain")
+    parser.add_argument("--union-width", type=int, help="variants of the synthetic union")
+    parser.add_argument("--inline-objects", type=int, help="inline object properties of the synthetic object")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    base = SCALE_PRESETS[args.preset] if args.preset else SpecScale("scaled", 1, 0, 0, 0)
+    preset = base._replace(**{
+        field: getattr(args, field) for field in ("scale", "depth", "union_width", "inline_objects")
+        if getattr(args, field) is not None
+    })
+    output_path = args.output or default_output_path(preset.name)
+    scaled = write_scaled_spec(preset, output_path, args.openapi)
+    print(
+        f"✅ {output_path}: {len(scaled['components']['schemas'])} schemas, {len(rpc_methods(scaled))} methods "
+        f"(scale {preset.scale}, depth {preset.depth}, union width {preset.union_width}, {preset.inline_objects} inline objects)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Streaming writer for generated Swift files.
+
+Generators hand fragments to a `SwiftWriter` as they produce them instead of
+concatenating the whole file into one string, so memory stays flat and time
+stays linear in the size of the output. Fragments go through a buffered handle
+on a temporary file next to the target, which replaces the target only once the
+file is complete and differs from it (see outputs.py); a failed generation
+never leaves a truncated Swift file, and an unchanged one keeps its mtime, so
+Swift builds don't see it as modified.
+
+`ShardedSwiftWriter` does the same for a set of files sharing a name prefix.
+"""
+
+import hashlib
+import os
+from typing import Dict
+
+import outputs
+
+# Large enough that the ~700 KB Types.swift goes out in about a dozen writes
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+class SwiftWriter:
+    """Buffered, atomically replaced output file for generated Swift"""
+
+    __slots__ = ("path", "tmp_path", "file", "digest")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.{os.getpid()}.tmp"
+        self.file = None
+        self.digest = hashlib.sha256()
+
+    def __enter__(self) -> "SwiftWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def open(self) -> "SwiftWriter":
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.file = open(self.tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        return self
+
+    def write(self, text: str) -> None:
+        """Append a fragment of Swift source"""
+        self.file.write(text)
+        self.digest.update(text.encode("utf-8"))
+
+    def mark(self, title: str, blank_line: bool = False) -> None:
+        """Append a `// MARK: - title` line, optionally followed by a blank line"""
+        self.write(f"// MARK: - {title}\n\n" if blank_line else f"// MARK: - {title}\n")
+
+    def close(self) -> bool:
+        """Flush the file and move it into place. Returns False if the target already had this content"""
+        self.file.close()
+        return outputs.replace_file(self.tmp_path, self.path, self.digest.hexdigest())
+
+    def discard(self) -> None:
+        """Drop everything written so far and leave the target untouched"""
+        if self.file is not None:
+            self.file.close()
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+
+class ShardedSwiftWriter:
+    """`SwiftWriter`s for the files `<prefix><shard>.swift` in `directory`, opened on first use.
+
+    Closing removes files with the same prefix that no shard was written to
+    this run, so shards that disappear from the mapping don't linger.
+    """
+
+    __slots__ = ("directory", "prefix", "header", "shards")
+
+    def __init__(self, directory: str, prefix: str, header: str = ""):
+        self.directory = directory
+        self.prefix = prefix
+        self.header = header
+        self.shards: Dict[str, SwiftWriter] = {}
+
+    def __enter__(self) -> "ShardedSwiftWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def shard(self, name: str) -> SwiftWriter:
+        """Writer for shard `name`"""
+        writer = self.shards.get(name)
+        if writer is None:
+            writer = SwiftWriter(os.path.join(self.directory, f"{self.prefix}{name}.swift")).open()
+            writer.write(self.header)
+            self.shards[name] = writer
+        return writer
+
+    def close(self) -> None:
+        """Close every shard in name order and remove stale shard files"""
+        for name in sorted(self.shards):
+            self.shards[name].close()
+        remove_stale_shards(self.directory, self.prefix, {os.path.basename(w.path) for w in self.shards.values()})
+
+    def discard(self) -> None:
+        for writer in self.shards.values():
+            writer.discard()
+
+
+def remove_stale_shards(directory: str, prefix: str, keep=()) -> int:
+    """Remove `<prefix>*.swift` files in `directory` other than `keep`. Returns how many were removed"""
+    if not os.path.isdir(directory):
+        return 0
+    removed = 0
+    for filename in os.listdir(directory):
+        if filename.startswith(prefix) and filename.endswith(".swift") and filename not in keep:
+            outputs.remove_file(os.path.join(directory, filename))
+            removed += 1
+    return removed
@@ -0,0 +1,13 @@
+"""Checks of the codegen benchmark. Run with `python -m pytest` from the Scripts directory."""
+
+import os
+
+from benchmark_codegen import copy_scripts
+from openapi_spec import CACHE_DIR, OPENAPI_PATH
+
+
+def test_scratch_copy_starts_without_caches(tmp_path):
+    scripts_dir = copy_scripts(str(tmp_path / "Scripts"))
+    assert os.path.exists(os.path.join(scripts_dir, OPENAPI_PATH))
+    assert not os.path.exists(os.path.join(scripts_dir, CACHE_DIR))
+    assert not os.path.exists(os.path.join(scripts_dir, "__pycache__"))
@@ -0,0 +1,120 @@
+"""Regression checks for mock sample generation. Run with `python -m pytest` from the Scripts directory."""
+
+import json
+import re
+
+import pytest
+from jsonschema import Draft202012Validator
+
+import generate_mock
+from openapi_spec import Spec, load_spec
+from size_classes import HUGE, MEDIUM, SMALL
+
+VARIANT_FILENAME = re.compile(r"\w+_Variant(\d+)\.json")
+
+
+def spec_of(schemas):
+    return Spec({"openapi": "3.0.0", "paths": {}, "components": {"schemas": schemas}})
+
+
+def test_empty_enum_samples_to_null():
+    # `enum: []` leaves node.enum falsy, so _minimal reaches the primitive fallback
+    generate_mock.ensure_loaded(spec_of({
+        "Empty": {"enum": []},
+        "Holder": {
+            "type": "object",
+            "properties": {"empty": {"$ref": "#/components/schemas/Empty"}},
+            "required": ["empty"],
+        },
+    }))
+    holder = generate_mock._ir.schemas["Holder"]
+    assert generate_mock.minimal_sample(holder, allow_null=False) == {"empty": None}
+    assert generate_mock.generate_sample(holder, allow_null=False) == {"empty": None}
+
+
+def mock_files(directory):
+    return {path.name: path.read_bytes() for path in sorted(directory.iterdir())}
+
+
+def run_main(monkeypatch, directory, seed, jobs):
+    directory.mkdir()
+    monkeypatch.setattr(generate_mock, "TARGET_DIRECTORIES", [("Mocks", str(directory))])
+    generate_mock.main(load_spec(), seed=seed, jobs=jobs)
+    return mock_files(directory)
+
+
+def test_mocks_depend_on_the_seed_alone(tmp_path, monkeypatch):
+    serial = run_main(monkeypatch, tmp_path / "serial", seed=7, jobs=1)
+    assert serial
+    assert run_main(monkeypatch, tmp_path / "again", seed=7, jobs=1) == serial
+    assert run_main(monkeypatch, tmp_path / "parallel", seed=7, jobs=2) == serial
+    assert run_main(monkeypatch, tmp_path / "reseeded", seed=8, jobs=1) != serial
+
+
+def variant_validator(schema_name, filename):
+    """Validator for the union variant a `<schema>_Variant<i>.json` mock was generated for"""
+    match = VARIANT_FILENAME.fullmatch(filename)
+    if not match:
+        return None
+    keyword = generate_mock._ir.schemas[schema_name].union.keyword
+    ref = f"{generate_mock.OPENAPI_URI}#/components/schemas/{schema_name}/{keyword}/{match.group(1)}"
+    return Draft202012Validator({"$ref": ref}, registry=generate_mock._registry)
+
+
+def test_every_mock_validates_against_its_schema():
+    generate_mock.ensure_loaded(load_spec())
+    generate_mock.prepare_sampling()
+    for section, schema_name in generate_mock.mock_jobs():
+        validator = generate_mock.validator_for_schema(schema_name)
+        for filename, content in generate_mock.generate_mock_job((section, schema_name)):
+            assert content is not None, filename
+            mock = json.loads(content)
+            errors = [error.message for error in validator.iter_errors(mock)]
+            # The spec declares some unions `type: object` beside a string variant,
+            # which no value of that variant can satisfy; its mock must still match the variant
+            variant = variant_validator(schema_name, filename) if errors else None
+            if variant is not None:
+                errors = [error.message for error in variant.iter_errors(mock)]
+            assert not errors, f"{filename}: {errors[:3]}"
+
+
+@pytest.fixture
+def sized_spec():
+    generate_mock.ensure_loaded(spec_of({
+        "Sized": {
+            "type": "object",
+            "properties": {
+                "unbounded": {"type": "array", "items": {"type": "integer"}},
+                "at_most_two": {"type": "array", "items": {"type": "integer"}, "maxItems": 2},
+                "at_least_ten": {"type": "array", "items": {"type": "integer"}, "minItems": 10},
+                "text": {"type": "string"},
+                "short_text": {"type": "string", "maxLength": 4},
+                "long_text": {"type": "string", "minLength": 40},
+                "map": {"type": "object", "additionalProperties": {"type": "integer"}},
+            },
+            "required": ["unbounded", "at_most_two", "at_least_ten", "text", "short_text", "long_text", "map"],
+        },
+        # One of the arrays the size classes give their own cardinality
+        "ViewStateResult": {
+            "type": "object",
+            "properties": {"values": {"type": "array", "items": {"type": "integer"}}},
+            "required": ["values"],
+        },
+    }))
+    yield
+    generate_mock.set_size_class(SMALL)
+
+
+@pytest.mark.parametrize("size", [SMALL, MEDIUM, HUGE], ids=lambda size: size.name)
+def test_size_classes_stay_within_schema_bounds(sized_spec, size):
+    generate_mock.set_size_class(size)
+    sample = generate_mock.generate_sample_for_schema("Sized")
+    assert len(sample["unbounded"]) == size.array_items
+    assert len(sample["at_most_two"]) == 2
+    assert len(sample["at_least_ten"]) == max(10, size.array_items)
+    assert len(sample["text"]) == size.string_length
+    assert len(sample["short_text"]) == min(4, size.string_length)
+    assert len(sample["long_text"]) == max(40, size.string_length)
+    assert len(sample["map"]) == size.map_entries
+    values = generate_mock.generate_sample_for_schema("ViewStateResult")["values"]
+    assert len(values) == size.property_items.get(("ViewStateResult", "values"), size.array_items)
@@ -0,0 +1,37 @@
+"""Checks of the generated Swift types. Run with `python -m pytest` from the Scripts directory."""
+
+import os
+import re
+
+import pytest
+
+import generate_types
+from openapi_spec import load_spec
+from swift_writer import ShardedSwiftWriter, SwiftWriter
+from type_shards import DOMAIN_MODE, SHARD_FILE_PREFIX
+
+# Top-level declarations only visible inside their own file
+FILE_PRIVATE_DECLARATION = re.compile(r"^(?:fileprivate|private) (?:func|struct|enum|class|let|var|typealias) (\w+)", re.M)
+
+
+def write_sharded_types(directory, shard_mode):
+    spec = load_spec()
+    discriminators = generate_types.collect_discriminator_enums(spec.ir.schemas)
+    with SwiftWriter(str(directory / "Types.swift")) as out, \
+            ShardedSwiftWriter(str(directory), SHARD_FILE_PREFIX, "import Foundation\n\n") as shards:
+        generate_types.write_swift_types(spec, out, discriminators, shards=shards, shard_mode=shard_mode)
+    sources = {}
+    for filename in sorted(os.listdir(directory)):
+        with open(directory / filename, encoding="utf-8") as f:
+            sources[filename] = f.read()
+    return sources
+
+
+@pytest.mark.parametrize("shard_mode", [DOMAIN_MODE, 4])
+def test_shards_only_use_symbols_visible_across_files(tmp_path, shard_mode):
+    sources = write_sharded_types(tmp_path, shard_mode)
+    assert len(sources) > 1
+    for filename, source in sources.items():
+        for name in FILE_PRIVATE_DECLARATION.findall(source):
+            users = [other for other, text in sources.items() if other != filename and re.search(rf"\b{name}\b", text)]
+            assert not users, f"{name} is private to {filename} but used in {users}"
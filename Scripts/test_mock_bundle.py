@@ -0,0 +1,77 @@
+"""Checks of the bundled mock formats. Run with `python -m pytest` from the Scripts directory."""
+
+import json
+
+import pytest
+
+import generate_mock
+from mock_bundle import (
+    BINARY_FORMAT, BUNDLE_FILENAMES, MOCK_FORMATS, NDJSON_FORMAT, PRETTY_FORMAT, bundle_filenames, encode_bundle,
+    is_minified, mock_name, read_bundle,
+)
+from openapi_spec import load_spec
+
+MOCKS = {
+    "RpcBlockResponse_Success": {"jsonrpc": "2.0", "id": "dontcare", "result": {"header": {"height": 1}}},
+    "AccountId": "alice.near",
+    "Empty": {},
+    "Unicode": {"memo": "héllo ✓"},
+}
+
+
+def serialize(value, mock_format):
+    if is_minified(mock_format):
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("mock_format", [NDJSON_FORMAT, BINARY_FORMAT])
+def test_bundles_slice_out_every_mock(tmp_path, mock_format):
+    mocks = [(f"{name}.json", serialize(value, mock_format)) for name, value in MOCKS.items()]
+    path = tmp_path / BUNDLE_FILENAMES[mock_format]
+    path.write_bytes(encode_bundle(mocks, mock_format))
+    bundle = read_bundle(str(path))
+    assert {name: data.decode("utf-8") for name, data in bundle.items()} == {
+        mock_name(filename): content for filename, content in mocks
+    }
+    assert bundle_filenames(str(path)) == [filename for filename, _ in mocks]
+
+
+def read_mocks(directory, mock_format):
+    """Mock name -> parsed JSON of the mocks written to `directory` in `mock_format`"""
+    if mock_format in BUNDLE_FILENAMES:
+        bundle = read_bundle(str(directory / BUNDLE_FILENAMES[mock_format]))
+        return {name: json.loads(data) for name, data in bundle.items()}
+    return {mock_name(path.name): json.loads(path.read_text(encoding="utf-8")) for path in directory.iterdir()}
+
+
+def test_every_format_holds_the_same_mocks(tmp_path, monkeypatch):
+    spec = load_spec()
+    written = {}
+    for mock_format in MOCK_FORMATS:
+        directory = tmp_path / mock_format
+        directory.mkdir()
+        monkeypatch.setattr(generate_mock, "TARGET_DIRECTORIES", [("Mocks", str(directory))])
+        names = generate_mock.main(spec, mock_format=mock_format)
+        written[mock_format] = read_mocks(directory, mock_format)
+        assert sorted(written[mock_format]) == sorted(mock_name(name) for name in names)
+    pretty = written[PRETTY_FORMAT]
+    assert pretty
+    for mock_format in MOCK_FORMATS:
+        assert written[mock_format] == pretty, mock_format
+
+
+def test_ndjson_bundle_rejects_multiline_mocks():
+    with pytest.raises(ValueError):
+        encode_bundle([("Pretty.json", serialize({"a": 1}, "pretty"))], NDJSON_FORMAT)
+
+
+def test_unknown_bundle_versions_are_rejected(tmp_path):
+    binary = bytearray(encode_bundle([("A.json", "{}")], BINARY_FORMAT))
+    binary[8] = 2  # version, right after the magic
+    (tmp_path / "mocks.bin").write_bytes(bytes(binary))
+    ndjson = encode_bundle([("A.json", "{}")], NDJSON_FORMAT).replace(b'"version":1', b'"version":2')
+    (tmp_path / "mocks.ndjson").write_bytes(ndjson)
+    for filename in ("mocks.bin", "mocks.ndjson"):
+        with pytest.raises(ValueError):
+            read_bundle(str(tmp_path / filename))
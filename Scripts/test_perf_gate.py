@@ -0,0 +1,41 @@
+"""Checks of the decode-time regression gate. Run with `python -m pytest` from the Scripts directory."""
+
+import json
+
+from perf_gate import IMPROVED, OK, REGRESSED, compare, main
+
+
+def statuses(current, baseline, tolerances=None):
+    return {c.type_name: c.status for c in compare(current, baseline, 0.25, tolerances or {})}
+
+
+def test_small_types_regress_above_the_absolute_floor():
+    # 4 µs → 6 µs is over the tolerance and over the 2 µs floor
+    assert statuses({"Small": 6_000}, {"Small": 4_000}) == {"Small": REGRESSED}
+    # 4 µs → 5.5 µs is over the tolerance but within timer noise
+    assert statuses({"Small": 5_500}, {"Small": 4_000}) == {"Small": OK}
+
+
+def test_per_type_tolerances_are_enforced_as_set():
+    tolerances = {"Large": 0.05}
+    # +8% is over a 5% tolerance, and far over the absolute floor
+    assert statuses({"Large": 1_080_000}, {"Large": 1_000_000}, tolerances) == {"Large": REGRESSED}
+    assert statuses({"Large": 1_040_000}, {"Large": 1_000_000}, tolerances) == {"Large": OK}
+    assert statuses({"Large": 920_000}, {"Large": 1_000_000}, tolerances) == {"Large": IMPROVED}
+
+
+def test_empty_baseline_records_the_timings(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    timings = tmp_path / "timings.json"
+    baseline.write_text(json.dumps({
+        "tolerance": 0.25, "tolerances": {"RpcBlockResponse": 0.5}, "iterations": 0, "medians": {},
+    }))
+    timings.write_text(json.dumps({"iterations": 10, "medians": {"RpcBlockResponse": 5_000}}))
+    assert main(["--baseline", str(baseline), "compare", str(timings)]) == 0
+    assert "recording this run" in capsys.readouterr().out
+    recorded = json.loads(baseline.read_text())
+    assert recorded["medians"] == {"RpcBlockResponse": 5_000}
+    assert recorded["tolerances"] == {"RpcBlockResponse": 0.5}
+    # From then on the gate compares against it
+    timings.write_text(json.dumps({"iterations": 10, "medians": {"RpcBlockResponse": 10_000}}))
+    assert main(["--baseline", str(baseline), "compare", str(timings)]) == 1
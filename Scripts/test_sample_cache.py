@@ -0,0 +1,44 @@
+"""Checks of the mock subtree cache. Run with `python -m pytest` from the Scripts directory."""
+
+import generate_mock
+from openapi_spec import load_spec
+from sample_cache import SampleCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SampleCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == (True, 1)  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+
+def test_keys_tell_null_admissibility_and_seed_apart():
+    cache = SampleCache()
+    cache.put(("AccountView", False, 0), {"amount": "0"})
+    assert cache.get(("AccountView", True, 0)) == (False, None)
+    assert cache.get(("AccountView", False, 1)) == (False, None)
+    assert cache.get(("AccountView", False, 0)) == (True, {"amount": "0"})
+    cache.clear()
+    assert len(cache) == 0 and (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def generate_all_mocks():
+    return [mock for job in generate_mock.mock_jobs() for mock in generate_mock.generate_mock_job(job)]
+
+
+def test_evictions_never_change_the_mocks(monkeypatch):
+    generate_mock.ensure_loaded(load_spec())
+    generate_mock.prepare_sampling()
+    monkeypatch.setattr(generate_mock, "_samples", SampleCache())
+    cached = generate_all_mocks()
+    assert generate_mock._samples.hits > 0
+    tiny = SampleCache(max_entries=1)
+    monkeypatch.setattr(generate_mock, "_samples", tiny)
+    assert generate_all_mocks() == cached
+    assert tiny.evictions > 0
@@ -0,0 +1,16 @@
+"""Checks that scaled specs exercise normal generation. Run with `python -m pytest` from the Scripts directory."""
+
+import generate_mock
+from openapi_spec import Spec, load_openapi
+from spec_scaler import SCALE_PRESETS, scale_spec
+
+
+def test_scaled_spec_mocks_generate_without_failures(capsys):
+    preset = SCALE_PRESETS["10x"]
+    scaled = scale_spec(load_openapi(), preset.scale, preset.depth, preset.union_width, preset.inline_objects)
+    generate_mock.ensure_loaded(Spec(scaled))
+    for job in generate_mock.mock_jobs():
+        for filename, content in generate_mock.generate_mock_job(job):
+            assert content is not None, filename
+    output = capsys.readouterr().out
+    assert "❌" not in output and "⚠️" not in output, output
@@ -0,0 +1,12 @@
+"""Checks of the compiled mock validators. Run with `python -m pytest` from the Scripts directory."""
+
+import generate_mock
+from openapi_spec import load_spec
+from validator_compiler import differential_check
+
+
+def test_compiled_validators_agree_with_jsonschema(capsys):
+    # Other tests load their own specs; check the compiler against the real one
+    generate_mock.ensure_loaded(load_spec())
+    disagreements = differential_check(samples_per_schema=8, seed=0)
+    assert disagreements == 0, capsys.readouterr().out
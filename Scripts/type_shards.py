@@ -0,0 +1,59 @@
+"""Assignment of component types to Swift files when Types.swift is sharded.
+
+Types.swift keeps the shared helpers, discriminator enums and RpcErrorDetails;
+every component schema (and the inline types it creates) goes to a
+`Types+<Shard>.swift` file next to it. A schema's shard depends only on its
+name, so adding, removing or editing other schemas never moves it and
+untouched shards are left byte-for-byte (and mtime) unchanged.
+"""
+
+import hashlib
+import re
+from typing import List, Tuple, Union
+
+SHARD_FILE_PREFIX = "Types+"
+
+# Shard mode grouping schemas by the RPC method family they belong to
+DOMAIN_MODE = "domain"
+
+# (shard, pattern) pairs tried in order against the schema name; the first
+# match wins, so errors are grouped together before their family is considered
+DOMAIN_SHARDS: List[Tuple[str, str]] = [
+    ("Envelopes", r"^JsonRpc(Request|Response)_for_"),
+    ("Errors", r"Error|WasmTrap|MissingTrieValue"),
+    ("Blocks", r"Block|Chunk|Header|Epoch|Shard|Congestion|Bandwidth|LightClient|MerklePath|Finality|Sync"),
+    ("Queries", r"Query|AccessKey|Account|Contract|ViewState|StateItem|StateChange|CallResult|FunctionArgs|Permission|GasKey|Store"),
+    ("Transactions", r"Transaction|Tx|Action|Receipt|Receiver|Execution|Outcome|Delegate|Signature|Transfer|Stake|Fee|Gas|Cost"),
+    ("Network", r"Network|Peer|Validator|Status|Health|Producer|Tier1|Version|Maintenance"),
+    ("Config", r"Config|Genesis|Limit|Runtime|VM|Dump|Storage"),
+]
+SHARED_SHARD = "Shared"
+
+_DOMAIN_PATTERNS = [(shard, re.compile(pattern)) for shard, pattern in DOMAIN_SHARDS]
+
+ShardMode = Union[str, int]
+
+
+def parse_shard_mode(value: str) -> ShardMode:
+    """`domain` or a positive shard count"""
+    if value == DOMAIN_MODE:
+        return DOMAIN_MODE
+    try:
+        count = int(value)
+    except ValueError:
+        raise ValueError(f"expected '{DOMAIN_MODE}' or a positive shard count, got {value!r}") from None
+    if count < 1:
+        raise ValueError(f"expected a positive shard count, got {value}")
+    return count
+
+
+def shard_for(name: str, mode: ShardMode) -> str:
+    """Shard for the component schema `name`"""
+    if mode == DOMAIN_MODE:
+        for shard, pattern in _DOMAIN_PATTERNS:
+            if pattern.search(name):
+                return shard
+        return SHARED_SHARD
+    # Hash the name rather than using spec order so shards stay put as the spec changes
+    index = int(hashlib.md5(name.encode()).hexdigest()[:8], 16) % mode
+    return f"Shard{index:02d}"
@@ -0,0 +1,466 @@
+"""Compile component schemas into plain Python validator functions.
+
+`jsonschema` interprets the schema tree on every `validate()` call. This module
+instead translates every (nullable-converted) component schema once into a
+Python function that checks an instance with straight-line `isinstance`, set
+and comparison operations, and calls the functions of the schemas it
+references, so `$ref` cycles are just mutually recursive functions.
+
+The generated module is cached in CACHE_DIR keyed by the hash of the schemas
+and of this compiler, and imported from there on later runs (so Python also
+caches its bytecode). Keywords the compiler doesn't implement make it fall back
+to a `jsonschema` validator for that one component, so results always agree
+with `jsonschema`'s `is_valid`. `python3 -m validator_compiler check` verifies
+that on a corpus of generated and mutated samples.
+
+Usage (from the Scripts directory):
+    python3 -m validator_compiler check [--samples N] [--seed S]
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openapi_spec import CACHE_DIR
+
+# Bump when the generated code changes in a way the source hash would not catch
+COMPILER_VERSION = 1
+
+DRAFT202012_URI = "https://json-schema.org/draft/2020-12/schema"
+COMPONENT_REF_PREFIX = "#/components/schemas/"
+
+_MODULE_PREFIX = "validators-"
+
+# Keywords with assertion or resolution semantics the compiler doesn't
+# implement; a component using any of them is validated by `jsonschema`
+UNSUPPORTED_KEYWORDS = frozenset({
+    "$dynamicRef", "$recursiveRef", "$id", "$anchor", "$dynamicAnchor", "$recursiveAnchor",
+    "if", "then", "else", "dependentSchemas", "dependentRequired", "prefixItems",
+    "contains", "minContains", "maxContains", "propertyNames", "unevaluatedItems",
+    "unevaluatedProperties", "uniqueItems", "multipleOf",
+})
+
+# Keywords that never affect validity
+_ANNOTATIONS = frozenset({
+    "title", "description", "default", "examples", "example", "format", "nullable",
+    "deprecated", "readOnly", "writeOnly", "$comment", "$schema",
+})
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "integer": "_is_integer({v})",
+    "number": "_is_number({v})",
+}
+
+# Helpers every generated module starts with; they mirror jsonschema's type
+# checker and `equal` so results match it exactly
+_PRELUDE = '''\
+import numbers
+import re
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value):
+    return not isinstance(value, bool) and isinstance(value, numbers.Number)
+
+
+def _unbool(value, true=object(), false=object()):
+    if value is True:
+        return true
+    if value is False:
+        return false
+    return value
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, (list, tuple)) and isinstance(two, (list, tuple)):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[key], two[key]) for key in one)
+    return _unbool(one) == _unbool(two)
+
+
+def _in_enum(value, values):
+    return any(_equal(each, value) for each in values)
+
+
+# Set by the loader: jsonschema validators for components that aren't compiled
+_fallbacks = {}
+'''
+
+
+class UnsupportedSchema(Exception):
+    """Raised for schema constructs the compiler can't translate"""
+
+
+class _ModuleBuilder:
+    """Accumulates the source of a generated validator module"""
+
+    def __init__(self, schemas: Dict[str, Any]):
+        self.schemas = schemas
+        self.function_names = {name: f"v{index}" for index, name in enumerate(schemas)}
+        self.constants: List[str] = []
+        self.helpers: List[str] = []
+        self._constant_ids: Dict[str, str] = {}
+
+    def constant(self, source: str) -> str:
+        """Module-level name for the constant expression `source`, shared between uses"""
+        name = self._constant_ids.get(source)
+        if name is None:
+            name = f"_c{len(self._constant_ids)}"
+            self._constant_ids[source] = name
+            self.constants.append(f"{name} = {source}")
+        return name
+
+    def helper(self, schema: Any) -> str:
+        """Name of a function checking `schema`, emitting one for non-trivial schemas"""
+        if isinstance(schema, dict) and set(schema) - _ANNOTATIONS == {"$ref"}:
+            return self.ref_function(schema["$ref"])
+        name = f"_h{len(self.helpers)}"
+        self.helpers.append("")  # reserve the slot so nested helpers get later numbers
+        body = self.expression(schema, "x")
+        self.helpers[int(name[2:])] = f"def {name}(x):\n    return {body}\n"
+        return name
+
+    def ref_function(self, ref: str) -> str:
+        if not ref.startswith(COMPONENT_REF_PREFIX):
+            raise UnsupportedSchema(f"$ref {ref}")
+        target = ref[len(COMPONENT_REF_PREFIX):].replace("~1", "/").replace("~0", "~")
+        if target not in self.function_names:
+            raise UnsupportedSchema(f"$ref {ref}")
+        return self.function_names[target]
+
+    def expression(self, schema: Any, v: str) -> str:
+        """Python expression that is true when the value `v` is valid against `schema`"""
+        if schema is True:
+            return "True"
+        if schema is False:
+            return "False"
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"schema of type {type(schema).__name__}")
+        unsupported = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if unsupported:
+            raise UnsupportedSchema(", ".join(sorted(unsupported)))
+        if schema.get("$schema", DRAFT202012_URI) != DRAFT202012_URI:
+            raise UnsupportedSchema(f"$schema {schema['$schema']}")
+
+        checks: List[str] = []
+        if "$ref" in schema:
+            checks.append(f"{self.ref_function(schema['$ref'])}({v})")
+        typ = schema.get("type")
+        if typ is not None:
+            checks.append(self._type_check(typ, v))
+        if "enum" in schema:
+            checks.append(self._enum_check(schema["enum"], v))
+        if "const" in schema:
+            checks.append(f"_equal({v}, {self.constant(repr(schema['const']))})")
+        checks.extend(self._number_checks(schema, typ, v))
+        checks.extend(self._string_checks(schema, typ, v))
+        checks.extend(self._array_checks(schema, typ, v))
+        checks.extend(self._object_checks(schema, typ, v))
+        for sub in schema.get("allOf", ()):
+            checks.append(self.expression(sub, v))
+        if "anyOf" in schema:
+            parts = [self.expression(sub, v) for sub in schema["anyOf"]]
+            checks.append("(" + " or ".join(parts) + ")" if parts else "False")
+        if "oneOf" in schema:
+            parts = [f"bool({self.expression(sub, v)})" for sub in schema["oneOf"]]
+            checks.append("(" + " + ".join(parts) + " == 1)" if parts else "False")
+        if "not" in schema:
+            checks.append(f"not {self.expression(schema['not'], v)}")
+        if not checks:
+            return "True"
+        return checks[0] if len(checks) == 1 else "(" + " and ".join(checks) + ")"
+
+    def _type_check(self, typ: Any, v: str) -> str:
+        types = typ if isinstance(typ, list) else [typ]
+        if any(t not in _TYPE_CHECKS for t in types):
+            raise UnsupportedSchema(f"type {typ}")
+        checks = [_TYPE_CHECKS[t].format(v=v) for t in types]
+        return checks[0] if len(checks) == 1 else "(" + " or ".join(checks) + ")"
+
+    def _enum_check(self, values: List[Any], v: str) -> str:
+        if values and all(isinstance(value, str) for value in values):
+            return f"(isinstance({v}, str) and {v} in {self.constant(repr(frozenset(values)))})"
+        if values == [None]:
+            return f"{v} is None"
+        return f"_in_enum({v}, {self.constant(repr(values))})"
+
+    def _guard(self, typ: Any, kind: str, v: str, checks: List[str]) -> List[str]:
+        """Apply `checks` only to values of JSON type `kind`, unless `type` already ensures it"""
+        if not checks:
+            return []
+        body = checks[0] if len(checks) == 1 else " and ".join(checks)
+        if typ == kind or (kind == "number" and typ == "integer"):
+            return [body if len(checks) == 1 else f"({body})"]
+        return [f"(not {_TYPE_CHECKS[kind].format(v=v)} or {body})"]
+
+    def _number_checks(self, schema: Dict[str, Any], typ: Any, v: str) -> List[str]:
+        checks = []
+        for keyword, operator in (("minimum", ">="), ("maximum", "<="), ("exclusiveMinimum", ">"), ("exclusiveMaximum", "<")):
+            if keyword in schema:
+                checks.append(f"{v} {operator} {schema[keyword]!r}")
+        return self._guard(typ, "number", v, checks)
+
+    def _string_checks(self, schema: Dict[str, Any], typ: Any, v: str) -> List[str]:
+        checks = []
+        if "minLength" in schema:
+            checks.append(f"len({v}) >= {int(schema['minLength'])}")
+        if "maxLength" in schema:
+            checks.append(f"len({v}) <= {int(schema['maxLength'])}")
+        if "pattern" in schema:
+            regex = self.constant(f"re.compile({schema['pattern']!r})")
+            checks.append(f"{regex}.search({v}) is not None")
+        return self._guard(typ, "string", v, checks)
+
+    def _array_checks(self, schema: Dict[str, Any], typ: Any, v: str) -> List[str]:
+        checks = []
+        if "minItems" in schema:
+            checks.append(f"len({v}) >= {int(schema['minItems'])}")
+        if "maxItems" in schema:
+            checks.append(f"len({v}) <= {int(schema['maxItems'])}")
+        if "items" in schema and schema["items"] is not True:
+            if schema["items"] is False:
+                checks.append(f"not {v}")
+            else:
+                checks.append(f"all(map({self.helper(schema['items'])}, {v}))")
+        return self._guard(typ, "array", v, checks)
+
+    def _object_checks(self, schema: Dict[str, Any], typ: Any, v: str) -> List[str]:
+        checks = []
+        required = schema.get("required", ())
+        for key in required:
+            checks.append(f"{key!r} in {v}")
+        if "minProperties" in schema:
+            checks.append(f"len({v}) >= {int(schema['minProperties'])}")
+        if "maxProperties" in schema:
+            checks.append(f"len({v}) <= {int(schema['maxProperties'])}")
+        properties = schema.get("properties", {})
+        for key, sub in properties.items():
+            sub_check = self.expression(sub, f"{v}[{key!r}]")
+            if sub_check == "True":
+                continue
+            # Required keys are known to be present by the checks above
+            checks.append(sub_check if key in required else f"({key!r} not in {v} or {sub_check})")
+        patterns = schema.get("patternProperties", {})
+        for pattern, sub in patterns.items():
+            regex = self.constant(f"re.compile({pattern!r})")
+            checks.append(f"all({self.helper(sub)}(value) for key, value in {v}.items() if {regex}.search(key))")
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            names = self.constant(repr(frozenset(properties)))
+            if patterns:
+                # jsonschema matches extra keys against all patterns joined into one regex
+                regex = self.constant(f"re.compile({'|'.join(patterns)!r})")
+                extras = f"(key for key in {v} if key not in {names} and not {regex}.search(key))"
+            else:
+                extras = None
+            if additional is False:
+                checks.append(f"not any({extras})" if extras else f"{v}.keys() <= {names}")
+            else:
+                function = self.helper(additional)
+                if extras:
+                    checks.append(f"all({function}({v}[key]) for key in {extras})")
+                else:
+                    checks.append(f"all({function}(value) for key, value in {v}.items() if key not in {names})")
+        return self._guard(typ, "object", v, checks)
+
+    def component(self, name: str) -> str:
+        function = self.function_names[name]
+        try:
+            body = self.expression(self.schemas[name], "x")
+        except UnsupportedSchema as e:
+            return f"def {function}(x):\n    # {name}: not compiled ({e})\n    return _fallbacks[{name!r}].is_valid(x)\n"
+        return f"def {function}(x):\n    # {name}\n    return {body}\n"
+
+    def source(self) -> str:
+        components = [self.component(name) for name in self.schemas]
+        table = ",\n".join(f"    {name!r}: {function}" for name, function in self.function_names.items())
+        fallbacks = [name for name, code in zip(self.schemas, components) if "not compiled" in code]
+        return "\n\n".join([
+            _PRELUDE.rstrip("\n"),
+            "\n".join(self.constants),
+            *(helper.rstrip("\n") for helper in self.helpers),
+            *(component.rstrip("\n") for component in components),
+            f"VALIDATORS = {{\n{table},\n}}\nFALLBACK_SCHEMAS = {fallbacks!r}",
+        ]) + "\n"
+
+
+def compile_validators(schemas: Dict[str, Any]) -> str:
+    """Python source of a module with one validator function per component schema"""
+    return _ModuleBuilder(schemas).source()
+
+
+def validators_hash(schemas: Dict[str, Any]) -> str:
+    digest = hashlib.sha256(str(COMPILER_VERSION).encode())
+    with open(os.path.abspath(__file__), "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps(schemas, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+class CompiledValidators:
+    """Compiled validator functions by component schema name"""
+
+    __slots__ = ("functions", "fallbacks")
+
+    def __init__(self, module: Any):
+        self.functions: Dict[str, Callable[[Any], bool]] = module.VALIDATORS
+        self.fallbacks: List[str] = module.FALLBACK_SCHEMAS
+
+    def __contains__(self, schema_name: str) -> bool:
+        return schema_name in self.functions
+
+    def is_valid(self, schema_name: str, instance: Any) -> bool:
+        return bool(self.functions[schema_name](instance))
+
+
+def load_compiled_validators(
+    schemas: Dict[str, Any],
+    fallback: Callable[[str], Any],
+    cache_dir: Optional[str] = CACHE_DIR,
+) -> CompiledValidators:
+    """Compiled validators for `schemas` (already converted to JSON Schema).
+
+    `fallback(name)` returns a `jsonschema` validator for components the
+    compiler can't translate. With `cache_dir` the generated module is read
+    from or written to disk there; otherwise it is compiled in memory.
+    """
+    content_hash = validators_hash(schemas)
+    module_name = f"_compiled_validators_{content_hash}"
+    if cache_dir is None:
+        spec = importlib.util.spec_from_loader(module_name, loader=None)
+        module = importlib.util.module_from_spec(spec)
+        exec(compile(compile_validators(schemas), module_name, "exec"), module.__dict__)
+    else:
+        path = os.path.join(cache_dir, f"{_MODULE_PREFIX}{content_hash}.py")
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(compile_validators(schemas))
+            os.replace(tmp_path, path)
+            _evict_stale_modules(cache_dir, keep=os.path.basename(path))
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    for name in module.FALLBACK_SCHEMAS:
+        module._fallbacks[name] = fallback(name)
+    return CompiledValidators(module)
+
+
+def _evict_stale_modules(cache_dir: str, keep: str) -> None:
+    for filename in os.listdir(cache_dir):
+        if filename.startswith(_MODULE_PREFIX) and filename.endswith(".py") and filename != keep:
+            os.remove(os.path.join(cache_dir, filename))
+
+
+# --- Differential check against jsonschema ---
+
+def mutate(value: Any, rng: random.Random) -> Any:
+    """Copy of `value` with one random change somewhere inside it, likely (not certainly) invalid"""
+    if isinstance(value, dict) and value and rng.random() < 0.7:
+        key = rng.choice(sorted(value))
+        mutated = dict(value)
+        roll = rng.random()
+        if roll < 0.15:
+            del mutated[key]
+        elif roll < 0.25:
+            mutated["unexpected_field"] = mutated[key]
+        else:
+            mutated[key] = mutate(value[key], rng)
+        return mutated
+    if isinstance(value, list) and value and rng.random() < 0.7:
+        index = rng.randrange(len(value))
+        mutated = list(value)
+        roll = rng.random()
+        if roll < 0.15:
+            del mutated[index]
+        elif roll < 0.25:
+            mutated.extend(mutated)
+        else:
+            mutated[index] = mutate(value[index], rng)
+        return mutated
+    return rng.choice([
+        None, True, False, 0, -1, 1.5, 2.0, 10 ** 20, "", "unexpected", [], {}, [value], {"value": value},
+        str(value), value if not isinstance(value, bool) else not value,
+    ])
+
+
+def differential_check(samples_per_schema: int = 20, seed: int = 0) -> int:
+    """Compare compiled validators with jsonschema on generated and mutated samples.
+
+    Returns the number of disagreements (0 means the compiler is exact on the corpus).
+    """
+    import generate_mock
+
+    generate_mock.ensure_loaded()
+    compiled = generate_mock.compiled_validators()
+    rng = random.Random(seed)
+
+    corpus: List[Tuple[str, Any]] = []
+    for name, node in generate_mock._ir.schemas.items():
+        for _ in range(max(1, samples_per_schema // 4)):
+            sample = generate_mock.generate_sample(node, rng=rng)
+            corpus.append((name, sample))
+            for _ in range(3):
+                corpus.append((name, mutate(sample, rng)))
+
+    start = time.perf_counter()
+    compiled_results = [compiled.is_valid(name, instance) for name, instance in corpus]
+    compiled_time = time.perf_counter() - start
+    start = time.perf_counter()
+    reference_results = [generate_mock.validator_for_schema(name).is_valid(instance) for name, instance in corpus]
+    reference_time = time.perf_counter() - start
+
+    disagreements = 0
+    for (name, instance), got, expected in zip(corpus, compiled_results, reference_results):
+        if got != expected:
+            disagreements += 1
+            if disagreements <= 10:
+                print(f"❌ {name}: compiled={got} jsonschema={expected} for {json.dumps(instance)[:200]}")
+    valid = sum(reference_results)
+    print(f"Checked {len(corpus)} instances ({valid} valid, {len(corpus) - valid} invalid) "
+          f"across {len(generate_mock._ir.schemas)} schemas")
+    if compiled.fallbacks:
+        print(f"Components validated by jsonschema: {', '.join(compiled.fallbacks)}")
+    print(f"jsonschema: {reference_time * 1000:.1f} ms, compiled: {compiled_time * 1000:.1f} ms "
+          f"({reference_time / max(compiled_time, 1e-9):.0f}x)")
+    if disagreements:
+        print(f"❌ {disagreements} disagreements with jsonschema")
+    else:
+        print("✅ Compiled validators agree with jsonschema on every instance")
+    return disagreements
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python3 -m validator_compiler", description=__doc__.split("\n\n")[0])
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="command")
+    check = subparsers.add_parser("check", help="compare compiled validators with jsonschema on a generated corpus")
+    check.add_argument("--samples", type=int, default=20, help="instances per schema (default: 20)")
+    check.add_argument("--seed", type=int, default=0, help="random seed for the corpus (default: 0)")
+    args = parser.parse_args(argv)
+    return 1 if differential_check(args.samples, args.seed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
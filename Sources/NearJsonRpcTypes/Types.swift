@@ -79,7 +79,7 @@ struct AnyCodingKey: CodingKey {
 
 // MARK: - Decoding Diagnostics Helpers
 
-private func describeCodingKey(_ key: CodingKey) -> String {
+func describeCodingKey(_ key: CodingKey) -> String {
     if let intValue = key.intValue {
         return "[\(intValue)]"
     }
@@ -87,7 +87,7 @@ private func describeCodingKey(_ key: CodingKey) -> String {
     return stringValue.isEmpty ? "\"\"" : stringValue
 }
 
-private func describeCodingPath(_ codingPath: [CodingKey]) -> String {
+func describeCodingPath(_ codingPath: [CodingKey]) -> String {
     guard !codingPath.isEmpty else { return "<root>" }
     var description = ""
     for key in codingPath {
@@ -103,7 +103,7 @@ private func describeCodingPath(_ codingPath: [CodingKey]) -> String {
     return description
 }
 
-private func describeDecodingError(_ error: Error) -> String {
+func describeDecodingError(_ error: Error) -> String {
     if let decodingError = error as? DecodingError {
         switch decodingError {
         case let .typeMismatch(_, context):
@@ -9406,11 +9406,11 @@ public struct RpcChunkErrorOneOfInfoName1: Codable, Sendable {
 }
 
 public struct RpcChunkErrorOneOfInfoName2: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcChunkErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcChunkErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -9419,11 +9419,11 @@ public struct RpcChunkErrorOneOfInfoName2: Codable, Sendable {
 }
 
 public struct RpcChunkErrorOneOfInfoName3: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcChunkErrorOneOfInfoName3InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcChunkErrorOneOfInfoName3InlineObject,
         name: String,
     ) {
         self.info = info
@@ -9892,11 +9892,11 @@ public struct RpcLightClientNextBlockErrorOneOfInfoName1: Codable, Sendable {
 }
 
 public struct RpcLightClientNextBlockErrorOneOfInfoName2: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientNextBlockErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientNextBlockErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -9982,11 +9982,11 @@ public struct RpcLightClientProofErrorOneOfInfoName: Codable, Sendable {
 }
 
 public struct RpcLightClientProofErrorOneOfInfoName1: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientProofErrorOneOfInfoName1InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientProofErrorOneOfInfoName1InlineObject,
         name: String,
     ) {
         self.info = info
@@ -9995,11 +9995,11 @@ public struct RpcLightClientProofErrorOneOfInfoName1: Codable, Sendable {
 }
 
 public struct RpcLightClientProofErrorOneOfInfoName2: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientProofErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientProofErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10008,11 +10008,11 @@ public struct RpcLightClientProofErrorOneOfInfoName2: Codable, Sendable {
 }
 
 public struct RpcLightClientProofErrorOneOfInfoName3: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientProofErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientProofErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10021,11 +10021,11 @@ public struct RpcLightClientProofErrorOneOfInfoName3: Codable, Sendable {
 }
 
 public struct RpcLightClientProofErrorOneOfInfoName4: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientProofErrorOneOfInfoName4InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientProofErrorOneOfInfoName4InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10417,11 +10417,11 @@ public enum RpcProtocolConfigRequest: Codable, Sendable {
 // MARK: - RpcQueryError
 
 public struct RpcQueryErrorOneOfInfoName: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoNameInlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoNameInlineObject,
         name: String,
     ) {
         self.info = info
@@ -10430,11 +10430,11 @@ public struct RpcQueryErrorOneOfInfoName: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName1: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName1InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName1InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10443,11 +10443,11 @@ public struct RpcQueryErrorOneOfInfoName1: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName2: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10456,11 +10456,11 @@ public struct RpcQueryErrorOneOfInfoName2: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName3: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName3InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName3InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10469,11 +10469,11 @@ public struct RpcQueryErrorOneOfInfoName3: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName4: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName3InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName3InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10482,11 +10482,11 @@ public struct RpcQueryErrorOneOfInfoName4: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName5: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName5InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName5InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10495,11 +10495,11 @@ public struct RpcQueryErrorOneOfInfoName5: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName6: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName5InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName5InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10508,11 +10508,11 @@ public struct RpcQueryErrorOneOfInfoName6: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName7: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName7InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName7InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10521,11 +10521,11 @@ public struct RpcQueryErrorOneOfInfoName7: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName8: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName7InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName7InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10534,11 +10534,11 @@ public struct RpcQueryErrorOneOfInfoName8: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName9: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName9InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName9InlineObject,
         name: String,
     ) {
         self.info = info
@@ -10547,11 +10547,11 @@ public struct RpcQueryErrorOneOfInfoName9: Codable, Sendable {
 }
 
 public struct RpcQueryErrorOneOfInfoName10: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcQueryErrorOneOfInfoName10InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcQueryErrorOneOfInfoName10InlineObject,
         name: String,
     ) {
         self.info = info
@@ -11781,11 +11781,11 @@ public struct RpcReceiptErrorOneOfInfoName: Codable, Sendable {
 }
 
 public struct RpcReceiptErrorOneOfInfoName1: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcReceiptErrorOneOfInfoName1InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcReceiptErrorOneOfInfoName1InlineObject,
         name: String,
     ) {
         self.info = info
@@ -12786,11 +12786,11 @@ public struct RpcStatusErrorOneOfInfoName: Codable, Sendable {
 }
 
 public struct RpcStatusErrorOneOfInfoName1: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcLightClientNextBlockErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcLightClientNextBlockErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -12908,11 +12908,11 @@ public struct RpcTransactionErrorOneOfInfoName: Codable, Sendable {
 }
 
 public struct RpcTransactionErrorOneOfInfoName1: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcTransactionErrorOneOfInfoName1InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcTransactionErrorOneOfInfoName1InlineObject,
         name: String,
     ) {
         self.info = info
@@ -12921,11 +12921,11 @@ public struct RpcTransactionErrorOneOfInfoName1: Codable, Sendable {
 }
 
 public struct RpcTransactionErrorOneOfInfoName2: Codable, Sendable {
-    public let info: InlineObject
+    public let info: RpcTransactionErrorOneOfInfoName2InlineObject
     public let name: String
 
     public init(
-        info: InlineObject,
+        info: RpcTransactionErrorOneOfInfoName2InlineObject,
         name: String,
     ) {
         self.info = info
@@ -13809,11 +13809,11 @@ public enum StateChangeKindView: Codable, Sendable {
 // MARK: - StateChangeWithCauseView
 
 public struct StateChangeWithCauseViewOneOfChangeType: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeTypeInlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeTypeInlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13822,11 +13822,11 @@ public struct StateChangeWithCauseViewOneOfChangeType: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType1: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType1InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType1InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13835,11 +13835,11 @@ public struct StateChangeWithCauseViewOneOfChangeType1: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType2: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType2InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType2InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13848,11 +13848,11 @@ public struct StateChangeWithCauseViewOneOfChangeType2: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType3: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType3InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType3InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13861,11 +13861,11 @@ public struct StateChangeWithCauseViewOneOfChangeType3: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType4: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType4InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType4InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13874,11 +13874,11 @@ public struct StateChangeWithCauseViewOneOfChangeType4: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType5: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType5InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType5InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13887,11 +13887,11 @@ public struct StateChangeWithCauseViewOneOfChangeType5: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType6: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType3InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType3InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13900,11 +13900,11 @@ public struct StateChangeWithCauseViewOneOfChangeType6: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType7: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType7InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType7InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13913,11 +13913,11 @@ public struct StateChangeWithCauseViewOneOfChangeType7: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType8: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType8InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType8InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13926,11 +13926,11 @@ public struct StateChangeWithCauseViewOneOfChangeType8: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType9: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType9InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType9InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -13939,11 +13939,11 @@ public struct StateChangeWithCauseViewOneOfChangeType9: Codable, Sendable {
 }
 
 public struct StateChangeWithCauseViewOneOfChangeType10: Codable, Sendable {
-    public let change: InlineObject
+    public let change: StateChangeWithCauseViewOneOfChangeType1InlineObject
     public let type: Type
 
     public init(
-        change: InlineObject,
+        change: StateChangeWithCauseViewOneOfChangeType1InlineObject,
         type: Type,
     ) {
         self.change = change
@@ -18956,16 +18956,368 @@ public struct WitnessConfigView: Codable, Sendable {
 
 // MARK: - Generated Inline Types
 
-public struct InlineObject: Codable, Sendable {
+public struct RpcLightClientNextBlockErrorOneOfInfoName2InlineObject: Codable, Sendable {
+    public let epochId: EpochId
+
+    public init(
+        epochId: EpochId,
+    ) {
+        self.epochId = epochId
+    }
+}
+
+public struct RpcReceiptErrorOneOfInfoName1InlineObject: Codable, Sendable {
+    public let receiptId: CryptoHash
+
+    public init(
+        receiptId: CryptoHash,
+    ) {
+        self.receiptId = receiptId
+    }
+}
+
+public struct RpcTransactionErrorOneOfInfoName1InlineObject: Codable, Sendable {
+    public let transactionHash: CryptoHash
+
+    public init(
+        transactionHash: CryptoHash,
+    ) {
+        self.transactionHash = transactionHash
+    }
+}
+
+public struct RpcTransactionErrorOneOfInfoName2InlineObject: Codable, Sendable {
+    public let requestedTransactionHash: CryptoHash
+
+    public init(
+        requestedTransactionHash: CryptoHash,
+    ) {
+        self.requestedTransactionHash = requestedTransactionHash
+    }
+}
+
+public struct RpcChunkErrorOneOfInfoName2InlineObject: Codable, Sendable {
+    public let shardId: ShardId
+
+    public init(
+        shardId: ShardId,
+    ) {
+        self.shardId = shardId
+    }
+}
+
+public struct RpcChunkErrorOneOfInfoName3InlineObject: Codable, Sendable {
+    public let chunkHash: ChunkHash
+
+    public init(
+        chunkHash: ChunkHash,
+    ) {
+        self.chunkHash = chunkHash
+    }
+}
+
+public struct RpcLightClientProofErrorOneOfInfoName1InlineObject: Codable, Sendable {
+    public let executionOutcomeShardId: ShardId
+    public let numberOrShards: Int
+
+    public init(
+        executionOutcomeShardId: ShardId,
+        numberOrShards: Int,
+    ) {
+        self.executionOutcomeShardId = executionOutcomeShardId
+        self.numberOrShards = numberOrShards
+    }
+}
+
+public struct RpcLightClientProofErrorOneOfInfoName2InlineObject: Codable, Sendable {
+    public let transactionOrReceiptId: CryptoHash
+
+    public init(
+        transactionOrReceiptId: CryptoHash,
+    ) {
+        self.transactionOrReceiptId = transactionOrReceiptId
+    }
+}
+
+public struct RpcLightClientProofErrorOneOfInfoName4InlineObject: Codable, Sendable {
+    public let shardId: ShardId
+    public let transactionOrReceiptId: CryptoHash
+
+    public init(
+        shardId: ShardId,
+        transactionOrReceiptId: CryptoHash,
+    ) {
+        self.shardId = shardId
+        self.transactionOrReceiptId = transactionOrReceiptId
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeTypeInlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let amount: NearToken
+    public let codeHash: CryptoHash
+    public let globalContractAccountId: AccountId?
+    public let globalContractHash: CryptoHash?
+    public let locked: NearToken
+    public let storagePaidAt: UInt64?
+    public let storageUsage: UInt64
+
+    public init(
+        accountId: AccountId,
+        amount: NearToken,
+        codeHash: CryptoHash,
+        globalContractAccountId: AccountId?,
+        globalContractHash: CryptoHash?,
+        locked: NearToken,
+        storagePaidAt: UInt64?,
+        storageUsage: UInt64,
+    ) {
+        self.accountId = accountId
+        self.amount = amount
+        self.codeHash = codeHash
+        self.globalContractAccountId = globalContractAccountId
+        self.globalContractHash = globalContractHash
+        self.locked = locked
+        self.storagePaidAt = storagePaidAt
+        self.storageUsage = storageUsage
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType1InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+
+    public init(
+        accountId: AccountId,
+    ) {
+        self.accountId = accountId
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType2InlineObject: Codable, Sendable {
+    public let accessKey: AccessKeyView
+    public let accountId: AccountId
+    public let publicKey: PublicKey
+
+    public init(
+        accessKey: AccessKeyView,
+        accountId: AccountId,
+        publicKey: PublicKey,
+    ) {
+        self.accessKey = accessKey
+        self.accountId = accountId
+        self.publicKey = publicKey
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType3InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let publicKey: PublicKey
+
+    public init(
+        accountId: AccountId,
+        publicKey: PublicKey,
+    ) {
+        self.accountId = accountId
+        self.publicKey = publicKey
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType4InlineObject: Codable, Sendable {
     public let accountId: AccountId
+    public let gasKey: GasKey
+    public let publicKey: PublicKey
 
     public init(
         accountId: AccountId,
+        gasKey: GasKey,
+        publicKey: PublicKey,
     ) {
         self.accountId = accountId
+        self.gasKey = gasKey
+        self.publicKey = publicKey
     }
 }
 
+public struct StateChangeWithCauseViewOneOfChangeType5InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let index: Int
+    public let nonce: UInt64
+    public let publicKey: PublicKey
+
+    public init(
+        accountId: AccountId,
+        index: Int,
+        nonce: UInt64,
+        publicKey: PublicKey,
+    ) {
+        self.accountId = accountId
+        self.index = index
+        self.nonce = nonce
+        self.publicKey = publicKey
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType7InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let keyBase64: StoreKey
+    public let valueBase64: StoreValue
+
+    public init(
+        accountId: AccountId,
+        keyBase64: StoreKey,
+        valueBase64: StoreValue,
+    ) {
+        self.accountId = accountId
+        self.keyBase64 = keyBase64
+        self.valueBase64 = valueBase64
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType8InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let keyBase64: StoreKey
+
+    public init(
+        accountId: AccountId,
+        keyBase64: StoreKey,
+    ) {
+        self.accountId = accountId
+        self.keyBase64 = keyBase64
+    }
+}
+
+public struct StateChangeWithCauseViewOneOfChangeType9InlineObject: Codable, Sendable {
+    public let accountId: AccountId
+    public let codeBase64: String
+
+    public init(
+        accountId: AccountId,
+        codeBase64: String,
+    ) {
+        self.accountId = accountId
+        self.codeBase64 = codeBase64
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoNameInlineObject: Codable, Sendable {
+    public let requestedShardId: ShardId
+
+    public init(
+        requestedShardId: ShardId,
+    ) {
+        self.requestedShardId = requestedShardId
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName1InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName2InlineObject: Codable, Sendable {
+    public let blockReference: BlockReference
+
+    public init(
+        blockReference: BlockReference,
+    ) {
+        self.blockReference = blockReference
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName3InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+    public let requestedAccountId: AccountId
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+        requestedAccountId: AccountId,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+        self.requestedAccountId = requestedAccountId
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName5InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+    public let contractAccountId: AccountId
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+        contractAccountId: AccountId,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+        self.contractAccountId = contractAccountId
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName7InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+    public let publicKey: PublicKey
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+        publicKey: PublicKey,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+        self.publicKey = publicKey
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName9InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+    public let vmError: String
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+        vmError: String,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+        self.vmError = vmError
+    }
+}
+
+public struct RpcQueryErrorOneOfInfoName10InlineObject: Codable, Sendable {
+    public let blockHash: CryptoHash
+    public let blockHeight: UInt64
+    public let identifier: GlobalContractIdentifier
+
+    public init(
+        blockHash: CryptoHash,
+        blockHeight: UInt64,
+        identifier: GlobalContractIdentifier,
+    ) {
+        self.blockHash = blockHash
+        self.blockHeight = blockHeight
+        self.identifier = identifier
+    }
+}
+
+// MARK: - Deprecated Names
+
+/// Inline objects are named after the type that contains them
+@available(*, deprecated, renamed: "StateChangeWithCauseViewOneOfChangeType1InlineObject")
+public typealias InlineObject = StateChangeWithCauseViewOneOfChangeType1InlineObject
+
 // MARK: - RPC Errors
 
 /// Enum wrapping all possible RPC error types
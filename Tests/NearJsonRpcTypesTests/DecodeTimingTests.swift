@@ -0,0 +1,176 @@
+import Foundation
+@testable import NearJsonRpcTypes
+import Testing
+
+/// Median decode times of the RPC result types over their mocks.
+///
+/// Only runs when NEAR_TIMING_OUTPUT names the JSON file to write the timings to
+/// (NEAR_TIMING_ITERATIONS sets the iterations, default 200). Compare them with
+/// DecodeTimingBaseline.json using Scripts/perf_gate.py.
+@Suite("Decode Timing", .enabled(if: ProcessInfo.processInfo.environment["NEAR_TIMING_OUTPUT"] != nil))
+struct DecodeTimingTests {
+    /// Timings written to NEAR_TIMING_OUTPUT, in nanoseconds per decode of a type's mocks
+    struct Timings: Codable {
+        let iterations: Int
+        let medians: [String: UInt64]
+    }
+
+    let decoder: JSONDecoder
+
+    init() {
+        decoder = JSONDecoder()
+        decoder.keyDecodingStrategy = .convertFromSnakeCase
+    }
+
+    /// Load mock JSON data from file
+    func loadMockJSON(_ filename: String) throws -> Data {
+        let testBundle = Bundle.module
+        guard let url = testBundle.url(
+            forResource: filename.replacingOccurrences(of: ".json", with: ""),
+            withExtension: "json",
+            subdirectory: "Mock",
+        ) else {
+            throw NSError(
+                domain: "TestError",
+                code: 1,
+                userInfo: [NSLocalizedDescriptionKey: "Mock file not found: \(filename)"],
+            )
+        }
+        return try Data(contentsOf: url)
+    }
+
+    /// Median time in nanoseconds to decode all of `fixtures` as `T`
+    func medianDecodeTime<T: Decodable>(_: T.Type, _ fixtures: [String], iterations: Int) throws -> UInt64 {
+        let data = try fixtures.map { try loadMockJSON($0) }
+        for fixture in data {
+            _ = try decoder.decode(T.self, from: fixture)
+        }
+        var times: [UInt64] = []
+        times.reserveCapacity(iterations)
+        for _ in 0 ..< iterations {
+            let start = DispatchTime.now().uptimeNanoseconds
+            for fixture in data {
+                _ = try decoder.decode(T.self, from: fixture)
+            }
+            times.append(DispatchTime.now().uptimeNanoseconds - start)
+        }
+        times.sort()
+        return times[times.count / 2]
+    }
+
+    @Test("Record decode timings of the RPC result types")
+    func recordDecodeTimings() throws {
+        let environment = ProcessInfo.processInfo.environment
+        let path = try #require(environment["NEAR_TIMING_OUTPUT"])
+        let iterations = max(Int(environment["NEAR_TIMING_ITERATIONS"] ?? "") ?? 200, 1)
+        var medians: [String: UInt64] = [:]
+        medians["GenesisConfig"] = try medianDecodeTime(
+            GenesisConfig.self,
+            ["GenesisConfig.json"],
+            iterations: iterations,
+        )
+        medians["RpcBlockResponse"] = try medianDecodeTime(
+            RpcBlockResponse.self,
+            ["RpcBlockResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcChunkResponse"] = try medianDecodeTime(
+            RpcChunkResponse.self,
+            ["RpcChunkResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcClientConfigResponse"] = try medianDecodeTime(
+            RpcClientConfigResponse.self,
+            ["RpcClientConfigResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcCongestionLevelResponse"] = try medianDecodeTime(
+            RpcCongestionLevelResponse.self,
+            ["RpcCongestionLevelResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcGasPriceResponse"] = try medianDecodeTime(
+            RpcGasPriceResponse.self,
+            ["RpcGasPriceResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcLightClientBlockProofResponse"] = try medianDecodeTime(
+            RpcLightClientBlockProofResponse.self,
+            ["RpcLightClientBlockProofResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcLightClientExecutionProofResponse"] = try medianDecodeTime(
+            RpcLightClientExecutionProofResponse.self,
+            ["RpcLightClientExecutionProofResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcLightClientNextBlockResponse"] = try medianDecodeTime(
+            RpcLightClientNextBlockResponse.self,
+            ["RpcLightClientNextBlockResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcNetworkInfoResponse"] = try medianDecodeTime(
+            RpcNetworkInfoResponse.self,
+            ["RpcNetworkInfoResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcProtocolConfigResponse"] = try medianDecodeTime(
+            RpcProtocolConfigResponse.self,
+            ["RpcProtocolConfigResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcQueryResponse"] = try medianDecodeTime(
+            RpcQueryResponse.self,
+            [
+                "RpcQueryResponse_Variant0.json",
+                "RpcQueryResponse_Variant1.json",
+                "RpcQueryResponse_Variant2.json",
+                "RpcQueryResponse_Variant3.json",
+                "RpcQueryResponse_Variant4.json",
+                "RpcQueryResponse_Variant5.json",
+                "RpcQueryResponse_Variant6.json",
+                "RpcQueryResponse_Variant7.json",
+            ],
+            iterations: iterations,
+        )
+        medians["RpcReceiptResponse"] = try medianDecodeTime(
+            RpcReceiptResponse.self,
+            ["RpcReceiptResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcSplitStorageInfoResponse"] = try medianDecodeTime(
+            RpcSplitStorageInfoResponse.self,
+            ["RpcSplitStorageInfoResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcStateChangesInBlockByTypeResponse"] = try medianDecodeTime(
+            RpcStateChangesInBlockByTypeResponse.self,
+            ["RpcStateChangesInBlockByTypeResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcStateChangesInBlockResponse"] = try medianDecodeTime(
+            RpcStateChangesInBlockResponse.self,
+            ["RpcStateChangesInBlockResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcStatusResponse"] = try medianDecodeTime(
+            RpcStatusResponse.self,
+            ["RpcStatusResponse.json"],
+            iterations: iterations,
+        )
+        medians["RpcTransactionResponse"] = try medianDecodeTime(
+            RpcTransactionResponse.self,
+            ["RpcTransactionResponse_Variant0.json", "RpcTransactionResponse_Variant1.json"],
+            iterations: iterations,
+        )
+        medians["RpcValidatorResponse"] = try medianDecodeTime(
+            RpcValidatorResponse.self,
+            ["RpcValidatorResponse.json"],
+            iterations: iterations,
+        )
+
+        let encoder = JSONEncoder()
+        encoder.outputFormatting = [.prettyPrinted, .sortedKeys]
+        try encoder.encode(Timings(iterations: iterations, medians: medians)).write(to: URL(fileURLWithPath: path))
+    }
+}